@@ -0,0 +1,80 @@
+"""Benchmark error diagnosis on large synthetic build logs.
+
+Usage:
+    uv run python benchmarks/bench_error_matcher.py [--mb 20] [--repeat 3]
+
+Compares the single-pass PatternMatcher against the previous approach of
+running every ErrorPattern regex over the whole log, on a clean log (the
+worst case for the old loop, which scanned the log once per pattern) and
+on a log with errors near the end. Reports MB/second for each.
+"""
+
+import argparse
+import time
+
+from fastlane_mcp.errors.matcher import error_matcher
+from fastlane_mcp.errors.patterns import ERROR_PATTERNS
+
+
+LOG_TEMPLATE = '''CompileSwift normal arm64 /Users/ci/app/Sources/Feature{n}/View.swift (in target 'App' from project 'App')
+    cd /Users/ci/app
+    /Applications/Xcode.app/Contents/Developer/Toolchains/XcodeDefault.xctoolchain/usr/bin/swift-frontend -c -primary-file Sources/Feature{n}/View.swift -target arm64-apple-ios17.0
+Ld /Users/ci/Library/Developer/Xcode/DerivedData/App/Build/Products/Release-iphoneos/Feature{n}.o normal (in target 'App' from project 'App')
+[12:00:{s:02d}]: ▸ Compiling View{n}.swift
+'''
+
+ERROR_TAIL = '''[12:59:58]: ▸ ❌  error: No signing certificate "iOS Distribution" found
+[12:59:59]: Exit status: 65
+xcodebuild: error: Operation timed out while waiting for the build service
+'''
+
+
+def generate_log(target_mb: float, with_errors: bool) -> str:
+    """Build an xcodebuild-style log of roughly target_mb megabytes."""
+    block = len(LOG_TEMPLATE.format(n=0, s=0).encode())
+    blocks = max(int(target_mb * 1e6) // block, 1)
+    parts = [LOG_TEMPLATE.format(n=n, s=n % 60) for n in range(blocks)]
+    if with_errors:
+        parts.append(ERROR_TAIL)
+    return "".join(parts)
+
+
+def legacy_diagnose(content: str) -> list:
+    """The previous approach: one full regex scan per pattern."""
+    return [pattern.id for pattern in ERROR_PATTERNS if pattern.pattern.search(content)]
+
+
+def single_pass(content: str) -> list:
+    return [pattern.id for pattern in error_matcher.matched_patterns(content)]
+
+
+def best_of(fn, content: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, with_errors in (("clean log", False), ("errors at end", True)):
+        content = generate_log(args.mb, with_errors)
+        size_mb = len(content.encode()) / 1e6
+
+        found = single_pass(content)
+        assert found == legacy_diagnose(content), "matchers disagree"
+
+        print(f"{label}: {size_mb:.1f} MB, {len(found)} patterns matched {found}")
+        for name, fn in (("matcher", single_pass), ("legacy", legacy_diagnose)):
+            seconds = best_of(fn, content, args.repeat)
+            print(f"{name:>10}: {seconds * 1000:9.1f} ms  {size_mb / seconds:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
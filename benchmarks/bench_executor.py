@@ -0,0 +1,248 @@
+"""Benchmark build tool latency and throughput with a fake fastlane binary.
+
+Usage:
+    uv run python benchmarks/bench_executor.py [--calls 40] [--concurrency 4]
+        [--platform ios|android|both] [--lines 5000] [--line-bytes 120]
+        [--rate 0] [--runtime 0] [--exit-code 0] [--json results.json]
+
+Installs a fake `fastlane` (and `xcodebuild`) script on PATH that prints
+--lines lines of fastlane-style output of about --line-bytes bytes each,
+at --rate lines per second (0 = as fast as possible), runs for at least
+--runtime seconds and exits with --exit-code (a failing run ends with a
+signing error, so failures are diagnosed like real ones). It then drives
+--calls build_ios / build_android tool calls through the FastMCP in-memory
+client, --concurrency at a time, each concurrent caller on its own
+project so identical builds are not shared.
+
+Reports tool call latency percentiles (p50/p95/p99), throughput, the
+server's resident memory (this process; the in-memory client runs the
+server in-process) and event loop lag, sampled by a task that measures
+how late a 10 ms sleep wakes up. Build logs, history and caches go to a
+temporary directory. The scheduler's limits are raised to --concurrency
+unless --keep-limits is given, so the executor rather than the queue is
+measured; warm workers stay disabled.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+FAKE_FASTLANE = '''#!{python}
+"""Fake fastlane for benchmarks."""
+import os
+import sys
+import time
+
+if "--version" in sys.argv or "-version" in sys.argv:
+    print("{version}")
+    sys.exit(0)
+
+lines = int(os.environ.get("FAKE_FASTLANE_LINES", "1000"))
+line_bytes = int(os.environ.get("FAKE_FASTLANE_LINE_BYTES", "120"))
+rate = float(os.environ.get("FAKE_FASTLANE_RATE", "0"))
+runtime = float(os.environ.get("FAKE_FASTLANE_RUNTIME", "0"))
+exit_code = int(os.environ.get("FAKE_FASTLANE_EXIT", "0"))
+
+started = time.monotonic()
+batch = 100
+out = sys.stdout
+for n in range(0, lines, batch):
+    chunk = []
+    for i in range(n, min(n + batch, lines)):
+        if i % 500 == 0:
+            chunk.append(f"[12:00:00]: --- Step: action_{{i // 500}} ---")
+        else:
+            text = f"[12:00:00]: \\u25b8 Compiling File{{i}}.swift "
+            chunk.append(text + "x" * max(line_bytes - len(text.encode()) - 1, 0))
+    out.write("\\n".join(chunk) + "\\n")
+    out.flush()
+    if rate:
+        time.sleep(len(chunk) / rate)
+
+if exit_code:
+    sys.stderr.write("error: No signing certificate \\"iOS Distribution\\" found\\n")
+    sys.stderr.write("[12:00:01]: fastlane finished with errors\\n")
+remaining = runtime - (time.monotonic() - started)
+if remaining > 0:
+    time.sleep(remaining)
+sys.exit(exit_code)
+'''
+
+FASTFILE = '''lane :build do
+  gym
+end
+'''
+
+
+def install_fakes(bin_dir: Path) -> None:
+    """Write fake fastlane and xcodebuild scripts into bin_dir."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name, version in (("fastlane", "fastlane 2.220.0"), ("xcodebuild", "Xcode 15.4")):
+        script = bin_dir / name
+        script.write_text(FAKE_FASTLANE.format(python=sys.executable, version=version))
+        script.chmod(0o755)
+
+
+def make_project(root: Path) -> Path:
+    """A project with iOS and Android Fastfiles defining a `build` lane."""
+    for platform in ("ios", "android"):
+        fastlane_dir = root / platform / "fastlane"
+        fastlane_dir.mkdir(parents=True, exist_ok=True)
+        (fastlane_dir / "Fastfile").write_text(FASTFILE)
+    return root
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process, or the peak where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50, p95, p99 and max of samples."""
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98], "max": max(samples)}
+
+
+async def sample_loop_lag(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - start - interval, 0.0))
+
+
+async def sample_rss(interval: float, samples: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        samples.append(rss_bytes())
+        await asyncio.sleep(interval)
+
+
+async def run_benchmark(args: argparse.Namespace, work_dir: Path) -> dict:
+    # Imported late: the server reads its settings from the environment set up in main()
+    from fastmcp import Client
+    from fastlane_mcp.server import mcp
+    from fastlane_mcp.utils.scheduler import scheduler
+
+    if not args.keep_limits:
+        scheduler.configure({"ios": args.concurrency, "android": args.concurrency}, 1)
+
+    projects = [make_project(work_dir / f"project{n}") for n in range(args.concurrency)]
+    platforms = ["ios", "android"] if args.platform == "both" else [args.platform]
+
+    latencies: list[float] = []
+    failures = 0
+    lags: list[float] = []
+    rss: list[int] = []
+    stop = asyncio.Event()
+    pending = iter(range(args.calls))
+
+    async with Client(mcp) as client:
+        async def caller(worker: int) -> None:
+            nonlocal failures
+            platform = platforms[worker % len(platforms)]
+            for _ in pending:
+                start = time.perf_counter()
+                result = await client.call_tool(
+                    f"build_{platform}",
+                    {"project_path": str(projects[worker]), "lane": "build"},
+                    raise_on_error=False,
+                )
+                latencies.append(time.perf_counter() - start)
+                failures += result.is_error
+
+        # One untimed call per platform warms caches (pre-flight, tool lookups)
+        for platform in platforms:
+            await client.call_tool(
+                f"build_{platform}", {"project_path": str(projects[0]), "lane": "build"}, raise_on_error=False
+            )
+
+        baseline_rss = rss_bytes()
+        samplers = [
+            asyncio.create_task(sample_loop_lag(0.01, lags, stop)),
+            asyncio.create_task(sample_rss(0.05, rss, stop)),
+        ]
+        started = time.perf_counter()
+        await asyncio.gather(*(caller(worker) for worker in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(*samplers)
+
+    output_mb = args.calls * args.lines * args.line_bytes / 1e6
+    return {
+        "calls": args.calls,
+        "concurrency": args.concurrency,
+        "failed_calls": failures,
+        "seconds": elapsed,
+        "calls_per_second": args.calls / elapsed,
+        "output_mb_per_second": output_mb / elapsed,
+        "latency_seconds": percentiles(latencies),
+        "loop_lag_seconds": percentiles(lags),
+        "rss_bytes": {"before": baseline_rss, "peak": max(rss, default=baseline_rss), "after": rss_bytes()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--platform", choices=["ios", "android", "both"], default="both")
+    parser.add_argument("--lines", type=int, default=5000, help="Output lines per build")
+    parser.add_argument("--line-bytes", type=int, default=120)
+    parser.add_argument("--rate", type=float, default=0, help="Output lines per second (0: unlimited)")
+    parser.add_argument("--runtime", type=float, default=0, help="Minimum seconds per build")
+    parser.add_argument("--exit-code", type=int, default=0)
+    parser.add_argument("--keep-limits", action="store_true", help="Keep the scheduler's default limits")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="fastlane-mcp-bench-") as tmp:
+        work_dir = Path(tmp)
+        install_fakes(work_dir / "bin")
+        os.environ.update({
+            "PATH": f"{work_dir / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}",
+            "FAKE_FASTLANE_LINES": str(args.lines),
+            "FAKE_FASTLANE_LINE_BYTES": str(args.line_bytes),
+            "FAKE_FASTLANE_RATE": str(args.rate),
+            "FAKE_FASTLANE_RUNTIME": str(args.runtime),
+            "FAKE_FASTLANE_EXIT": str(args.exit_code),
+            "FASTLANE_MCP_LOG_DIR": str(work_dir / "logs"),
+            "FASTLANE_MCP_HISTORY_DB": str(work_dir / "history.sqlite3"),
+            "FASTLANE_MCP_TOOLCHAIN_CACHE": str(work_dir / "toolchain.json"),
+            "FASTLANE_MCP_WARM_WORKERS": "0",
+        })
+        os.environ.pop("FASTLANE_MCP_PATTERN_DIR", None)
+        results = asyncio.run(run_benchmark(args, work_dir))
+
+    latency = results["latency_seconds"]
+    lag = results["loop_lag_seconds"]
+    rss = results["rss_bytes"]
+    print(
+        f"{results['calls']} calls, {results['concurrency']} concurrent, "
+        f"{results['failed_calls']} failed, {results['seconds']:.2f} s"
+    )
+    print(f"throughput: {results['calls_per_second']:.1f} calls/s, {results['output_mb_per_second']:.1f} MB/s of output")
+    print("latency:    " + "  ".join(f"{k} {v * 1000:8.1f} ms" for k, v in latency.items()))
+    print("loop lag:   " + "  ".join(f"{k} {v * 1000:8.1f} ms" for k, v in lag.items()))
+    print(f"server RSS: before {rss['before'] / 1e6:.1f} MB  peak {rss['peak'] / 1e6:.1f} MB  after {rss['after'] / 1e6:.1f} MB")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark parse_lanes_from_fastfile on a large synthetic Fastfile.
+
+Usage:
+    uv run python benchmarks/bench_fastfile_parse.py [--lines 50000] [--repeat 5]
+
+Compares the single-pass tokenizer against the previous line-by-line
+parser (reproduced below) and reports lines/second for each.
+"""
+
+import argparse
+import re
+import time
+
+from corpus import generate_fastfile
+
+from fastlane_mcp.discovery.lanes import parse_lanes_from_fastfile
+
+
+def legacy_parse(content: str) -> list:
+    """The previous parser: three uncompiled re.match calls per line."""
+    lanes = []
+    current_platform = None
+    last_description = None
+    for line in content.split('\n'):
+        trimmed = line.strip()
+        if not trimmed or trimmed.startswith('#'):
+            continue
+        platform_match = re.match(r'^platform\s+:(\w+)\s+do\s*$', trimmed)
+        if platform_match:
+            if platform_match.group(1) in ('ios', 'android'):
+                current_platform = platform_match.group(1)
+            continue
+        desc_match = re.match(r'^desc\s+(?:"([^"]+)"|\'([^\']+)\')\s*$', trimmed)
+        if desc_match:
+            last_description = desc_match.group(1) or desc_match.group(2)
+            continue
+        lane_match = re.match(r'^(private_lane|lane)\s+:(\w+)\s+do', trimmed)
+        if lane_match:
+            lanes.append((lane_match.group(2), current_platform, last_description))
+            last_description = None
+            continue
+        if trimmed == 'end' and current_platform is not None:
+            current_platform = None
+    return lanes
+
+
+def best_of(fn, content: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = generate_fastfile(args.lines)
+    line_count = content.count("\n")
+    size_mb = len(content.encode()) / 1e6
+
+    lanes = parse_lanes_from_fastfile(content)
+    misattributed = sum(1 for _, platform, _ in legacy_parse(content) if platform is None)
+
+    print(f"Fastfile: {line_count:,} lines, {size_mb:.2f} MB, {len(lanes):,} lanes")
+    for name, fn in (("tokenizer", parse_lanes_from_fastfile), ("legacy", legacy_parse)):
+        seconds = best_of(fn, content, args.repeat)
+        print(
+            f"{name:>10}: {seconds * 1000:8.1f} ms  "
+            f"{line_count / seconds / 1e6:6.2f} M lines/s  {size_mb / seconds:7.1f} MB/s"
+        )
+    print(f"legacy parser lost the platform for {misattributed:,} of {len(lanes):,} lanes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Synthetic build logs and Fastfiles for benchmarks.
+
+Usage:
+    uv run python benchmarks/corpus.py xcodebuild --mb 500 -o xcodebuild.log
+    uv run python benchmarks/corpus.py fastfile --lines 50000 -o Fastfile
+    uv run python benchmarks/corpus.py plugins --plugins 1500 -o catalog.json
+
+Logs imitate what fastlane prints around xcodebuild (gym/scan) and gradle:
+timestamped step banners, per-target build phases with long compiler
+command lines, warnings, and a failure near the end that several error
+patterns match. Output is deterministic for a given seed, so timings from
+different runs are comparable.
+"""
+
+import argparse
+import json
+import random
+import sys
+from collections.abc import Iterator
+
+LOG_KINDS = ("xcodebuild", "gradle", "fastlane")
+
+# Bytes generated per block before checking the size
+_BLOCK_BYTES = 64 * 1024
+
+_XCODE_PHASES = ("CompileSwift", "CompileC", "Ld", "CodeSign", "ProcessInfoPlistFile", "CompileAssetCatalog")
+_GRADLE_TASKS = ("compileDebugKotlin", "mergeDebugResources", "processDebugManifest", "dexBuilderDebug", "packageDebug")
+_ACTIONS = ("cocoapods", "increment_build_number", "gym", "gradle", "upload_to_testflight", "slack")
+
+_XCODE_FAILURE = '''[12:59:51]: ▸ ❌  /Users/ci/app/Sources/Feature9/View.swift:41:17: error: cannot find 'Theme' in scope
+[12:59:52]: ▸ error: No signing certificate "iOS Distribution" found: No "iOS Distribution" signing certificate matching team ID "ABCDE12345" with a private key was found. (in target 'App' from project 'App')
+** ARCHIVE FAILED **
+
+The following build commands failed:
+	CompileSwift normal arm64 /Users/ci/app/Sources/Feature9/View.swift (in target 'App' from project 'App')
+(1 failure)
+[12:59:58]: Exit status: 65
+xcodebuild: error: Operation timed out while waiting for the build service
+'''
+
+_GRADLE_FAILURE = '''> Task :app:compileReleaseKotlin FAILED
+e: /home/ci/app/src/main/java/com/example/Feature9.kt: (41, 17): Unresolved reference: Theme
+
+FAILURE: Build failed with an exception.
+
+* What went wrong:
+Execution failed for task ':app:compileReleaseKotlin'.
+> Could not resolve com.example:design:2.1.0.
+> SDK location not found. Define location with an ANDROID_SDK_ROOT environment variable.
+
+BUILD FAILED in 4m 12s
+'''
+
+_FASTLANE_FAILURE = '''[12:59:55]: -------------------------------
+[12:59:55]: --- Step: upload_to_testflight ---
+[12:59:55]: -------------------------------
+[12:59:58]: Couldn't find provisioning profile for bundle identifier com.example.app
+[12:59:59]: Error: Operation timed out after 600 seconds
++------+-------------------------+-------------+
+|              fastlane summary               |
++------+-------------------------+-------------+
+| Step | Action                  | Time (in s) |
++------+-------------------------+-------------+
+| 1    | default_platform        | 0           |
+| 💥   | upload_to_testflight    | 603         |
++------+-------------------------+-------------+
+[13:00:00]: fastlane finished with errors
+'''
+
+_FAILURES = {"xcodebuild": _XCODE_FAILURE, "gradle": _GRADLE_FAILURE, "fastlane": _FASTLANE_FAILURE}
+
+
+def _stamp(n: int) -> str:
+    return f"[{12 + n // 3600 % 12:02d}:{n // 60 % 60:02d}:{n % 60:02d}]: "
+
+
+def _step(rng: random.Random, n: int) -> list[str]:
+    banner = "-" * 31
+    action = _ACTIONS[rng.randrange(len(_ACTIONS))]
+    return [f"{_stamp(n)}{banner}", f"{_stamp(n)}--- Step: {action} ---", f"{_stamp(n)}{banner}"]
+
+
+def _xcodebuild_block(rng: random.Random, n: int) -> list[str]:
+    target = f"Feature{n % 40}"
+    lines = [f"=== BUILD TARGET {target} OF PROJECT App WITH CONFIGURATION Release ==="]
+    for i in range(rng.randint(4, 12)):
+        phase = _XCODE_PHASES[rng.randrange(len(_XCODE_PHASES))]
+        source = f"/Users/ci/app/Sources/{target}/File{i}.swift"
+        lines.append(f"{phase} normal arm64 {source} (in target '{target}' from project 'App')")
+        lines.append("    cd /Users/ci/app")
+        lines.append(
+            "    /Applications/Xcode.app/Contents/Developer/Toolchains/XcodeDefault.xctoolchain/usr/bin/"
+            f"swift-frontend -c -primary-file {source} -target arm64-apple-ios17.0 -O -module-name {target} "
+            + " ".join(f"-I /Users/ci/Library/Developer/Xcode/DerivedData/App/Build/Products/Dep{d}" for d in range(6))
+        )
+        if rng.random() < 0.1:
+            lines.append(f"{source}:{rng.randint(1, 400)}:{rng.randint(1, 80)}: warning: variable 'x' was never used")
+        lines.append(f"{_stamp(n + i)}▸ Compiling File{i}.swift")
+    return lines
+
+
+def _gradle_block(rng: random.Random, n: int) -> list[str]:
+    module = f"feature{n % 30}"
+    lines = []
+    for task in _GRADLE_TASKS:
+        status = " UP-TO-DATE" if rng.random() < 0.3 else ""
+        lines.append(f"> Task :{module}:{task}{status}")
+        if task == "compileDebugKotlin" and rng.random() < 0.3:
+            lines.append(
+                f"w: /home/ci/app/{module}/src/main/java/com/example/{module}/Screen{n}.kt: "
+                f"({rng.randint(1, 300)}, {rng.randint(1, 80)}): Parameter 'savedState' is never used"
+            )
+        if task == "mergeDebugResources":
+            lines.extend(
+                f"  Merging /home/ci/app/{module}/src/main/res/values/strings_{i}.xml" for i in range(rng.randint(1, 6))
+            )
+    return lines
+
+
+def _fastlane_block(rng: random.Random, n: int) -> list[str]:
+    lines = _step(rng, n)
+    for i in range(rng.randint(5, 20)):
+        lines.append(f"{_stamp(n + i)}▸ Running script 'Copy Pods Resources' for target Feature{i}")
+        if rng.random() < 0.2:
+            lines.append(f"{_stamp(n + i)}$ bundle exec pod install --repo-update --project-directory=ios/Pods{n}")
+    return lines
+
+
+_BLOCKS = {"xcodebuild": _xcodebuild_block, "gradle": _gradle_block, "fastlane": _fastlane_block}
+
+
+def iter_log(kind: str, size_bytes: int, seed: int = 0, failure: bool = True) -> Iterator[str]:
+    """Yield chunks of a synthetic build log of about size_bytes UTF-8 bytes.
+
+    Args:
+        kind: One of LOG_KINDS
+        size_bytes: Approximate size of the whole log
+        seed: Random seed; the same seed yields the same log
+        failure: End the log with a failure that error patterns match
+    """
+    rng = random.Random(seed)
+    block = _BLOCKS[kind]
+    tail = _FAILURES[kind] if failure else ""
+    budget = max(size_bytes - len(tail.encode()), 0)
+    produced = 0
+    n = 0
+    while produced < budget:
+        lines: list[str] = []
+        chunk_bytes = 0
+        while chunk_bytes < _BLOCK_BYTES and produced + chunk_bytes < budget:
+            if kind != "fastlane" and n % 50 == 0:
+                lines.extend(_step(rng, n))
+            new = block(rng, n)
+            lines.extend(new)
+            chunk_bytes += sum(len(line.encode()) + 1 for line in new)
+            n += 1
+        chunk = "\n".join(lines) + "\n"
+        produced += len(chunk.encode())
+        yield chunk
+    if tail:
+        yield tail
+
+
+def generate_log(kind: str, size_bytes: int, seed: int = 0, failure: bool = True) -> str:
+    """A synthetic build log of about size_bytes bytes (see iter_log)."""
+    return "".join(iter_log(kind, size_bytes, seed, failure))
+
+
+_LANE_TEMPLATE = '''  desc "Lane {n}"
+  lane :lane_{n} do |options|
+    if options[:clean]
+      clear_derived_data
+    end
+    increment_build_number(xcodeproj: "App.xcodeproj")
+    gym(scheme: "App", configuration: "Release", export_method: "app-store")
+    [1, 2, 3].each do |i|
+      puts "step #{{i}}"
+    end
+    # upload to the store
+    pilot(skip_waiting_for_build_processing: true)
+  end
+
+'''
+
+
+def generate_fastfile(target_lines: int) -> str:
+    """A Fastfile of roughly target_lines lines split across platforms."""
+    lane_lines = _LANE_TEMPLATE.count("\n")
+    lanes_per_platform = max(target_lines // lane_lines // 2, 1)
+    parts = []
+    n = 0
+    for platform in ("ios", "android"):
+        parts.append(f"platform :{platform} do\n")
+        for _ in range(lanes_per_platform):
+            parts.append(_LANE_TEMPLATE.format(n=n))
+            n += 1
+        parts.append("end\n\n")
+    return "".join(parts)
+
+
+_PLUGIN_WORDS = (
+    "firebase", "appcenter", "testflight", "slack", "teams", "discord", "s3", "gcs", "sentry", "bugsnag",
+    "crashlytics", "dsym", "badge", "icon", "version", "build", "number", "changelog", "git", "jira",
+    "upload", "download", "sign", "match", "profile", "certificate", "screenshot", "frame", "localize",
+    "translate", "xcconfig", "gradle", "bundle", "apk", "aab", "ipa", "notify", "release", "tag", "semver",
+)
+
+
+def generate_plugin_catalog(count: int, seed: int = 0) -> dict[str, dict]:
+    """A plugin catalog of count entries shaped like PLUGIN_CATALOG."""
+    rng = random.Random(seed)
+    catalog: dict[str, dict] = {}
+    for n in range(count):
+        words = rng.sample(_PLUGIN_WORDS, 3)
+        catalog[f"fastlane-plugin-{'_'.join(words[:2])}_{n}"] = {
+            "description": f"{words[0].title()} {' and '.join(rng.sample(_PLUGIN_WORDS, 4))} for {words[2]} builds",
+            "signals": rng.sample(_PLUGIN_WORDS, 2),
+            "capabilities": [f"{words[0]}_{words[1]}", f"{words[2]}_{n}"],
+            "homepage": f"https://github.com/example/fastlane-plugin-{n}",
+        }
+    return catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=[*LOG_KINDS, "fastfile", "plugins"])
+    parser.add_argument("--mb", type=float, default=1, help="Log size in MB")
+    parser.add_argument("--lines", type=int, default=10_000, help="Fastfile size in lines")
+    parser.add_argument("--plugins", type=int, default=1000, help="Plugin catalog size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-failure", action="store_true", help="Generate a log of a successful build")
+    parser.add_argument("-o", "--output", help="File to write (default: stdout)")
+    args = parser.parse_args()
+
+    if args.kind == "fastfile":
+        chunks: Iterator[str] = iter([generate_fastfile(args.lines)])
+    elif args.kind == "plugins":
+        chunks = iter([json.dumps(generate_plugin_catalog(args.plugins, args.seed), indent=2) + "\n"])
+    else:
+        chunks = iter_log(args.kind, int(args.mb * 1e6), args.seed, not args.no_failure)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
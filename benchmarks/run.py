@@ -0,0 +1,274 @@
+"""Benchmark the diagnosis and parsing hot paths against a stored baseline.
+
+Usage:
+    uv run python benchmarks/run.py [--profile quick|full] [--only diagnose]
+    uv run python benchmarks/run.py --update-baseline
+    uv run python benchmarks/run.py --json results.json
+
+Times diagnose_error on synthetic xcodebuild, gradle and fastlane logs,
+parse_lanes_from_fastfile on large Fastfiles, plugin search over the
+built-in and a synthetic 1500-plugin catalog, and _format_build_error, and records each case's peak Python memory
+(tracemalloc). The quick profile uses 1-10 MB logs; the full profile goes
+up to 500 MB and needs several GB of RAM.
+
+Timings are divided by a fixed pure-Python calibration workload, timed
+before the first case and after every case (the fastest time is used, as
+the least disturbed by other load), so a baseline
+recorded on one machine is roughly comparable on another. A case regresses
+when its relative time or its memory peak exceeds the baseline by more
+than --tolerance (default 50%; memory may always grow by MIN_MEMORY_DELTA),
+and the script then exits with status 1. Cases missing from the baseline
+are reported but never fail.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from corpus import generate_fastfile, generate_log, generate_plugin_catalog
+
+from fastlane_mcp.discovery.lanes import parse_lanes_from_fastfile
+from fastlane_mcp.errors.diagnosis import diagnose_error
+from fastlane_mcp.plugins.registry import PluginIndex, search_plugins
+from fastlane_mcp.tools.build import _format_build_error
+
+BASELINE = Path(__file__).with_name("baseline.json")
+# Shared CI machines vary by tens of percent between runs; regressions worth
+# catching here are algorithmic, and show up as multiples
+DEFAULT_TOLERANCE = 0.5
+
+# Memory peaks may grow by this many bytes regardless of tolerance
+MIN_MEMORY_DELTA = 256 * 1024
+
+PLUGIN_QUERIES = ("firebase", "upload", "slack notification", "dsym", "version", "nothing-matches-this")
+LARGE_CATALOG_QUERIES = ("firebase", "upload dsym", "slack notify", "ver", "b", "nothing-matches-this")
+
+
+@dataclass
+class Case:
+    """One benchmark: setup builds the input untimed, run is what is timed."""
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+    # Calls of run per timing; results are reported per call
+    number: int = 1
+    # Input size in bytes, for throughput
+    size: int | None = None
+
+
+def _diagnose(kind: str, mb: float) -> Case:
+    return Case(
+        f"diagnose_error/{kind}/{mb:g}MB",
+        lambda: generate_log(kind, int(mb * 1e6)),
+        diagnose_error,
+        size=int(mb * 1e6),
+    )
+
+
+def _parse(lines: int) -> Case:
+    return Case(
+        f"parse_lanes_from_fastfile/{lines // 1000}k_lines",
+        lambda: generate_fastfile(lines),
+        parse_lanes_from_fastfile,
+    )
+
+
+def _search() -> Case:
+    def run(queries):
+        for query in queries:
+            search_plugins(query)
+
+    return Case("search_plugins", lambda: PLUGIN_QUERIES, run, number=200)
+
+
+def _search_index(plugins: int) -> Case:
+    def run(inputs):
+        index, queries = inputs
+        for query in queries:
+            index.search(query)
+
+    return Case(
+        f"PluginIndex.search/{plugins}_plugins",
+        lambda: (PluginIndex(generate_plugin_catalog(plugins)), LARGE_CATALOG_QUERIES),
+        run,
+        number=20,
+    )
+
+
+def _format(mb: float) -> Case:
+    def setup():
+        log = generate_log("xcodebuild", int(mb * 1e6))
+        segments = [
+            {"index": i, "kind": "phase", "name": "CompileSwift", "detail": f"CompileSwift normal arm64 File{i}.swift",
+             "errors": 1, "size": 4096}
+            for i in range(5)
+        ]
+        return diagnose_error(log), log, log[-64 * 1024:], segments
+
+    def run(inputs):
+        diagnosis, stdout, stderr, segments = inputs
+        return _format_build_error(diagnosis, stdout, stderr, "20260101-000000-abcdef", segments=segments)
+
+    return Case(f"_format_build_error/{mb:g}MB", setup, run, number=1000)
+
+
+PROFILES: dict[str, list[Case]] = {
+    "quick": [
+        _diagnose("xcodebuild", 1),
+        _diagnose("xcodebuild", 10),
+        _diagnose("gradle", 1),
+        _diagnose("fastlane", 1),
+        _parse(10_000),
+        _parse(50_000),
+        _search(),
+        _search_index(1500),
+        _format(1),
+    ],
+    "full": [
+        _diagnose("xcodebuild", 1),
+        _diagnose("xcodebuild", 50),
+        _diagnose("xcodebuild", 500),
+        _diagnose("gradle", 50),
+        _diagnose("fastlane", 50),
+        _parse(10_000),
+        _parse(50_000),
+        _search(),
+        _search_index(1500),
+        _format(50),
+    ],
+}
+
+
+def calibrate(repeat: int = 10) -> float:
+    """Seconds for a fixed workload of string, dict and integer operations."""
+    def workload():
+        counts: dict[str, int] = {}
+        for i in range(200_000):
+            key = f"k{i % 1000}"
+            counts[key] = counts.get(key, 0) + i
+        return "".join(sorted(counts)).lower().find("zz")
+
+    return _best_of(lambda _: workload(), None, repeat, 1)
+
+
+def _best_of(run: Callable, inputs: object, repeat: int, number: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run(inputs)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _peak_memory(run: Callable, inputs: object) -> int:
+    tracemalloc.start()
+    try:
+        run(inputs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case: Case, repeat: int) -> dict:
+    """Time a case and record its memory peak."""
+    inputs = case.setup()
+    case.run(inputs)  # warm up caches and lazily built state
+    seconds = _best_of(case.run, inputs, repeat, case.number)
+    result = {
+        "seconds": seconds,
+        "peak_bytes": _peak_memory(case.run, inputs),
+    }
+    if case.size:
+        result["mb_per_second"] = case.size / 1e6 / seconds
+    return result
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Regressions of results against baseline, as human-readable lines."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in ("relative", "peak_bytes"):
+            limit = expected[metric] * (1 + tolerance)
+            if metric == "peak_bytes":
+                limit = max(limit, expected[metric] + MIN_MEMORY_DELTA)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.4g} exceeds baseline {expected[metric]:.4g} "
+                    f"by {result[metric] / expected[metric] - 1:.0%} (tolerance {tolerance:.0%})"
+                )
+    return regressions
+
+
+def _load_baselines(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--only", help="Run only cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    cases = [case for case in PROFILES[args.profile] if not args.only or args.only in case.name]
+    calibration = calibrate()
+    baselines = _load_baselines(args.baseline)
+    baseline = baselines.get(args.profile, {}).get("results", {})
+
+    results: dict[str, dict] = {}
+    for case in cases:
+        results[case.name] = measure(case, args.repeat)
+        calibration = min(calibration, calibrate())
+
+    print(f"calibration: {calibration * 1000:.1f} ms")
+    for name, result in results.items():
+        result["relative"] = result["seconds"] / calibration
+        expected = baseline.get(name)
+        change = f"{result['relative'] / expected['relative'] - 1:+6.0%}" if expected else "   new"
+        throughput = f"{result['mb_per_second']:8.1f} MB/s" if "mb_per_second" in result else " " * 13
+        print(
+            f"{name:<42} {result['seconds'] * 1000:10.3f} ms {throughput} "
+            f"{result['peak_bytes'] / 1e6:9.1f} MB peak  {change}"
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration": calibration,
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        stored = baselines.get(args.profile, {}).get("results", {})
+        baselines[args.profile] = {**report, "results": {**stored, **results}}
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"baseline updated: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
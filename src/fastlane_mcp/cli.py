@@ -6,6 +6,20 @@ import sys
 from fastlane_mcp import __version__
 
 
+def _int_at_least(minimum: int):
+    """argparse type accepting integers of at least minimum."""
+    def parse(value: str) -> int:
+        try:
+            parsed = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+        if parsed < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {parsed}")
+        return parsed
+
+    return parse
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -18,9 +32,48 @@ def main():
         version=f"fastlane-mcp {__version__}"
     )
 
+    parser.add_argument(
+        "--max-ios-builds",
+        type=_int_at_least(1),
+        help="Maximum concurrent iOS builds on this host"
+    )
+    parser.add_argument(
+        "--max-android-builds",
+        type=_int_at_least(1),
+        help="Maximum concurrent Android builds on this host"
+    )
+    parser.add_argument(
+        "--max-builds-per-project",
+        type=_int_at_least(1),
+        help="Maximum concurrent builds within one project directory"
+    )
+    parser.add_argument(
+        "--warm-workers",
+        type=_int_at_least(0),
+        help="Pre-booted fastlane processes to keep per project directory (0 disables)"
+    )
+
     # Parse known args only - let FastMCP handle the rest
     args, remaining = parser.parse_known_args()
 
+    platform_limits = {}
+    if args.max_ios_builds is not None:
+        platform_limits["ios"] = args.max_ios_builds
+    if args.max_android_builds is not None:
+        platform_limits["android"] = args.max_android_builds
+    if platform_limits or args.max_builds_per_project is not None:
+        from fastlane_mcp.utils.scheduler import scheduler
+        scheduler.configure(platform_limits, args.max_builds_per_project)
+    if args.warm_workers is not None:
+        from fastlane_mcp.utils.workers import worker_pool
+        worker_pool.max_workers = args.warm_workers
+
+    # Compile pattern packs now rather than on the first failed build
+    from fastlane_mcp.errors.packs import pattern_registry
+    pattern_registry.matcher()
+    for path, error in pattern_registry.errors.items():
+        print(f"Pattern pack {path}: {error}", file=sys.stderr)
+
     # Import and run the MCP server
     from fastlane_mcp.server import mcp
     sys.argv = [sys.argv[0]] + remaining  # Pass remaining args to FastMCP
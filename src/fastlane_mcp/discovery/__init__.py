@@ -1,8 +1,49 @@
 """Discovery modules for analyzing fastlane projects."""
 
 from fastlane_mcp.discovery.lanes import (
+    FastfileImport,
     LaneInfo,
+    ParsedFastfile,
+    parse_fastfile,
     parse_lanes_from_fastfile,
 )
+from fastlane_mcp.discovery.cache import (
+    CacheStats,
+    FastfileCache,
+    fastfile_cache,
+    load_lanes,
+)
+from fastlane_mcp.discovery.index import (
+    LaneIndex,
+    LaneIndexCache,
+    build_lane_index,
+    lane_index_cache,
+    load_lane_index,
+)
+from fastlane_mcp.discovery.monorepo import (
+    FastlaneApp,
+    MonorepoScan,
+    find_fastlane_apps,
+    scan_monorepo,
+)
 
-__all__ = ["LaneInfo", "parse_lanes_from_fastfile"]
+__all__ = [
+    "FastfileImport",
+    "LaneInfo",
+    "ParsedFastfile",
+    "parse_fastfile",
+    "parse_lanes_from_fastfile",
+    "CacheStats",
+    "FastfileCache",
+    "fastfile_cache",
+    "load_lanes",
+    "LaneIndex",
+    "LaneIndexCache",
+    "build_lane_index",
+    "lane_index_cache",
+    "load_lane_index",
+    "FastlaneApp",
+    "MonorepoScan",
+    "find_fastlane_apps",
+    "scan_monorepo",
+]
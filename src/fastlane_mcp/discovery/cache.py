@@ -0,0 +1,145 @@
+"""Process-wide cache of parsed Fastfiles."""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastlane_mcp.discovery.lanes import (
+    FastfileImport,
+    LaneInfo,
+    ParsedFastfile,
+    parse_fastfile,
+)
+
+# Parsed lanes and imports of one file, stored immutably
+_Entry = tuple[tuple[LaneInfo, ...], tuple[FastfileImport, ...]]
+
+# Number of parsed Fastfiles kept before the least recently used is dropped
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a FastfileCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def file_signature(path: Path | str) -> tuple[int, int, int] | None:
+    """Identity of a file's current contents, or None if it is missing.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        (mtime_ns, size, inode), or None if the file cannot be stat()ed
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class FastfileCache:
+    """LRU cache of parsed Fastfiles keyed by file identity.
+
+    An entry is reused while the file's (mtime_ns, size, inode) signature is
+    unchanged, so a lookup costs one stat() instead of a read and a parse.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[tuple[int, int, int], _Entry]] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get_lanes(self, path: Path) -> list[LaneInfo]:
+        """Return the lanes defined in a Fastfile, parsing it only if changed.
+
+        Args:
+            path: Path to the Fastfile
+
+        Returns:
+            List of LaneInfo objects
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return list(self._get(path)[0])
+
+    def get_parsed(self, path: Path) -> ParsedFastfile:
+        """Return the lanes and imports of a Fastfile, parsing it only if changed.
+
+        Args:
+            path: Path to the Fastfile
+
+        Returns:
+            ParsedFastfile for the file
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        lanes, imports = self._get(path)
+        return ParsedFastfile(lanes=list(lanes), imports=list(imports))
+
+    def _get(self, path: Path) -> "_Entry":
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[1]
+            self._stats.misses += 1
+
+        parsed = parse_fastfile(Path(key).read_text())
+        value = (tuple(parsed.lanes), tuple(parsed.imports))
+
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+        return value
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+
+fastfile_cache = FastfileCache()
+
+
+def load_lanes(path: Path) -> list[LaneInfo]:
+    """Parse a Fastfile through the shared cache.
+
+    Args:
+        path: Path to the Fastfile
+
+    Returns:
+        List of LaneInfo objects
+    """
+    return fastfile_cache.get_lanes(path)
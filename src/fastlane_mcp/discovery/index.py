@@ -0,0 +1,281 @@
+"""Merged lane index across Fastfiles linked by import/import_from_git."""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from urllib.parse import urlparse
+
+from fastlane_mcp.discovery.cache import FastfileCache, fastfile_cache, file_signature
+from fastlane_mcp.discovery.lanes import FastfileImport, LaneInfo, ParsedFastfile
+
+# Directory holding local checkouts of repositories used by import_from_git
+GIT_IMPORT_CACHE_ENV = "FASTLANE_MCP_GIT_IMPORT_CACHE"
+
+# Number of merged indexes kept before the least recently used is dropped
+DEFAULT_MAX_INDEXES = 64
+
+# scp-style git remotes, e.g. git@github.com:org/repo.git
+_SCP_URL_PATTERN = re.compile(r'^(?:[\w.-]+@)?(?P<host>[\w.-]+):(?P<path>[^/].*)$')
+
+# A root Fastfile and the platform its lanes default to
+IndexRoot = tuple[str | None, Path]
+
+
+@dataclass
+class LaneIndex:
+    """Lanes reachable from one or more root Fastfiles through imports."""
+    lanes: list[LaneInfo]
+    files: list[Path]
+    unresolved: list[str]
+    signatures: tuple[tuple[str, tuple[int, int, int] | None], ...] = field(default=(), repr=False)
+
+    def is_current(self) -> bool:
+        """Whether no file in the graph changed, appeared or vanished."""
+        return all(file_signature(path) == signature for path, signature in self.signatures)
+
+
+def git_import_cache_dir() -> Path | None:
+    """Directory configured by FASTLANE_MCP_GIT_IMPORT_CACHE, if any."""
+    configured = os.environ.get(GIT_IMPORT_CACHE_ENV)
+    return Path(configured).expanduser() if configured else None
+
+
+def git_checkout_candidates(url: str, cache_dir: Path) -> list[Path]:
+    """Where a checkout of url may live inside the git import cache.
+
+    Checkouts are looked up as <cache>/<host>/<repo path> first, then as
+    <cache>/<repo name>, e.g. for git@github.com:acme/shared-lanes.git:
+    <cache>/github.com/acme/shared-lanes and <cache>/shared-lanes.
+
+    Args:
+        url: Repository URL as written in the Fastfile
+        cache_dir: Git import cache directory
+
+    Returns:
+        Candidate checkout directories, most specific first
+    """
+    scp = _SCP_URL_PATTERN.match(url) if "://" not in url else None
+    if scp:
+        host, repo = scp.group('host'), scp.group('path')
+    else:
+        parsed = urlparse(url)
+        host, repo = parsed.hostname or "", parsed.path
+
+    repo = repo.strip("/")
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    parts = [p for p in repo.split("/") if p not in ("", ".", "..")]
+    if not parts:
+        return []
+
+    candidates = [cache_dir.joinpath(host, *parts)] if host else []
+    candidates.append(cache_dir / parts[-1])
+    return candidates
+
+
+def resolve_import(
+    fastfile_import: FastfileImport,
+    importer: Path,
+    git_cache_dir: Path | None = None
+) -> Path | None:
+    """Resolve an import statement to the Fastfile it loads.
+
+    Local imports are relative to the importing Fastfile's directory, as in
+    fastlane. Git imports are looked up in the git import cache; they are
+    never fetched.
+
+    Args:
+        fastfile_import: Parsed import statement
+        importer: Fastfile containing the statement
+        git_cache_dir: Git import cache directory, or None to skip git imports
+
+    Returns:
+        Path of the imported Fastfile (which may not exist), or None if it
+        cannot be located
+    """
+    if not fastfile_import.is_git:
+        path = Path(fastfile_import.path).expanduser()
+        if not path.is_absolute():
+            path = importer.parent / path
+        return Path(os.path.normpath(path))
+
+    if git_cache_dir is None:
+        return None
+    candidates = git_checkout_candidates(fastfile_import.url, git_cache_dir)
+    for checkout in candidates:
+        if checkout.is_dir():
+            return checkout / fastfile_import.path
+    # Nothing checked out yet; watch the preferred location
+    return candidates[0] / fastfile_import.path if candidates else None
+
+
+def _describe(fastfile_import: FastfileImport) -> str:
+    if fastfile_import.is_git:
+        return f"{fastfile_import.url} ({fastfile_import.path})"
+    return fastfile_import.path
+
+
+def build_lane_index(
+    roots: list[IndexRoot],
+    git_cache_dir: Path | None = None,
+    cache: FastfileCache = fastfile_cache
+) -> LaneIndex:
+    """Follow imports from the root Fastfiles and merge their lanes.
+
+    Each file is parsed once even if several roots import it. Lanes outside
+    a platform block take the platform of the root that imports them; a file
+    reached from roots of different platforms is treated as shared and its
+    lanes keep no platform. The first definition of a (platform, lane) pair
+    wins, so a Fastfile's own lanes take precedence over imported ones.
+
+    Args:
+        roots: (default platform, Fastfile path) pairs, in priority order
+        git_cache_dir: Git import cache directory, or None to skip git imports
+        cache: Parse cache to read Fastfiles through
+
+    Returns:
+        The merged LaneIndex
+    """
+    parsed: dict[str, ParsedFastfile | None] = {}
+    platforms: dict[str, set[str | None]] = {}
+    order: list[str] = []
+    unresolved: list[str] = []
+    signatures: dict[str, tuple[int, int, int] | None] = {}
+
+    def load(key: str) -> ParsedFastfile | None:
+        if key not in parsed:
+            signatures[key] = file_signature(key)
+            try:
+                parsed[key] = cache.get_parsed(Path(key)) if signatures[key] else None
+            except (OSError, UnicodeDecodeError):
+                parsed[key] = None
+        return parsed[key]
+
+    for root_platform, root in roots:
+        stack = [os.path.abspath(root)]
+        visited: set[str] = set()
+        while stack:
+            key = stack.pop()
+            if key in visited:
+                continue
+            visited.add(key)
+
+            fastfile = load(key)
+            if fastfile is None:
+                continue
+            if key not in platforms:
+                platforms[key] = set()
+                order.append(key)
+            platforms[key].add(root_platform)
+
+            children = []
+            for fastfile_import in fastfile.imports:
+                target = resolve_import(fastfile_import, Path(key), git_cache_dir)
+                if target is not None:
+                    target_key = os.path.abspath(target)
+                    if load(target_key) is not None:
+                        children.append(target_key)
+                        continue
+                description = _describe(fastfile_import)
+                if description not in unresolved:
+                    unresolved.append(description)
+            # Reversed so imports are visited in file order
+            stack.extend(reversed(children))
+
+    lanes: list[LaneInfo] = []
+    seen: set[tuple[str | None, str]] = set()
+    for key in order:
+        reaching = platforms[key]
+        default_platform = next(iter(reaching)) if len(reaching) == 1 else None
+        for lane in parsed[key].lanes:
+            lane_platform = lane.platform or default_platform
+            if (lane_platform, lane.name) in seen:
+                continue
+            seen.add((lane_platform, lane.name))
+            lanes.append(replace(lane, platform=lane_platform, source=key))
+
+    return LaneIndex(
+        lanes=lanes,
+        files=[Path(key) for key in order],
+        unresolved=unresolved,
+        signatures=tuple(signatures.items()),
+    )
+
+
+class LaneIndexCache:
+    """LRU cache of merged lane indexes.
+
+    An index is reused while every file it was built from (and every local
+    import that was missing) keeps its stat() signature. When one file
+    changes the index is rebuilt, but unchanged files are still served from
+    the FastfileCache, so only the changed file is re-parsed. Safe to use
+    from multiple threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_INDEXES,
+        fastfiles: FastfileCache = fastfile_cache
+    ):
+        self.max_entries = max_entries
+        self.fastfiles = fastfiles
+        self._entries: OrderedDict[tuple, LaneIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, roots: list[IndexRoot], git_cache_dir: Path | None = None) -> LaneIndex:
+        """Return the merged index for the roots, rebuilding it if stale.
+
+        Args:
+            roots: (default platform, Fastfile path) pairs, in priority order
+            git_cache_dir: Git import cache directory, or None to skip git imports
+
+        Returns:
+            The merged LaneIndex
+        """
+        key = (
+            tuple((platform, os.path.abspath(path)) for platform, path in roots),
+            str(git_cache_dir) if git_cache_dir else None,
+        )
+
+        with self._lock:
+            index = self._entries.get(key)
+        if index is not None and index.is_current():
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return index
+
+        index = build_lane_index(roots, git_cache_dir, self.fastfiles)
+
+        with self._lock:
+            self._entries[key] = index
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return index
+
+    def clear(self) -> None:
+        """Drop all indexes."""
+        with self._lock:
+            self._entries.clear()
+
+
+lane_index_cache = LaneIndexCache()
+
+
+def load_lane_index(roots: list[IndexRoot]) -> LaneIndex:
+    """Build or reuse the merged index for the roots.
+
+    Git imports are resolved against FASTLANE_MCP_GIT_IMPORT_CACHE.
+
+    Args:
+        roots: (default platform, Fastfile path) pairs, in priority order
+
+    Returns:
+        The merged LaneIndex
+    """
+    return lane_index_cache.get(roots, git_import_cache_dir())
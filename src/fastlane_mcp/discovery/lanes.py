@@ -11,55 +11,149 @@ class LaneInfo:
     platform: str | None
     description: str | None
     is_private: bool
+    source: str | None = None
+
+
+@dataclass
+class FastfileImport:
+    """An import or import_from_git statement in a Fastfile."""
+    path: str
+    url: str | None = None
+    branch: str | None = None
+    version: str | None = None
+
+    @property
+    def is_git(self) -> bool:
+        return self.url is not None
+
+
+@dataclass
+class ParsedFastfile:
+    """Lanes and imports found in a single Fastfile."""
+    lanes: list[LaneInfo]
+    imports: list[FastfileImport]
+
+
+# One alternation recognises every construct the parser cares about. Each
+# alternative is wrapped in an upper-case group so match.lastgroup names the
+# token kind. Line-level tokens start with a literal newline and BLOCK (any
+# block opened by a trailing "do", e.g. "before_all do", "each do |x|")
+# starts with "do". Conditionals and begin also open a block when their
+# value is assigned (e.g. "scheme = if ENV['CI']", "x ||= begin"); that
+# prefix is possessive so ordinary action lines fail it without
+# backtracking. Anchoring
+# on "\n" and "do" lets the regex engine skip straight to candidate
+# positions, so lines that can't matter (plain action calls) never reach
+# Python.
+_TOKEN_PATTERN = re.compile(r"""
+    \n[ \t]*
+    (?:
+        (?P<COMMENT>\#[^\n]*)
+      | (?P<PLATFORM>platform[ \t]+:(?P<platform>\w+)[ \t]+do\b)
+      | (?P<LANE>(?P<lane_type>private_lane|lane)[ \t]+:(?P<lane>\w+)[ \t]+do\b)
+      | (?P<DESC>desc[ \t]+(?:"(?P<desc_dq>[^"\n]+)"|'(?P<desc_sq>[^'\n]+)')[ \t]*$)
+      | (?P<END>end\b)
+      | (?P<IMPORT>import[ \t]*\(?[ \t]*(?:"(?P<import_dq>[^"\n]+)"|'(?P<import_sq>[^'\n]+)'))
+      | (?P<GIT_IMPORT>import_from_git\b(?P<git_args>[ \t]*\([^)]*\)|[^\n]*))
+      | (?P<KEYWORD>(?:(?:\w++[ \t]*+(?:\|\||&&)?=[ \t]*+)?(?:if|unless|while|until|case|begin)|def|class|module|for)\b[^\n]*)
+    )
+  | (?P<BLOCK>do(?:[ \t]*\|[^|\n]*\|)?[ \t]*(?:\#[^\n]*)?$)
+""", re.MULTILINE | re.VERBOSE)
+
+# A keyword line that also closes itself, e.g. "if x then y end"
+_INLINE_END_PATTERN = re.compile(r'\bend\s*$')
+
+# Keyword arguments of import_from_git, in "key: 'v'" or ":key => 'v'" form
+_GIT_ARG_PATTERN = re.compile(
+    r""":?(?P<key>\w+)(?::|\s*=>)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)')"""
+)
+
+# Where import_from_git looks for the Fastfile inside the repository by default
+DEFAULT_GIT_IMPORT_PATH = 'fastlane/Fastfile'
+
+_PLATFORMS = ('ios', 'android')
+
+
+def _parse_git_import(args: str) -> FastfileImport | None:
+    values = {
+        m.group('key'): m.group('dq') if m.group('dq') is not None else m.group('sq')
+        for m in _GIT_ARG_PATTERN.finditer(args)
+    }
+    if not values.get('url'):
+        return None
+    return FastfileImport(
+        path=values.get('path') or DEFAULT_GIT_IMPORT_PATH,
+        url=values['url'],
+        branch=values.get('branch'),
+        version=values.get('version'),
+    )
 
 
 def parse_lanes_from_fastfile(content: str) -> list[LaneInfo]:
     """Parse lanes from Fastfile content.
 
+    Imports are not followed; see discovery.index for the merged view.
+
+    Args:
+        content: The Fastfile content as a string
+
+    Returns:
+        List of LaneInfo objects
+    """
+    return parse_fastfile(content).lanes
+
+
+def parse_fastfile(content: str) -> ParsedFastfile:
+    """Parse lanes and imports from Fastfile content.
+
     Handles:
     - Platform blocks (platform :ios do ... end)
     - Lane definitions (lane :name do ... end)
     - Private lanes (private_lane :name do ... end)
     - Underscore-prefixed private lanes (_name)
     - Description blocks (desc "..." or desc '...')
+    - import "path" and import_from_git(url: ..., path: ...) statements
+
+    Scans the content once with a single precompiled regex and tracks Ruby
+    block depth (do/if/unless/case/begin/def ... end), so lanes after
+    nested blocks inside a platform are attributed to the right platform.
 
     Args:
         content: The Fastfile content as a string
 
     Returns:
-        List of LaneInfo objects
+        ParsedFastfile with lanes and imports in file order
     """
     lanes: list[LaneInfo] = []
+    imports: list[FastfileImport] = []
+    depth = 0
     current_platform: str | None = None
+    platform_depth: int | None = None
     last_description: str | None = None
 
-    for line in content.split('\n'):
-        trimmed = line.strip()
+    # Leading newline so the first line is tokenized like the others
+    text = '\n' + content
 
-        # Skip empty lines and comments
-        if not trimmed or trimmed.startswith('#'):
-            continue
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
 
-        # Track platform blocks
-        platform_match = re.match(r'^platform\s+:(\w+)\s+do\s*$', trimmed)
-        if platform_match:
-            platform = platform_match.group(1)
-            if platform in ('ios', 'android'):
-                current_platform = platform
-            continue
+        if kind == 'BLOCK':
+            # "do" must be a whole word (not the end of e.g. "todo")
+            before = text[match.start() - 1]
+            if not (before.isalnum() or before == '_'):
+                depth += 1
 
-        # Track description blocks - supports both single and double quotes
-        desc_match = re.match(r'^desc\s+(?:"([^"]+)"|\'([^\']+)\')\s*$', trimmed)
-        if desc_match:
-            last_description = desc_match.group(1) or desc_match.group(2)
-            continue
+        elif kind == 'END':
+            if depth > 0:
+                depth -= 1
+            if platform_depth is not None and depth < platform_depth:
+                current_platform = None
+                platform_depth = None
 
-        # Match lane definitions (both regular and private)
-        lane_match = re.match(r'^(private_lane|lane)\s+:(\w+)\s+do', trimmed)
-        if lane_match:
-            lane_type = lane_match.group(1)
-            name = lane_match.group(2)
-            is_private = lane_type == 'private_lane' or name.startswith('_')
+        elif kind == 'LANE':
+            depth += 1
+            name = match.group('lane')
+            is_private = match.group('lane_type') == 'private_lane' or name.startswith('_')
 
             lanes.append(LaneInfo(
                 name=name,
@@ -69,12 +163,27 @@ def parse_lanes_from_fastfile(content: str) -> list[LaneInfo]:
             ))
 
             last_description = None  # Reset after use
-            continue
 
-        # Track end statements to manage platform block context
-        if trimmed == 'end' and current_platform is not None:
-            # Simplified: assume top-level end closes platform
-            # A full Ruby parser would track block depth
-            current_platform = None
+        elif kind == 'DESC':
+            last_description = match.group('desc_dq') or match.group('desc_sq')
+
+        elif kind == 'KEYWORD':
+            if not _INLINE_END_PATTERN.search(match.group('KEYWORD')):
+                depth += 1
+
+        elif kind == 'PLATFORM':
+            depth += 1
+            platform = match.group('platform')
+            if platform in _PLATFORMS:
+                current_platform = platform
+                platform_depth = depth
+
+        elif kind == 'IMPORT':
+            imports.append(FastfileImport(path=match.group('import_dq') or match.group('import_sq')))
+
+        elif kind == 'GIT_IMPORT':
+            git_import = _parse_git_import(match.group('git_args'))
+            if git_import is not None:
+                imports.append(git_import)
 
-    return lanes
+    return ParsedFastfile(lanes=lanes, imports=imports)
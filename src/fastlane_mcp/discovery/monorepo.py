@@ -0,0 +1,182 @@
+"""Discovery of fastlane apps nested anywhere in a monorepo."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastlane_mcp.discovery.index import IndexRoot, LaneIndex, load_lane_index
+
+# Directory names never descended into; they hold dependencies or build
+# output, not apps. Hidden directories (.git, .gradle, ...) are also skipped.
+PRUNED_DIRS = frozenset({
+    "node_modules",
+    "Pods",
+    "build",
+    "DerivedData",
+    "Carthage",
+    "vendor",
+})
+
+# How many directory levels below project_path are searched for apps
+DEFAULT_MAX_DEPTH = 4
+
+# Seconds a recursive scan may take before it returns partial results
+DEFAULT_TIME_BUDGET = 10.0
+
+_PLATFORMS = ("ios", "android")
+
+
+@dataclass
+class FastlaneApp:
+    """A directory with its own fastlane setup."""
+    path: Path
+    roots: list[IndexRoot]
+
+    @property
+    def platforms(self) -> list[str]:
+        return [platform for platform, _ in self.roots if platform]
+
+
+@dataclass
+class AppLanes:
+    """An app and the lanes found for it."""
+    app: FastlaneApp
+    index: LaneIndex | None = None
+
+
+@dataclass
+class MonorepoScan:
+    """Result of a recursive scan."""
+    apps: list[AppLanes] = field(default_factory=list)
+    directories_scanned: int = 0
+    truncated: bool = False
+    elapsed: float = 0.0
+
+
+def app_roots(directory: Path) -> list[IndexRoot]:
+    """Fastfiles of the app in directory, in the order lanes are merged.
+
+    Args:
+        directory: Candidate app directory
+
+    Returns:
+        (platform, Fastfile) pairs; empty if directory is not a fastlane app
+    """
+    roots: list[IndexRoot] = []
+    for platform in _PLATFORMS:
+        fastfile = directory / platform / "fastlane" / "Fastfile"
+        if fastfile.is_file():
+            roots.append((platform, fastfile))
+    fastfile = directory / "fastlane" / "Fastfile"
+    if fastfile.is_file():
+        roots.append((None, fastfile))
+    return roots
+
+
+def find_fastlane_apps(
+    root: Path,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    deadline: float | None = None
+) -> tuple[list[FastlaneApp], int, bool]:
+    """Walk a directory tree breadth-first looking for fastlane apps.
+
+    Pruned and hidden directories and symlinks are not followed. Inside an
+    app, its ios/, android/ and fastlane/ folders are not searched further,
+    but other subdirectories are, so apps may be nested. This blocks on the
+    filesystem and is meant to run in a worker thread.
+
+    Args:
+        root: Directory to start from
+        max_depth: Deepest directory level (root is 0) checked for an app
+        deadline: time.monotonic() value after which the walk stops early
+
+    Returns:
+        (apps in breadth-first order, directories scanned, whether the walk
+        stopped early because of the deadline)
+    """
+    apps: list[FastlaneApp] = []
+    scanned = 0
+    queue: deque[tuple[Path, int]] = deque([(root, 0)])
+
+    while queue:
+        if deadline is not None and time.monotonic() > deadline:
+            return apps, scanned, True
+
+        directory, depth = queue.popleft()
+        scanned += 1
+
+        roots = app_roots(directory)
+        if roots:
+            apps.append(FastlaneApp(path=directory, roots=roots))
+        if depth >= max_depth:
+            continue
+
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name in PRUNED_DIRS:
+                continue
+            if roots and name in (*_PLATFORMS, "fastlane"):
+                continue
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            queue.append((Path(entry.path), depth + 1))
+
+    return apps, scanned, False
+
+
+async def scan_monorepo(
+    root: Path,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    time_budget: float = DEFAULT_TIME_BUDGET
+) -> MonorepoScan:
+    """Find every fastlane app under root and index their lanes.
+
+    The tree walk and each app's Fastfile parsing run in worker threads, so
+    the event loop is never blocked and apps are parsed concurrently. When
+    the time budget runs out, apps found so far are returned and those whose
+    lanes were not parsed in time have no index.
+
+    Args:
+        root: Directory to scan
+        max_depth: Deepest directory level (root is 0) checked for an app
+        time_budget: Seconds allowed for the whole scan
+
+    Returns:
+        MonorepoScan with the apps found
+    """
+    start = time.monotonic()
+    deadline = start + time_budget
+
+    apps, scanned, truncated = await asyncio.to_thread(find_fastlane_apps, root, max_depth, deadline)
+    scan = MonorepoScan(
+        apps=[AppLanes(app=app) for app in apps],
+        directories_scanned=scanned,
+        truncated=truncated,
+    )
+
+    tasks = {
+        asyncio.ensure_future(asyncio.to_thread(load_lane_index, entry.app.roots)): entry
+        for entry in scan.apps
+    }
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0))
+        for task in pending:
+            # The worker thread finishes in the background; its result is dropped
+            task.cancel()
+        for task in done:
+            if task.exception() is None:
+                tasks[task].index = task.result()
+        scan.truncated = scan.truncated or bool(pending)
+
+    scan.elapsed = time.monotonic() - start
+    return scan
@@ -1,6 +1,34 @@
 """Error intelligence modules."""
 
 from fastlane_mcp.errors.patterns import ERROR_PATTERNS, ErrorPattern
-from fastlane_mcp.errors.diagnosis import diagnose_error
+from fastlane_mcp.errors.matcher import PatternMatch, PatternMatcher, error_matcher
+from fastlane_mcp.errors.packs import PatternPackError, PatternRegistry, parse_pack, pattern_registry
+from fastlane_mcp.errors.diagnosis import RankedMatch, diagnose_error, pattern_diagnosis, rank_matches
+from fastlane_mcp.errors.streaming import EarlyAbort, StreamingDiagnoser, abort_patterns
+from fastlane_mcp.errors.history import (
+    FailureHistory, FailureSignature, failure_history, failure_signature, normalize_failure
+)
 
-__all__ = ["ERROR_PATTERNS", "ErrorPattern", "diagnose_error"]
+__all__ = [
+    "ERROR_PATTERNS",
+    "ErrorPattern",
+    "PatternMatch",
+    "PatternMatcher",
+    "error_matcher",
+    "PatternPackError",
+    "PatternRegistry",
+    "parse_pack",
+    "pattern_registry",
+    "diagnose_error",
+    "pattern_diagnosis",
+    "RankedMatch",
+    "rank_matches",
+    "EarlyAbort",
+    "StreamingDiagnoser",
+    "abort_patterns",
+    "FailureHistory",
+    "FailureSignature",
+    "failure_history",
+    "failure_signature",
+    "normalize_failure",
+]
@@ -1,13 +1,176 @@
 """Error diagnosis using pattern matching."""
 
-from fastlane_mcp.errors.patterns import ERROR_PATTERNS
+from dataclasses import dataclass
 
+from fastlane_mcp.errors.matcher import PatternMatch
+from fastlane_mcp.errors.packs import pattern_registry
+from fastlane_mcp.errors.patterns import ErrorPattern
 
-def diagnose_error(error_output: str) -> dict:
+# Lines of output shown before and after each match
+DEFAULT_CONTEXT_LINES = 2
+
+# Distinct patterns reported per diagnosis
+DEFAULT_MAX_MATCHES = 10
+
+# Context lines longer than this are cut (xcodebuild prints very long command lines)
+MAX_CONTEXT_LINE_LENGTH = 500
+
+# Characters encoded at a time when converting offsets to bytes
+ENCODE_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class RankedMatch:
+    """The first occurrence of a pattern and how often it occurred."""
+    match: PatternMatch
+    occurrences: int
+
+    @property
+    def pattern(self) -> ErrorPattern:
+        return self.match.pattern
+
+
+def rank_matches(matches: list[PatternMatch]) -> list[RankedMatch]:
+    """Order matched patterns by how likely each is to be the root cause.
+
+    Each pattern is represented by its first occurrence. More specific
+    patterns rank first; among equally specific ones, the earliest wins,
+    since later errors are often consequences of the first.
+
+    Args:
+        matches: Matches in any order
+
+    Returns:
+        One RankedMatch per pattern, best first
+    """
+    first: dict[str, RankedMatch] = {}
+    for match in sorted(matches, key=lambda m: m.start):
+        ranked = first.get(match.pattern.id)
+        if ranked is None:
+            first[match.pattern.id] = RankedMatch(match, 1)
+        else:
+            ranked.occurrences += 1
+    return sorted(first.values(), key=lambda r: (-r.pattern.specificity, r.match.start))
+
+
+def pattern_diagnosis(pattern: ErrorPattern) -> dict:
+    """Diagnosis dictionary for a recognized error pattern."""
+    return {
+        "matched": True,
+        "message": pattern.message,
+        "diagnosis": pattern.diagnosis,
+        "suggestions": pattern.suggestions,
+    }
+
+
+def match_details(
+    entry: RankedMatch,
+    line: int,
+    byte_start: int,
+    byte_end: int,
+    context: list[str]
+) -> dict:
+    """One entry of a diagnosis' matches list.
+
+    Args:
+        entry: The ranked match
+        line: 1-based line number of its first occurrence
+        byte_start: UTF-8 byte offset where the occurrence starts
+        byte_end: UTF-8 byte offset where it ends
+        context: Lines of output around it
+    """
+    match = entry.match
+    return {
+        "id": match.pattern.id,
+        "category": match.pattern.category,
+        "message": match.pattern.message,
+        "diagnosis": match.pattern.diagnosis,
+        "suggestions": match.pattern.suggestions,
+        "specificity": match.pattern.specificity,
+        "matched_text": match.text,
+        "line": line,
+        "byte_start": byte_start,
+        "byte_end": byte_end,
+        "occurrences": entry.occurrences,
+        "context": context,
+    }
+
+
+def clip_line(line: str) -> str:
+    """Cut a context line to MAX_CONTEXT_LINE_LENGTH characters."""
+    return line if len(line) <= MAX_CONTEXT_LINE_LENGTH else line[:MAX_CONTEXT_LINE_LENGTH] + "…"
+
+
+def _line_start(text: str, position: int, back: int) -> int:
+    """Offset of the start of the line `back` lines above position's line."""
+    for _ in range(back + 1):
+        newline = text.rfind("\n", 0, position)
+        if newline == -1:
+            return 0
+        position = newline
+    return position + 1
+
+
+def _line_end(text: str, position: int, forward: int) -> int:
+    """Offset of the end of the line `forward` lines below position's line."""
+    for _ in range(forward + 1):
+        newline = text.find("\n", position)
+        if newline == -1:
+            return len(text)
+        position = newline + 1
+    return position - 1
+
+
+def _context(text: str, match: PatternMatch, lines: int) -> list[str]:
+    """Lines around a match, sliced out without copying the rest of the text."""
+    begin = _line_start(text, match.start, lines)
+    end = _line_end(text, max(match.end - 1, match.start), lines)
+    return [clip_line(line) for line in text[begin:end].split("\n")]
+
+
+def utf8_length(text: str, start: int, end: int) -> int:
+    """UTF-8 length of text[start:end] without copying all of it at once."""
+    return sum(
+        len(text[chunk:min(chunk + ENCODE_CHUNK_SIZE, end)].encode())
+        for chunk in range(start, end, ENCODE_CHUNK_SIZE)
+    )
+
+
+def _locate(text: str, positions: list[int]) -> dict[int, tuple[int, int]]:
+    """Map character offsets to (byte offset, 1-based line number).
+
+    Walks the text once in position order, so locating many matches costs
+    no more than a single pass up to the last one.
+    """
+    located: dict[int, tuple[int, int]] = {}
+    ascii_only = text.isascii()
+    previous = 0
+    byte_offset = 0
+    line = 1
+    for position in sorted(set(positions)):
+        byte_offset += (position - previous) if ascii_only else utf8_length(text, previous, position)
+        line += text.count("\n", previous, position)
+        located[position] = (byte_offset, line)
+        previous = position
+    return located
+
+
+def diagnose_error(
+    error_output: str,
+    context_lines: int = DEFAULT_CONTEXT_LINES,
+    max_matches: int = DEFAULT_MAX_MATCHES
+) -> dict:
     """Match error output against known patterns.
 
+    The output is scanned once for all built-in and pattern pack patterns
+    (see PatternMatcher and PatternRegistry). Every
+    matching pattern is reported, ranked by rank_matches; the top-level
+    message, diagnosis and suggestions describe the best-ranked one.
+
     Args:
         error_output: The error text to diagnose
+        context_lines: Lines of output to include before and after each match
+        max_matches: Maximum number of matching patterns to report
 
     Returns:
         Dictionary with diagnosis information:
@@ -15,24 +178,32 @@ def diagnose_error(error_output: str) -> dict:
         - message: Human-readable error message
         - diagnosis: Explanation of what went wrong
         - suggestions: List of suggested fixes
+        - matches: Each matching pattern, best first, with the location
+          (UTF-8 byte offsets and line number) of its first occurrence,
+          how often it occurred and the surrounding lines
         - original: Original error (only if not matched)
     """
-    for pattern in ERROR_PATTERNS:
-        if pattern.pattern.search(error_output):
-            return {
-                "matched": True,
-                "message": pattern.message,
-                "diagnosis": pattern.diagnosis,
-                "suggestions": pattern.suggestions,
-            }
+    ranked = rank_matches(pattern_registry.matcher().find_all(error_output))[:max_matches]
+    if not ranked:
+        return {
+            "matched": False,
+            "message": "Build or command failed",
+            "diagnosis": "An unrecognized error occurred",
+            "suggestions": [
+                "Check the full error output below for details",
+                "Search for the error message online",
+            ],
+            "matches": [],
+            "original": error_output,
+        }
 
-    return {
-        "matched": False,
-        "message": "Build or command failed",
-        "diagnosis": "An unrecognized error occurred",
-        "suggestions": [
-            "Check the full error output below for details",
-            "Search for the error message online",
-        ],
-        "original": error_output,
-    }
+    located = _locate(error_output, [p for r in ranked for p in (r.match.start, r.match.end)])
+    matches = []
+    for entry in ranked:
+        match = entry.match
+        byte_start, line = located[match.start]
+        matches.append(match_details(
+            entry, line, byte_start, located[match.end][0], _context(error_output, match, context_lines)
+        ))
+
+    return {**pattern_diagnosis(ranked[0].pattern), "matches": matches}
@@ -0,0 +1,328 @@
+"""Remembering build failures across builds and server restarts."""
+
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastlane_mcp.errors.diagnosis import rank_matches
+from fastlane_mcp.errors.matcher import PatternMatch
+
+# Bumped whenever the schema changes; older databases are migrated by recreating them
+SCHEMA_VERSION = 2
+
+# Characters of the failing line stored as a sample
+MAX_SAMPLE_LENGTH = 500
+
+# Seconds to wait for another server process holding the database lock
+DB_TIMEOUT = 5.0
+
+# Seconds a run's log id is remembered to keep it from being recorded twice
+RUN_RETENTION = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS failures (
+    fingerprint TEXT NOT NULL,
+    project TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    pattern_id TEXT,
+    message TEXT NOT NULL,
+    sample TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (fingerprint, project, platform, lane)
+);
+CREATE TABLE IF NOT EXISTS builds (
+    project TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    last_success REAL,
+    PRIMARY KEY (project, platform, lane)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    log_id TEXT PRIMARY KEY,
+    recorded_at REAL NOT NULL
+);
+"""
+
+# Applied in order; each replaces volatile text with a placeholder
+_NORMALIZERS = [
+    (re.compile(r'\x1b\[[0-9;]*[A-Za-z]'), ''),
+    (re.compile(r'^\[\d{2}:\d{2}:\d{2}\]: '), ''),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?'), '<time>'),
+    (re.compile(r'\b\d{1,2}:\d{2}:\d{2}(?:\.\d+)?\b'), '<time>'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I), '<uuid>'),
+    (re.compile(r'\b[a-z][a-z0-9+.-]*://\S+', re.I), '<url>'),
+    (re.compile(r'(?:~|\.{1,2})?(?:/[^\s/\'":,()]+)+/?'), '<path>'),
+    (re.compile(r'\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{7,}\b', re.I), '<hex>'),
+    (re.compile(r'\d+(?:\.\d+)*'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def normalize_failure(text: str) -> str:
+    """Strip the parts of an error line that change from build to build.
+
+    Removes colors and fastlane timestamps, and replaces dates and times,
+    UUIDs, URLs, file paths, hex hashes and numbers (including line and
+    column numbers) with placeholders.
+
+    Args:
+        text: An error line
+
+    Returns:
+        The normalized, lowercased line
+    """
+    for pattern, replacement in _NORMALIZERS:
+        text = pattern.sub(replacement, text)
+    return text.strip().lower()
+
+
+@dataclass
+class FailureSignature:
+    """What identifies a failure across builds."""
+    fingerprint: str
+    pattern_id: str | None
+    message: str
+    sample: str
+
+
+def failure_signature(matches: list[PatternMatch], output: str) -> FailureSignature:
+    """Fingerprint a failed build.
+
+    Uses the line of the best-ranked pattern match (see rank_matches), or
+    the last non-empty line of output if no pattern matched.
+
+    Args:
+        matches: Pattern matches found in the build's output
+        output: Output tail, used when nothing matched
+
+    Returns:
+        The failure's signature
+    """
+    ranked = rank_matches(matches)
+    if ranked:
+        match = ranked[0].match
+        pattern_id, message, line = match.pattern.id, match.pattern.message, match.line or match.text
+    else:
+        lines = [line for line in output.splitlines() if line.strip()]
+        pattern_id, message, line = None, "Unrecognized failure", lines[-1] if lines else ""
+
+    normalized = normalize_failure(line)
+    digest = hashlib.sha256(f"{pattern_id or ''}\n{normalized}".encode()).hexdigest()[:16]
+    return FailureSignature(digest, pattern_id, message, line.strip()[:MAX_SAMPLE_LENGTH])
+
+
+def history_db_path() -> Path:
+    """SQLite database holding failure history.
+
+    Uses FASTLANE_MCP_HISTORY_DB if set, otherwise a file in the system
+    temp directory.
+    """
+    configured = os.environ.get("FASTLANE_MCP_HISTORY_DB")
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "fastlane-mcp-history.sqlite3"
+
+
+class FailureHistory:
+    """SQLite store of failure fingerprints and per-lane build counts.
+
+    Every build outcome is recorded per (project, platform, lane); failures
+    are additionally counted per fingerprint with first and last seen
+    times, so recurring failures can be listed without rescanning old logs.
+    A failure is flagged as flaky when its lane has succeeded since the
+    failure first appeared. Methods block; call them from a thread.
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        self._db_path = db_path
+        self._initialized: Path | None = None
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path or history_db_path()
+
+    def record_build(
+        self,
+        project: str,
+        platform: str,
+        lane: str,
+        failure: FailureSignature | None = None,
+        now: float | None = None,
+        log_id: str | None = None
+    ) -> None:
+        """Record a build outcome.
+
+        Args:
+            project: Project path
+            platform: Platform (ios or android)
+            lane: Lane name
+            failure: The failure's signature, or None if the build succeeded
+            now: Timestamp to record (default: the current time)
+            log_id: The run's log id; a run shared by several callers is
+                only recorded by the first of them
+        """
+        now = time.time() if now is None else now
+        with self._connect() as db:
+            if log_id is not None:
+                db.execute("DELETE FROM runs WHERE recorded_at < ?", (now - RUN_RETENTION,))
+                inserted = db.execute(
+                    "INSERT OR IGNORE INTO runs (log_id, recorded_at) VALUES (?, ?)", (log_id, now)
+                )
+                if inserted.rowcount == 0:
+                    return
+            db.execute(
+                """
+                INSERT INTO builds (project, platform, lane, total, failed, last_success)
+                VALUES (?, ?, ?, 1, ?, ?)
+                ON CONFLICT (project, platform, lane) DO UPDATE SET
+                    total = total + 1,
+                    failed = failed + excluded.failed,
+                    last_success = COALESCE(excluded.last_success, last_success)
+                """,
+                (project, platform, lane, int(failure is not None), None if failure else now),
+            )
+            if failure is not None:
+                db.execute(
+                    """
+                    INSERT INTO failures (fingerprint, project, platform, lane, pattern_id,
+                                          message, sample, count, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT (fingerprint, project, platform, lane) DO UPDATE SET
+                        count = count + 1,
+                        sample = excluded.sample,
+                        last_seen = excluded.last_seen
+                    """,
+                    (failure.fingerprint, project, platform, lane, failure.pattern_id,
+                     failure.message, failure.sample, now, now),
+                )
+
+    async def record(
+        self,
+        project: str,
+        platform: str,
+        lane: str,
+        failure: FailureSignature | None = None,
+        log_id: str | None = None
+    ) -> None:
+        """Record a build outcome from async code; history is best effort.
+
+        Runs record_build in a thread and ignores database errors, so an
+        unwritable or locked database never fails a build.
+        """
+        try:
+            await asyncio.to_thread(self.record_build, project, platform, lane, failure, log_id=log_id)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def recurring(
+        self,
+        project: str | None = None,
+        platform: str | None = None,
+        lane: str | None = None,
+        min_count: int = 2,
+        since: float | None = None,
+        limit: int = 20
+    ) -> list[dict]:
+        """Most frequent failures, most recurring first.
+
+        Args:
+            project: Only failures of this project
+            platform: Only failures on this platform
+            lane: Only failures of this lane
+            min_count: Minimum number of occurrences
+            since: Only failures seen at or after this timestamp
+            limit: Maximum number of failures
+
+        Returns:
+            One dict per (fingerprint, project, platform, lane)
+        """
+        conditions = ["f.count >= ?"]
+        params: list = [min_count]
+        for column, value in (("project", project), ("platform", platform), ("lane", lane)):
+            if value is not None:
+                conditions.append(f"f.{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("f.last_seen >= ?")
+            params.append(since)
+        params.append(limit)
+
+        with self._connect() as db:
+            rows = db.execute(
+                f"""
+                SELECT f.fingerprint, f.pattern_id, f.message, f.sample, f.count,
+                       f.first_seen, f.last_seen, f.project, f.platform, f.lane,
+                       b.total, b.failed, b.last_success
+                FROM failures f
+                LEFT JOIN builds b USING (project, platform, lane)
+                WHERE {' AND '.join(conditions)}
+                ORDER BY f.count DESC, f.last_seen DESC
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+
+        return [
+            {
+                "fingerprint": row["fingerprint"],
+                "pattern_id": row["pattern_id"],
+                "message": row["message"],
+                "sample": row["sample"],
+                "count": row["count"],
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+                "project": row["project"],
+                "platform": row["platform"],
+                "lane": row["lane"],
+                "lane_builds": row["total"] or 0,
+                "lane_failures": row["failed"] or 0,
+                "flaky": row["last_success"] is not None and row["last_success"] > row["first_seen"],
+            }
+            for row in rows
+        ]
+
+    def clear(self) -> None:
+        """Delete all recorded history."""
+        with self._connect() as db:
+            db.execute("DELETE FROM failures")
+            db.execute("DELETE FROM builds")
+            db.execute("DELETE FROM runs")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the database, creating its tables on first use, and commit on exit."""
+        path = self.db_path
+        if self._initialized != path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(path, timeout=DB_TIMEOUT)
+        try:
+            db.row_factory = sqlite3.Row
+            if self._initialized != path:
+                # Several server processes may share the database
+                db.execute("PRAGMA journal_mode = WAL")
+                with db:
+                    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                        db.executescript("DROP TABLE IF EXISTS failures; DROP TABLE IF EXISTS builds; DROP TABLE IF EXISTS runs;")
+                        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                    db.executescript(_SCHEMA)
+                self._initialized = path
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+failure_history = FailureHistory()
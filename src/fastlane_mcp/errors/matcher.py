@@ -0,0 +1,292 @@
+"""Finding every known error pattern in a build log in one pass."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from fastlane_mcp.errors.patterns import ERROR_PATTERNS, ErrorPattern
+
+# Shorter fragments match too many lines to be worth prefiltering on
+MIN_LITERAL_LENGTH = 3
+
+# Characters lowercased at a time; lowercasing non-ASCII text briefly
+# needs about twelve bytes per character
+LOWER_CHUNK_SIZE = 256 * 1024
+
+_QUANTIFIERS = "*?{"
+_RUN_BREAKERS = ".^$|"
+
+# Newlines, escapes and negated classes that can match a newline; patterns
+# containing them may span lines, which line-by-line matching would miss
+_CROSSES_LINES = re.compile(r"\n|\\[nsWDx0]|\[\^")
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One occurrence of an error pattern in a log."""
+    pattern: ErrorPattern
+    start: int
+    end: int
+    text: str
+    # The whole line the match starts on
+    line: str = ""
+
+
+def _split_branches(source: str) -> list[str] | None:
+    """Split a regex on its top-level `|`, or None if it can't be parsed."""
+    branches = []
+    depth = 0
+    begin = 0
+    i = 0
+    while i < len(source):
+        c = source[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = _skip_class(source, i)
+            if i < 0:
+                return None
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif c == "|" and depth == 0:
+            branches.append(source[begin:i])
+            begin = i + 1
+        i += 1
+    if depth != 0:
+        return None
+    branches.append(source[begin:])
+    return branches
+
+
+def _skip_class(source: str, i: int) -> int:
+    """Index just past the character class opening at source[i], or -1."""
+    i += 1
+    if i < len(source) and source[i] == "^":
+        i += 1
+    if i < len(source) and source[i] == "]":
+        i += 1
+    while i < len(source):
+        if source[i] == "\\":
+            i += 2
+            continue
+        if source[i] == "]":
+            return i + 1
+        i += 1
+    return -1
+
+
+def _longest_required_run(branch: str) -> str:
+    """Longest literal text every match of a regex branch must contain.
+
+    Only text outside groups counts, and a character followed by a
+    quantifier that allows zero repetitions is not required.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+
+    def end_run() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    depth = 0
+    i = 0
+    while i < len(branch):
+        c = branch[i]
+        if c == "\\":
+            escaped = branch[i + 1:i + 2]
+            i += 2
+            # \d, \s, \b, \1 and friends are classes or assertions, not literals
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+            else:
+                end_run()
+            continue
+        if c == "[":
+            end_run()
+            i = _skip_class(branch, i)
+            if i < 0:
+                return ""
+            continue
+        if c == "(":
+            depth += 1
+            end_run()
+        elif c == ")":
+            depth -= 1
+            end_run()
+        elif c in _QUANTIFIERS:
+            if current:
+                current.pop()
+            end_run()
+        elif c == "+":
+            end_run()
+        elif c in _RUN_BREAKERS:
+            end_run()
+        elif depth == 0:
+            current.append(c)
+        i += 1
+    end_run()
+    return max(runs, key=len, default="")
+
+
+# Matchers are rebuilt whenever a pattern pack changes; unchanged patterns are not re-analyzed
+@lru_cache(maxsize=4096)
+def required_literals(pattern: re.Pattern) -> list[str] | None:
+    """Lowercase fragments of which every match contains at least one.
+
+    Args:
+        pattern: Compiled error pattern
+
+    Returns:
+        One fragment per top-level alternative, or None when some
+        alternative has no usable literal or a match may span several
+        lines (the pattern is then searched for without prefiltering)
+    """
+    if pattern.flags & (re.VERBOSE | re.DOTALL):
+        return None
+    source = pattern.pattern
+    if _CROSSES_LINES.search(source):
+        return None
+    # Line-by-line matching changes what ^ and $ mean unless they already mean line boundaries
+    if ("^" in source or "$" in source) and not pattern.flags & re.MULTILINE:
+        return None
+    branches = _split_branches(source)
+    if branches is None:
+        return None
+
+    literals = []
+    for branch in branches:
+        run = _longest_required_run(branch)
+        if len(run) < MIN_LITERAL_LENGTH:
+            return None
+        literals.append(run.lower())
+    return literals
+
+
+def _line_at(text: str, position: int) -> str:
+    """The line of text containing position, without its newline."""
+    start = text.rfind("\n", 0, position) + 1
+    end = text.find("\n", position)
+    return text[start:end if end != -1 else len(text)]
+
+
+def _minimal(literals: set[str]) -> list[str]:
+    """Drop fragments that contain another fragment; the shorter one finds them."""
+    ordered = sorted(literals, key=len)
+    kept: list[str] = []
+    for literal in ordered:
+        if not any(shorter in literal for shorter in kept):
+            kept.append(literal)
+    return kept
+
+
+class PatternMatcher:
+    """Finds all occurrences of a set of error patterns in a log.
+
+    Instead of running every pattern's regex over the whole log (each one a
+    slow case-insensitive scan), each pattern is reduced to literal
+    fragments that every match must contain. The lowercased log is searched
+    for those fragments with str.find, which is far faster than a regex,
+    and only the lines containing a fragment are handed to the regexes of
+    the patterns that fragment belongs to. Patterns are matched within a
+    line; patterns with no usable fragment, or whose matches may span
+    lines, are searched for in full. The
+    log is lowercased a chunk of lines at a time to bound memory.
+    """
+
+    def __init__(self, patterns: list[ErrorPattern]):
+        self.patterns = list(patterns)
+        self._order = {id(pattern): index for index, pattern in enumerate(self.patterns)}
+        self._literals: dict[int, list[str]] = {}
+        self._unfiltered: list[ErrorPattern] = []
+        for pattern in self.patterns:
+            literals = required_literals(pattern.pattern)
+            if literals is None:
+                self._unfiltered.append(pattern)
+            else:
+                self._literals[id(pattern)] = literals
+        self._filtered = [pattern for pattern in self.patterns if id(pattern) in self._literals]
+        self._scan_literals = _minimal({
+            literal for literals in self._literals.values() for literal in literals
+        })
+
+    def find_all(self, text: str) -> list[PatternMatch]:
+        """Find every match of every pattern.
+
+        Args:
+            text: Log output to search
+
+        Returns:
+            Matches ordered by position, then by pattern order
+        """
+        matches = [self._search(pattern, text) for pattern in self._unfiltered]
+        for base, end in self._chunks(text):
+            lowered = text[base:end].lower()
+            if len(lowered) != end - base:
+                # Some characters change length when lowercased, so offsets
+                # into the lowered copy would be wrong; search the slow way
+                matches.extend(self._search(pattern, text, base, end) for pattern in self._filtered)
+                continue
+            for start, stop in self._candidate_lines(lowered):
+                line = lowered[start:stop]
+                for pattern in self._filtered:
+                    if any(literal in line for literal in self._literals[id(pattern)]):
+                        matches.append(self._search_line(pattern, text, base + start, base + stop))
+        return self._sorted(matches)
+
+    def matched_patterns(self, text: str) -> list[ErrorPattern]:
+        """Patterns that occur anywhere in text, in pattern order."""
+        found = {id(match.pattern) for match in self.find_all(text)}
+        return [pattern for pattern in self.patterns if id(pattern) in found]
+
+    def _candidate_lines(self, lowered: str) -> list[tuple[int, int]]:
+        """Spans of the lines that contain at least one fragment."""
+        lines: set[tuple[int, int]] = set()
+        for literal in self._scan_literals:
+            index = lowered.find(literal)
+            while index != -1:
+                start = lowered.rfind("\n", 0, index) + 1
+                end = lowered.find("\n", index + len(literal))
+                if end == -1:
+                    end = len(lowered)
+                lines.add((start, end))
+                index = lowered.find(literal, end)
+        return sorted(lines)
+
+    @staticmethod
+    def _chunks(text: str):
+        """Spans of about LOWER_CHUNK_SIZE characters that end after a newline."""
+        start = 0
+        while start < len(text):
+            end = text.find("\n", start + LOWER_CHUNK_SIZE)
+            end = len(text) if end == -1 else end + 1
+            yield start, end
+            start = end
+
+    @staticmethod
+    def _search(pattern: ErrorPattern, text: str, start: int = 0, end: int | None = None) -> list[PatternMatch]:
+        matches = pattern.pattern.finditer(text, start) if end is None else pattern.pattern.finditer(text, start, end)
+        return [PatternMatch(pattern, m.start(), m.end(), m.group(0), _line_at(text, m.start())) for m in matches]
+
+    @staticmethod
+    def _search_line(pattern: ErrorPattern, text: str, start: int, end: int) -> list[PatternMatch]:
+        """Search the single line text[start:end]."""
+        found = list(pattern.pattern.finditer(text, start, end))
+        line = text[start:end] if found else ""
+        return [PatternMatch(pattern, m.start(), m.end(), m.group(0), line) for m in found]
+
+    def _sorted(self, groups) -> list[PatternMatch]:
+        matches = [match for group in groups for match in group]
+        matches.sort(key=lambda match: (match.start, self._order[id(match.pattern)]))
+        return matches
+
+
+# The built-in patterns only; tools use pattern_registry (errors/packs.py),
+# which adds the configured pattern packs
+error_matcher = PatternMatcher(ERROR_PATTERNS)
@@ -0,0 +1,275 @@
+"""Loading additional error patterns from pattern pack files."""
+
+import hashlib
+import os
+import re
+import time
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastlane_mcp.errors.matcher import PatternMatcher
+from fastlane_mcp.errors.patterns import ERROR_PATTERNS, ErrorPattern
+
+# Pack file formats by suffix
+PACK_SUFFIXES = {".toml": "toml", ".yaml": "yaml", ".yml": "yaml"}
+
+# Seconds between checks of the pack directory for changes
+DEFAULT_CHECK_INTERVAL = 2.0
+
+_REQUIRED_FIELDS = ("id", "pattern", "category", "message", "diagnosis")
+_OPTIONAL_FIELDS = ("suggestions", "specificity", "ignore_case", "multiline")
+_ID = re.compile(r"^[a-z0-9_.-]+$")
+
+
+class PatternPackError(Exception):
+    """A pattern pack that cannot be read or fails validation."""
+
+
+def pattern_dir() -> Path | None:
+    """Directory of pattern packs from FASTLANE_MCP_PATTERN_DIR, if set."""
+    configured = os.environ.get("FASTLANE_MCP_PATTERN_DIR")
+    return Path(configured) if configured else None
+
+
+def _load_document(data: bytes, fmt: str) -> object:
+    if fmt == "toml":
+        return tomllib.loads(data.decode())
+    try:
+        import yaml
+    except ImportError:
+        raise PatternPackError("PyYAML is required for YAML pattern packs (pip install 'fastlane-mcp[yaml]')")
+    return yaml.safe_load(data)
+
+
+def _build_pattern(entry: object, number: int) -> ErrorPattern:
+    """Validate one pattern definition and compile its regex."""
+    where = f"pattern #{number}"
+    if not isinstance(entry, dict):
+        raise PatternPackError(f"{where}: must be a table of fields")
+    if isinstance(entry.get("id"), str):
+        where = f"pattern {entry['id']!r}"
+
+    unknown = sorted(set(entry) - set(_REQUIRED_FIELDS) - set(_OPTIONAL_FIELDS))
+    if unknown:
+        raise PatternPackError(f"{where}: unknown field(s): {', '.join(unknown)}")
+    for name in _REQUIRED_FIELDS:
+        value = entry.get(name)
+        if not isinstance(value, str) or not value.strip():
+            raise PatternPackError(f"{where}: '{name}' must be a non-empty string")
+    if not _ID.match(entry["id"]):
+        raise PatternPackError(f"{where}: 'id' may only contain lowercase letters, digits, '_', '-' and '.'")
+
+    suggestions = entry.get("suggestions", [])
+    if not isinstance(suggestions, list) or not all(isinstance(s, str) for s in suggestions):
+        raise PatternPackError(f"{where}: 'suggestions' must be a list of strings")
+    specificity = entry.get("specificity", 50)
+    if isinstance(specificity, bool) or not isinstance(specificity, int) or not 0 <= specificity <= 100:
+        raise PatternPackError(f"{where}: 'specificity' must be an integer from 0 to 100")
+    for name in ("ignore_case", "multiline"):
+        if not isinstance(entry.get(name, False), bool):
+            raise PatternPackError(f"{where}: '{name}' must be true or false")
+
+    flags = 0
+    if entry.get("ignore_case", True):
+        flags |= re.IGNORECASE
+    if entry.get("multiline", False):
+        flags |= re.MULTILINE
+    try:
+        regex = re.compile(entry["pattern"], flags)
+    except re.error as e:
+        raise PatternPackError(f"{where}: invalid regex: {e}")
+
+    return ErrorPattern(
+        id=entry["id"],
+        pattern=regex,
+        category=entry["category"],
+        message=entry["message"],
+        diagnosis=entry["diagnosis"],
+        suggestions=list(suggestions),
+        specificity=specificity,
+    )
+
+
+def parse_pack(data: bytes, fmt: str) -> list[ErrorPattern]:
+    """Parse and validate a pattern pack.
+
+    A pack is a TOML or YAML document with a `patterns` list; each entry
+    has the ErrorPattern fields (id, pattern, category, message, diagnosis,
+    and optionally suggestions and specificity) plus `ignore_case`
+    (default true) and `multiline` (default false) regex flags.
+
+    Args:
+        data: File contents
+        fmt: "toml" or "yaml"
+
+    Returns:
+        The pack's patterns, with regexes compiled
+
+    Raises:
+        PatternPackError: If the pack cannot be parsed or any pattern is invalid
+    """
+    try:
+        document = _load_document(data, fmt)
+    except PatternPackError:
+        raise
+    except Exception as e:
+        raise PatternPackError(f"cannot parse {fmt.upper()}: {e}")
+
+    if not isinstance(document, dict) or not isinstance(document.get("patterns"), list):
+        raise PatternPackError("expected a top-level 'patterns' list")
+
+    patterns = [_build_pattern(entry, number) for number, entry in enumerate(document["patterns"], 1)]
+    seen: set[str] = set()
+    for pattern in patterns:
+        if pattern.id in seen:
+            raise PatternPackError(f"pattern {pattern.id!r}: defined more than once")
+        seen.add(pattern.id)
+    return patterns
+
+
+@dataclass
+class _PackFile:
+    """What was loaded from one pack file, and the file state it came from."""
+    mtime_ns: int
+    size: int
+    digest: str | None
+    # The last valid version of the pack; kept when an edit breaks it
+    patterns: list[ErrorPattern] = field(default_factory=list)
+    error: str | None = None
+
+
+class PatternRegistry:
+    """The built-in patterns combined with every pattern pack in a directory.
+
+    Packs are validated and compiled when first loaded and the combined
+    PatternMatcher is built once. matcher() looks for added, removed or
+    modified packs at most every check_interval seconds and rebuilds the
+    matcher only if something changed, so packs can be edited without
+    restarting the server. A file whose mtime or size changed is re-read
+    and hashed, but only parsed and compiled again if its contents hash
+    differently from every pack already loaded.
+
+    A pack that fails validation is skipped as a whole (or, if it was
+    valid before, its previous version is kept) and its error is reported
+    in errors. Pack patterns whose id is already taken by a built-in or an
+    earlier pack (in file name order) are skipped.
+    """
+
+    def __init__(
+        self,
+        builtin: list[ErrorPattern] = ERROR_PATTERNS,
+        directory: Path | None = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL
+    ):
+        self.builtin = list(builtin)
+        self.check_interval = check_interval
+        self.errors: dict[str, str] = {}
+        self._duplicate_errors: dict[str, str] = {}
+        self._directory = directory
+        self._loaded_directory: Path | None = None
+        self._files: dict[Path, _PackFile] = {}
+        self._compiled: dict[str, list[ErrorPattern]] = {}
+        self._matcher = PatternMatcher(self.builtin)
+        self._checked_at: float | None = None
+
+    @property
+    def directory(self) -> Path | None:
+        return self._directory or pattern_dir()
+
+    def matcher(self) -> PatternMatcher:
+        """The current matcher, reloading packs first if a check is due."""
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            self.reload()
+        return self._matcher
+
+    def reload(self) -> bool:
+        """Pick up added, removed and modified packs now.
+
+        Returns:
+            True if the set of patterns changed
+        """
+        directory = self.directory
+        paths = self._pack_paths(directory)
+        changed = directory != self._loaded_directory or set(paths) != set(self._files)
+
+        files: dict[Path, _PackFile] = {}
+        for path in paths:
+            previous = self._files.get(path) if directory == self._loaded_directory else None
+            loaded = self._load(path, previous)
+            if loaded is None:
+                changed = changed or previous is not None
+                continue
+            files[path] = loaded
+            changed = changed or previous is None or loaded.patterns is not previous.patterns
+
+        self._loaded_directory = directory
+        self._files = files
+        self._compiled = {f.digest: f.patterns for f in files.values() if f.digest and f.error is None}
+        if changed:
+            self._combine()
+        else:
+            self.errors = {**self._duplicate_errors, **self._file_errors()}
+        return changed
+
+    def _load(self, path: Path, previous: _PackFile | None) -> _PackFile | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if previous is not None and (previous.mtime_ns, previous.size) == (stat.st_mtime_ns, stat.st_size):
+            return previous
+
+        kept = previous.patterns if previous is not None else []
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            return _PackFile(stat.st_mtime_ns, stat.st_size, None, kept, f"cannot read: {e}")
+
+        digest = hashlib.sha256(data).hexdigest()
+        if previous is not None and digest == previous.digest:
+            return _PackFile(stat.st_mtime_ns, stat.st_size, digest, previous.patterns, previous.error)
+        patterns = self._compiled.get(digest)
+        if patterns is None:
+            try:
+                patterns = parse_pack(data, PACK_SUFFIXES[path.suffix.lower()])
+            except PatternPackError as e:
+                return _PackFile(stat.st_mtime_ns, stat.st_size, digest, kept, str(e))
+        return _PackFile(stat.st_mtime_ns, stat.st_size, digest, patterns)
+
+    def _combine(self) -> None:
+        patterns = list(self.builtin)
+        owners = {pattern.id: "the built-in patterns" for pattern in patterns}
+        self._duplicate_errors = {}
+        for path, pack in self._files.items():
+            for pattern in pack.patterns:
+                if pattern.id in owners:
+                    self._duplicate_errors.setdefault(
+                        str(path), f"pattern {pattern.id!r}: already defined by {owners[pattern.id]}"
+                    )
+                    continue
+                owners[pattern.id] = path.name
+                patterns.append(pattern)
+        self.errors = {**self._duplicate_errors, **self._file_errors()}
+        self._matcher = PatternMatcher(patterns)
+
+    def _file_errors(self) -> dict[str, str]:
+        return {str(path): pack.error for path, pack in self._files.items() if pack.error}
+
+    @staticmethod
+    def _pack_paths(directory: Path | None) -> list[Path]:
+        if directory is None:
+            return []
+        try:
+            return sorted(
+                path for path in directory.iterdir()
+                if path.suffix.lower() in PACK_SUFFIXES and path.is_file()
+            )
+        except OSError:
+            return []
+
+
+# Packs load on first use and are rechecked periodically; the CLI loads them before serving
+pattern_registry = PatternRegistry()
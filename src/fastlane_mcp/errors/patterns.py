@@ -13,6 +13,9 @@ class ErrorPattern:
     message: str
     diagnosis: str
     suggestions: list[str]
+    # How precisely a match identifies the root cause; catch-all patterns
+    # such as timeouts rank below anything more specific
+    specificity: int = 50
 
 
 ERROR_PATTERNS = [
@@ -97,7 +100,8 @@ ERROR_PATTERNS = [
             "Run './gradlew clean' and try again",
             "Check build.gradle for dependency conflicts",
             "Verify your Android SDK and build tools are up to date",
-        ]
+        ],
+        specificity=20,
     ),
     ErrorPattern(
         id="android_sdk_not_found",
@@ -156,6 +160,7 @@ ERROR_PATTERNS = [
             "Check your network connection",
             "Increase timeout settings if building large projects",
             "Try again - this may be a temporary issue",
-        ]
+        ],
+        specificity=10,
     ),
 ]
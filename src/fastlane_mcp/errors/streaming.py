@@ -0,0 +1,233 @@
+"""Diagnosing build output while the build is still running."""
+
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import replace
+
+from fastlane_mcp.errors.diagnosis import (
+    DEFAULT_MAX_MATCHES,
+    clip_line,
+    match_details,
+    pattern_diagnosis,
+    rank_matches,
+    utf8_length,
+)
+from fastlane_mcp.errors.matcher import PatternMatch, PatternMatcher
+from fastlane_mcp.errors.packs import pattern_registry
+
+# Patterns after which a build cannot succeed, stopped on when early abort is requested
+DEFAULT_ABORT_PATTERNS = (
+    "no_signing_certificate",
+    "no_provisioning_profile",
+    "xcode_not_selected",
+    "android_sdk_not_found",
+)
+
+# Characters of an unfinished line held back before it is matched anyway
+DEFAULT_WINDOW = 64 * 1024
+
+# Matches remembered per build; later ones are counted but not kept
+MAX_MATCHES = 1000
+
+# Characters of lines from feed_line buffered before they are matched together
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+# Seconds after which buffered lines are matched even if the batch is not full
+FLUSH_INTERVAL = 0.5
+
+
+def abort_patterns() -> frozenset[str]:
+    """Pattern ids that stop a build early.
+
+    Uses the comma-separated FASTLANE_MCP_ABORT_PATTERNS if set, otherwise
+    DEFAULT_ABORT_PATTERNS.
+    """
+    configured = os.environ.get("FASTLANE_MCP_ABORT_PATTERNS")
+    if configured is None:
+        return frozenset(DEFAULT_ABORT_PATTERNS)
+    return frozenset(name.strip() for name in configured.split(",") if name.strip())
+
+
+class EarlyAbort(Exception):
+    """Raised from a line callback to stop a build that is certain to fail.
+
+    The executor kills the fastlane process when a line callback raises,
+    and the exception propagates to whoever started the build.
+    """
+
+    def __init__(self, match: PatternMatch):
+        super().__init__(f"Build stopped early: {match.pattern.message} (matched {match.text!r})")
+        self.match = match
+
+
+class StreamingDiagnoser:
+    """Matches error patterns incrementally as output arrives.
+
+    Output can be fed as whole lines (feed_line, a LineCallback for the
+    executor) or as arbitrary chunks (feed). Lines are buffered and matched
+    a batch at a time, since matching costs about as much per call as per
+    line; a batch is matched once it holds batch_size characters, once
+    FLUSH_INTERVAL has passed since the last one, when a line contains an
+    abort pattern, or on close(). Only complete lines are
+    reported; the unfinished tail of a chunk is carried over and matched
+    together with the next chunk, so a line split across chunks is still
+    recognized. A tail longer than window characters is matched as it
+    stands to bound memory.
+
+    Match offsets are character offsets into everything fed so far. The
+    line number and UTF-8 byte offsets of each kept match are tracked too,
+    so a diagnosis can point into the spooled build log without reading
+    it back (as long as the diagnoser was fed from the start of the run).
+    """
+
+    def __init__(
+        self,
+        matcher: PatternMatcher | None = None,
+        abort_on: Iterable[str] = (),
+        window: int = DEFAULT_WINDOW,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.matcher = matcher or pattern_registry.matcher()
+        self.abort_on = frozenset(abort_on)
+        self.window = window
+        self.batch_size = batch_size
+        self.matches: list[PatternMatch] = []
+        self.match_count = 0
+        self.aborted: PatternMatch | None = None
+        self._pending = ""
+        self._offset = 0
+        # Line number and byte offset at self._offset
+        self._line = 1
+        self._bytes = 0
+        # (pattern id, start) of each kept match -> (line, byte start, byte end)
+        self._locations: dict[tuple[str, int], tuple[int, int, int]] = {}
+        # Lines from feed_line not matched yet
+        self._lines: list[str] = []
+        self._buffered = 0
+        self._flushed_at = time.monotonic()
+        # Checks each line for abort patterns only, so aborts are not delayed by batching
+        abort = [pattern for pattern in self.matcher.patterns if pattern.id in self.abort_on]
+        self._abort_matcher = PatternMatcher(abort) if abort else None
+
+    def feed(self, chunk: str) -> list[PatternMatch]:
+        """Consume a chunk of output.
+
+        Args:
+            chunk: Output text, not necessarily ending at a line boundary
+
+        Returns:
+            Matches completed by this chunk
+
+        Raises:
+            EarlyAbort: If a match belongs to one of the abort_on patterns
+        """
+        text = self._pending + self._take_lines() + chunk
+        cut = text.rfind("\n") + 1
+        if cut == 0 and len(text) > self.window:
+            cut = len(text)
+        return self._scan(text, cut)
+
+    def feed_line(self, stream: str, line: str) -> None:
+        """LineCallback that feeds one complete line from either stream.
+
+        Raises:
+            EarlyAbort: If the line contains one of the abort_on patterns
+        """
+        self._lines.append(line)
+        self._buffered += len(line) + 1
+        if (
+            self._buffered >= self.batch_size
+            or time.monotonic() - self._flushed_at >= FLUSH_INTERVAL
+            or (self._abort_matcher is not None and self._abort_matcher.find_all(line))
+        ):
+            self.flush()
+
+    def flush(self) -> list[PatternMatch]:
+        """Match the lines buffered by feed_line.
+
+        Returns:
+            Matches completed by the buffered lines
+        """
+        return self.feed("") if self._lines else []
+
+    def close(self) -> list[PatternMatch]:
+        """Match buffered lines and whatever unfinished line is left once output has ended."""
+        text = self._pending + self._take_lines()
+        return self._scan(text, len(text))
+
+    def pattern_ids(self) -> list[str]:
+        """Ids of the patterns seen so far, in the order first seen."""
+        return list(dict.fromkeys(match.pattern.id for match in self.matches))
+
+    def diagnosis(self, max_matches: int = DEFAULT_MAX_MATCHES) -> dict | None:
+        """Diagnosis in diagnose_error's format, or None if nothing matched.
+
+        An abort pattern wins; otherwise the best match by rank_matches.
+        Each reported match's context is the line it was found on.
+
+        Args:
+            max_matches: Maximum number of matching patterns to report
+        """
+        ranked = rank_matches(self.matches)
+        if self.aborted is not None:
+            ranked.sort(key=lambda entry: entry.pattern.id != self.aborted.pattern.id)
+            top = self.aborted.pattern
+        elif ranked:
+            top = ranked[0].pattern
+        else:
+            return None
+
+        matches = []
+        for entry in ranked[:max_matches]:
+            match = entry.match
+            line, byte_start, byte_end = self._locations[match.pattern.id, match.start]
+            matches.append(match_details(entry, line, byte_start, byte_end, [clip_line(match.line)]))
+        return {**pattern_diagnosis(top), "matches": matches}
+
+    def _take_lines(self) -> str:
+        if not self._lines:
+            return ""
+        text = "\n".join(self._lines) + "\n"
+        self._lines.clear()
+        self._buffered = 0
+        self._flushed_at = time.monotonic()
+        return text
+
+    def _scan(self, text: str, cut: int) -> list[PatternMatch]:
+        # The carried-over tail is scanned too so matches starting before
+        # the cut are complete, but only those are reported now
+        found = sorted(
+            (
+                replace(match, start=match.start + self._offset, end=match.end + self._offset)
+                for match in self.matcher.find_all(text)
+                if match.start < cut
+            ),
+            key=lambda match: match.start,
+        ) if cut else []
+        kept = found[:max(MAX_MATCHES - len(self.matches), 0)]
+
+        # Locate kept matches in one pass over the text before them
+        ascii_only = text.isascii()
+        line, byte_offset, previous = self._line, self._bytes, 0
+        for match in kept:
+            start = match.start - self._offset
+            line += text.count("\n", previous, start)
+            byte_offset += (start - previous) if ascii_only else utf8_length(text, previous, start)
+            previous = start
+            self._locations[match.pattern.id, match.start] = (
+                line, byte_offset, byte_offset + len(match.text.encode())
+            )
+
+        self._line += text.count("\n", 0, cut)
+        self._bytes += cut if ascii_only else utf8_length(text, 0, cut)
+        self._pending = text[cut:]
+        self._offset += cut
+
+        self.match_count += len(found)
+        self.matches.extend(kept)
+        for match in found:
+            if match.pattern.id in self.abort_on and self.aborted is None:
+                self.aborted = match
+                raise EarlyAbort(match)
+        return found
@@ -1,5 +1,11 @@
 """Plugin registry and search functionality."""
 
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 
@@ -77,31 +83,118 @@ PLUGIN_CATALOG: dict[str, dict] = {
 }
 
 
-def search_plugins(query: str) -> list[PluginInfo]:
-    """Search plugins by name or description.
+# Term weight of each field: a hit in a plugin's name says more than one in its description
+FIELD_WEIGHTS = {"name": 3.0, "signals": 2.0, "capabilities": 2.0, "description": 1.0}
+
+# Score factor for a query term matching only the start of an indexed term
+PREFIX_WEIGHT = 0.6
+
+DEFAULT_SEARCH_LIMIT = 20
+
+# BM25 term frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Every catalog name starts with this; indexing it would match every plugin
+_NAME_PREFIX = "fastlane-plugin-"
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric runs of text; `_`, `-` and spaces all separate words."""
+    return _TOKEN.findall(text.lower())
+
+
+class PluginIndex:
+    """Inverted index over plugin names, descriptions, signals and capabilities.
+
+    Built once from a catalog; each query then only touches the postings of
+    its own terms (and of indexed terms it is a prefix of), and ranks the
+    plugins with BM25 over field-weighted term frequencies.
+    """
+
+    def __init__(self, catalog: dict[str, dict]):
+        self.names = list(catalog)
+        postings: dict[str, list[tuple[int, float]]] = {}
+        lengths: list[float] = []
+        for doc, (name, info) in enumerate(catalog.items()):
+            fields = {
+                "name": [name.removeprefix(_NAME_PREFIX)],
+                "description": [info["description"]],
+                "signals": info["signals"],
+                "capabilities": info["capabilities"],
+            }
+            frequencies: Counter[str] = Counter()
+            for field, texts in fields.items():
+                for text in texts:
+                    for token in _tokenize(text):
+                        frequencies[token] += FIELD_WEIGHTS[field]
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append((doc, frequency))
+            lengths.append(sum(frequencies.values()))
+
+        average = sum(lengths) / len(lengths) if lengths else 1.0
+        count = len(self.names)
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._idf = {
+            term: math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in postings.items()
+        }
+        self._norms = [BM25_K1 * (1 - BM25_B + BM25_B * length / average) for length in lengths]
+
+    def _expand(self, token: str) -> Iterator[tuple[str, float]]:
+        """Indexed terms starting with token, with their score factor."""
+        i = bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            term = self._vocabulary[i]
+            yield term, 1.0 if term == token else PREFIX_WEIGHT
+            i += 1
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[tuple[str, float]]:
+        """Names and scores of the best plugins for query, best first.
+
+        A plugin matches when any query term equals or starts one of its
+        indexed terms. Ties keep catalog order; a query without any terms
+        returns the catalog in order.
+        """
+        tokens = list(dict.fromkeys(_tokenize(query)))
+        if not tokens:
+            return [(name, 0.0) for name in self.names[:limit]]
+
+        scores: dict[int, float] = {}
+        for token in tokens:
+            # Count each query term once per plugin, through its best matching term
+            best: dict[int, float] = {}
+            for term, factor in self._expand(token):
+                idf = self._idf[term] * factor
+                for doc, frequency in self._postings[term]:
+                    score = idf * frequency * (BM25_K1 + 1) / (frequency + self._norms[doc])
+                    if score > best.get(doc, 0.0):
+                        best[doc] = score
+            for doc, score in best.items():
+                scores[doc] = scores.get(doc, 0.0) + score
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.names[doc], score) for doc, score in ranked]
+
+
+# Built at import; the catalog does not change while the server runs
+plugin_index = PluginIndex(PLUGIN_CATALOG)
+
+
+def search_plugins(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[PluginInfo]:
+    """Search plugins by name, description, signals and capabilities.
 
     Args:
-        query: Search query (case-insensitive)
+        query: Search query (case-insensitive); words may be prefixes
+        limit: Maximum number of plugins to return
 
     Returns:
-        List of matching plugins
+        Matching plugins, most relevant first
     """
-    query_lower = query.lower()
-    results: list[PluginInfo] = []
-
-    for name, info in PLUGIN_CATALOG.items():
-        if (query_lower in name.lower() or
-            query_lower in info["description"].lower() or
-            any(query_lower in s.lower() for s in info["signals"])):
-            results.append(PluginInfo(
-                name=name,
-                description=info["description"],
-                signals=info["signals"],
-                capabilities=info["capabilities"],
-                homepage=info.get("homepage"),
-            ))
-
-    return results
+    return [get_plugin_info(name) for name, _ in plugin_index.search(query, limit)]
 
 
 def get_plugin_info(plugin_name: str) -> PluginInfo | None:
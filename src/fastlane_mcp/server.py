@@ -1,14 +1,30 @@
 """FastMCP server entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
+from fastlane_mcp.utils.workers import worker_pool
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Shut down warm fastlane workers when the server stops."""
+    try:
+        yield {}
+    finally:
+        await worker_pool.close()
+
+
 mcp = FastMCP(
     "Fastlane MCP Server",
-    instructions="Intelligent assistant for iOS/Android builds with fastlane"
+    instructions="Intelligent assistant for iOS/Android builds with fastlane",
+    lifespan=_lifespan
 )
 
 # Import tools to register them
-from fastlane_mcp.tools import build, analyze, plugins, lanes  # noqa: F401, E402
+from fastlane_mcp.tools import build, analyze, plugins, lanes, logs, jobs, toolchain, history  # noqa: F401, E402
 
 if __name__ == "__main__":
     mcp.run()
@@ -1,21 +1,49 @@
 """Project analysis tool."""
 
-from pathlib import Path
+import asyncio
 from fastmcp.exceptions import ToolError
 
 from fastlane_mcp.server import mcp
 from fastlane_mcp.utils.sanitize import validate_project_path, ValidationError
-from fastlane_mcp.discovery.lanes import parse_lanes_from_fastfile
+from fastlane_mcp.discovery.index import load_lane_index
+from fastlane_mcp.discovery.lanes import LaneInfo
+from fastlane_mcp.discovery.monorepo import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_TIME_BUDGET,
+    app_roots,
+    scan_monorepo,
+)
+
+
+def _lane_dict(lane: LaneInfo) -> dict:
+    return {
+        "name": lane.name,
+        "platform": lane.platform,
+        "description": lane.description,
+        "is_private": lane.is_private,
+        "source": lane.source,
+    }
 
 
 @mcp.tool
-async def analyze_project(project_path: str) -> dict:
+async def analyze_project(
+    project_path: str,
+    recursive: bool = False,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+) -> dict:
     """Analyze a fastlane project structure.
 
-    Discovers platforms, lanes, and configuration.
+    Discovers platforms, lanes, and configuration. With recursive=True the
+    whole tree is searched for apps with their own fastlane setup (as in a
+    monorepo), skipping dependency and build folders.
 
     Args:
         project_path: Path to the project root
+        recursive: Also discover apps in subdirectories
+        max_depth: How many directory levels below project_path to search
+        time_budget: Seconds a recursive scan may take before returning
+            partial results
 
     Returns:
         Analysis result with platforms, lanes, and recommendations
@@ -25,40 +53,41 @@ async def analyze_project(project_path: str) -> dict:
     except ValidationError as e:
         raise ToolError(str(e))
 
-    platforms: list[str] = []
-    all_lanes: list[dict] = []
-
-    # Check for platform-specific fastlane directories
-    for platform in ["ios", "android"]:
-        fastfile = validated_path / platform / "fastlane" / "Fastfile"
-        if fastfile.exists():
-            platforms.append(platform)
-            content = fastfile.read_text()
-            lanes = parse_lanes_from_fastfile(content)
-            for lane in lanes:
-                all_lanes.append({
-                    "name": lane.name,
-                    "platform": lane.platform or platform,
-                    "description": lane.description,
-                    "is_private": lane.is_private,
-                })
+    # Platform-specific fastlane directories, then the root-level one (shared lanes)
+    roots = await asyncio.to_thread(app_roots, validated_path)
+    platforms = [platform for platform, _ in roots if platform]
 
-    # Check for root-level fastlane directory (shared lanes)
-    root_fastfile = validated_path / "fastlane" / "Fastfile"
-    if root_fastfile.exists():
-        content = root_fastfile.read_text()
-        lanes = parse_lanes_from_fastfile(content)
-        for lane in lanes:
-            all_lanes.append({
-                "name": lane.name,
-                "platform": lane.platform,
-                "description": lane.description,
-                "is_private": lane.is_private,
-            })
+    # Follows import/import_from_git so shared lanes are included
+    index = await asyncio.to_thread(load_lane_index, roots)
 
-    return {
+    result = {
         "project_path": str(validated_path),
         "platforms": platforms,
-        "lanes": all_lanes,
-        "has_fastlane": len(platforms) > 0 or root_fastfile.exists(),
+        "lanes": [_lane_dict(lane) for lane in index.lanes],
+        "has_fastlane": len(roots) > 0,
+        "unresolved_imports": index.unresolved,
     }
+
+    if recursive:
+        if max_depth < 0:
+            raise ToolError("max_depth must not be negative")
+        if time_budget <= 0:
+            raise ToolError("time_budget must be positive")
+
+        scan = await scan_monorepo(validated_path, max_depth, time_budget)
+        result["apps"] = {
+            str(entry.app.path.relative_to(validated_path)): {
+                "platforms": entry.app.platforms,
+                "lanes": [_lane_dict(lane) for lane in entry.index.lanes] if entry.index else None,
+                "unresolved_imports": entry.index.unresolved if entry.index else [],
+            }
+            for entry in scan.apps
+        }
+        result["has_fastlane"] = result["has_fastlane"] or bool(scan.apps)
+        result["scan"] = {
+            "directories_scanned": scan.directories_scanned,
+            "truncated": scan.truncated,
+            "elapsed_seconds": round(scan.elapsed, 3),
+        }
+
+    return result
@@ -1,51 +1,213 @@
 """Build tools for iOS and Android."""
 
+import asyncio
+import inspect
+from pathlib import Path
+
+from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
 from fastlane_mcp.server import mcp
-from fastlane_mcp.validators import run_preflight, PreflightContext
-from fastlane_mcp.utils.executor import execute_fastlane
+from fastlane_mcp.validators import run_preflight, PreflightContext, ValidationResult
+from fastlane_mcp.validators.toolchain import PLATFORM_TOOLCHAIN, toolchain
+from fastlane_mcp.utils.bundler import FastlaneCommand, bundler
+from fastlane_mcp.utils.executor import execute_fastlane, ExecutionResult, LineCallback
+from fastlane_mcp.utils.paths import find_execution_dir
+from fastlane_mcp.utils.progress import StepTracker
+from fastlane_mcp.utils.scheduler import scheduler
+from fastlane_mcp.utils.segments import failed_segments
+from fastlane_mcp.utils.workers import worker_pool
 from fastlane_mcp.utils.sanitize import validate_project_path, ValidationError
-from fastlane_mcp.errors.diagnosis import diagnose_error
+from fastlane_mcp.errors.diagnosis import diagnose_error, pattern_diagnosis
+from fastlane_mcp.errors.history import failure_history, failure_signature
+from fastlane_mcp.errors.streaming import EarlyAbort, StreamingDiagnoser, abort_patterns
 
 
-def _format_build_error(diagnosis: dict, stdout: str, stderr: str) -> str:
+def _format_build_error(
+    diagnosis: dict,
+    stdout: str,
+    stderr: str,
+    log_id: str | None = None,
+    note: str | None = None,
+    segments: list[dict] | None = None
+) -> str:
     """Format build error with diagnosis and raw output."""
-    parts = [
-        diagnosis['message'],
-        "",
+    parts = [diagnosis['message'], ""]
+    if note:
+        parts.extend([note, ""])
+    parts.extend([
         f"Diagnosis: {diagnosis['diagnosis']}",
         "",
         "Suggestions:",
-    ]
+    ])
     parts.extend(f"  - {s}" for s in diagnosis['suggestions'])
 
+    matches = diagnosis.get('matches', [])
+    if matches:
+        parts.extend(["", f"Found at line {matches[0]['line']}:"])
+        parts.extend(f"    {line}" for line in matches[0]['context'])
+    if len(matches) > 1:
+        parts.extend(["", "Also found:"])
+        parts.extend(
+            f"  - {m['message']} (line {m['line']}: {m['matched_text']!r})" for m in matches[1:]
+        )
+
     # Always include raw output for debugging
     if stderr:
         parts.extend(["", "--- stderr ---", stderr[-2000:]])  # Last 2000 chars
     if stdout:
         parts.extend(["", "--- stdout ---", stdout[-2000:]])  # Last 2000 chars
+    if segments:
+        parts.extend(["", "Failed log segments (call get_log_segment with log_id and index):"])
+        parts.extend(
+            f"  - [{s['index']}] {s['kind']} {s['detail'] or s['name']} ({s['errors']} errors, {s['size']} bytes)"
+            for s in segments
+        )
+    if log_id:
+        parts.extend(["", f"Full log: call get_build_log with log_id={log_id}"])
 
     return "\n".join(parts)
 
 
-@mcp.tool
-async def build_ios(
+def _progress_reporter(ctx: Context | None) -> LineCallback | None:
+    """Create a line callback that reports fastlane steps as MCP progress."""
+    if ctx is None:
+        return None
+
+    tracker = StepTracker()
+    reporting = True
+
+    async def report(stream: str, line: str) -> None:
+        nonlocal reporting
+        event = tracker.feed(line)
+        if event is None or not reporting:
+            return
+        try:
+            await ctx.report_progress(event.index, None, event.message)
+        except Exception:
+            # A client that went away must not take the build down with it
+            reporting = False
+
+    return report
+
+
+def _chain(*callbacks: LineCallback | None) -> LineCallback:
+    """Combine line callbacks into one that calls each in turn."""
+    active = [callback for callback in callbacks if callback is not None]
+
+    async def chained(stream: str, line: str) -> None:
+        for callback in active:
+            result = callback(stream, line)
+            if inspect.isawaitable(result):
+                await result
+
+    return chained
+
+
+async def _execute_build(
+    lane: str,
+    platform: str,
+    project_path: Path,
+    env_vars: dict[str, str],
+    ctx: Context | None,
+    early_abort: bool,
+    fastlane: FastlaneCommand | None = None
+) -> ExecutionResult:
+    """Run a build lane, diagnosing its output as it streams.
+
+    Raises:
+        ToolError: With a diagnosis if the lane fails, or as soon as an
+            abort pattern is seen when early_abort is set
+    """
+    diagnoser = StreamingDiagnoser(abort_on=abort_patterns() if early_abort else ())
+    log_ids: list[str] = []
+
+    try:
+        result = await execute_fastlane(
+            lane, platform, project_path, env_vars,
+            on_line=_chain(_progress_reporter(ctx), diagnoser.feed_line),
+            on_start=lambda log: log_ids.append(log.log_id),
+            fastlane=fastlane
+        )
+    except EarlyAbort as e:
+        log_id = log_ids[0] if log_ids else None
+        await failure_history.record(
+            str(project_path), platform, lane, failure_signature([e.match], ""), log_id=log_id
+        )
+        raise ToolError(_format_build_error(
+            pattern_diagnosis(e.match.pattern), "", "", log_id,
+            note=f"Build stopped early after output matched {e.match.text!r}"
+        )) from None
+
+    diagnoser.close()
+    if result.exit_code == 0:
+        await failure_history.record(str(project_path), platform, lane, log_id=result.log_id)
+        return result
+
+    # The stream saw all output; the tail is all a mocked or shared run may have
+    tail = result.stderr or result.stdout
+    await failure_history.record(
+        str(project_path), platform, lane,
+        failure_signature(diagnoser.matches or diagnoser.matcher.find_all(tail), tail),
+        log_id=result.log_id
+    )
+    diagnosis = diagnoser.diagnosis() or diagnose_error(tail)
+    raise ToolError(_format_build_error(
+        diagnosis, result.stdout, result.stderr, result.log_id,
+        segments=await asyncio.to_thread(failed_segments, result.log_id)
+    ))
+
+
+async def _collect_toolchain(probe: asyncio.Future) -> dict[str, str | None]:
+    """Wait for a background toolchain probe; versions are best effort."""
+    try:
+        versions = await probe
+    except Exception:
+        return {}
+    return {name: version.version for name, version in versions.items()}
+
+
+# Tools that must be on PATH before a build can start
+REQUIRED_TOOLS = {
+    "ios": ["fastlane", "xcodebuild"],
+    "android": ["fastlane"],
+}
+
+
+def _required_tools(platform: str, bundled: bool) -> list[str]:
+    """Tools a build needs; bundled projects run fastlane through `bundle`."""
+    if not bundled:
+        return REQUIRED_TOOLS[platform]
+    return ["bundle" if tool == "fastlane" else tool for tool in REQUIRED_TOOLS[platform]]
+
+
+async def prepare_build(
     project_path: str,
-    lane: str = "build",
-    environment: str | None = None,
-    clean: bool = False,
-) -> dict:
-    """Build an iOS app using fastlane.
+    platform: str,
+    lane: str,
+    environment: str | None,
+    force_preflight: bool = False
+) -> tuple[Path, dict[str, str], ValidationResult, FastlaneCommand]:
+    """Validate a build request and run pre-flight checks.
+
+    How fastlane will be invoked is decided first, so a project whose
+    Gemfile.lock pins fastlane is checked for `bundle` rather than a
+    global fastlane.
 
     Args:
         project_path: Path to the project root
-        lane: Fastlane lane to run (default: build)
+        platform: Platform (ios or android)
+        lane: Fastlane lane to run
         environment: Build environment (debug/release)
-        clean: Whether to clean before building
+        force_preflight: Re-run checks even if a recent result is cached
 
     Returns:
-        Build result with output and status
+        The validated project path, environment variables for fastlane,
+        the pre-flight result (including per-validator timings) and the
+        FastlaneCommand to run
+
+    Raises:
+        ToolError: If the path is invalid or pre-flight checks fail
     """
     # Validate path
     try:
@@ -53,13 +215,18 @@ async def build_ios(
     except ValidationError as e:
         raise ToolError(str(e))
 
+    # Decide between a global fastlane and the project's bundle
+    execution_dir = find_execution_dir(validated_path, platform)
+    bundled = bundler.pins_fastlane(execution_dir, validated_path)
+    fastlane = await bundler.resolve(execution_dir, validated_path)
+
     # Pre-flight checks
     preflight = await run_preflight(PreflightContext(
         project_path=str(validated_path),
-        platform="ios",
+        platform=platform,
         lane=lane,
-        required_tools=["fastlane", "xcodebuild"]
-    ))
+        required_tools=_required_tools(platform, bundled)
+    ), use_cache=not force_preflight)
 
     if not preflight.valid:
         raise ToolError(f"Pre-flight checks failed:\n\n{preflight.format_issues()}")
@@ -69,14 +236,61 @@ async def build_ios(
     if environment:
         env_vars["FASTLANE_ENV"] = environment
 
-    # Execute build
-    result = await execute_fastlane(lane, "ios", validated_path, env_vars)
+    return validated_path, env_vars, preflight, fastlane
+
+
+@mcp.tool
+async def build_ios(
+    project_path: str,
+    lane: str = "build",
+    environment: str | None = None,
+    clean: bool = False,
+    force_preflight: bool = False,
+    early_abort: bool = False,
+    ctx: Context | None = None,
+) -> dict:
+    """Build an iOS app using fastlane.
 
-    if result.exit_code != 0:
-        diagnosis = diagnose_error(result.stderr or result.stdout)
-        raise ToolError(_format_build_error(diagnosis, result.stdout, result.stderr))
+    Reports each fastlane step as a progress notification while running.
 
-    return {"success": True, "output": result.stdout}
+    Args:
+        project_path: Path to the project root
+        lane: Fastlane lane to run (default: build)
+        environment: Build environment (debug/release)
+        clean: Whether to clean before building
+        force_preflight: Re-run pre-flight checks instead of reusing a
+            recent passing result
+        early_abort: Stop the build as soon as its output shows a failure
+            it cannot recover from (e.g. a missing signing certificate)
+        ctx: MCP context used for progress notifications
+
+    Returns:
+        Build result with output and status
+    """
+    validated_path, env_vars, preflight, fastlane = await prepare_build(
+        project_path, "ios", lane, environment, force_preflight
+    )
+
+    # Look up tool versions while the build runs (cached after the first build)
+    toolchain_probe = asyncio.ensure_future(toolchain.versions(PLATFORM_TOOLCHAIN["ios"]))
+
+    # Execute build
+    try:
+        result = await _execute_build(lane, "ios", validated_path, env_vars, ctx, early_abort, fastlane)
+    except BaseException:
+        toolchain_probe.cancel()
+        raise
+
+    return {
+        "success": True,
+        "output": result.stdout,
+        "log_id": result.log_id,
+        "queue_wait_seconds": round(result.queue_wait, 3),
+        "preflight_seconds": preflight.timings,
+        "preflight_cached": preflight.cached,
+        "fastlane": fastlane.to_dict(),
+        "toolchain": await _collect_toolchain(toolchain_probe),
+    }
 
 
 @mcp.tool
@@ -85,45 +299,63 @@ async def build_android(
     lane: str = "build",
     environment: str | None = None,
     clean: bool = False,
+    force_preflight: bool = False,
+    early_abort: bool = False,
+    ctx: Context | None = None,
 ) -> dict:
     """Build an Android app using fastlane.
 
+    Reports each fastlane step as a progress notification while running.
+
     Args:
         project_path: Path to the project root
         lane: Fastlane lane to run (default: build)
         environment: Build environment (debug/release)
         clean: Whether to clean before building
+        force_preflight: Re-run pre-flight checks instead of reusing a
+            recent passing result
+        early_abort: Stop the build as soon as its output shows a failure
+            it cannot recover from (e.g. a missing signing certificate)
+        ctx: MCP context used for progress notifications
 
     Returns:
         Build result with output and status
     """
-    # Validate path
-    try:
-        validated_path = await validate_project_path(project_path)
-    except ValidationError as e:
-        raise ToolError(str(e))
+    validated_path, env_vars, preflight, fastlane = await prepare_build(
+        project_path, "android", lane, environment, force_preflight
+    )
 
-    # Pre-flight checks
-    preflight = await run_preflight(PreflightContext(
-        project_path=str(validated_path),
-        platform="android",
-        lane=lane,
-        required_tools=["fastlane"]
-    ))
+    # Look up tool versions while the build runs (cached after the first build)
+    toolchain_probe = asyncio.ensure_future(toolchain.versions(PLATFORM_TOOLCHAIN["android"]))
 
-    if not preflight.valid:
-        raise ToolError(f"Pre-flight checks failed:\n\n{preflight.format_issues()}")
+    # Execute build
+    try:
+        result = await _execute_build(lane, "android", validated_path, env_vars, ctx, early_abort, fastlane)
+    except BaseException:
+        toolchain_probe.cancel()
+        raise
 
-    # Build environment variables
-    env_vars = {}
-    if environment:
-        env_vars["FASTLANE_ENV"] = environment
+    return {
+        "success": True,
+        "output": result.stdout,
+        "log_id": result.log_id,
+        "queue_wait_seconds": round(result.queue_wait, 3),
+        "preflight_seconds": preflight.timings,
+        "preflight_cached": preflight.cached,
+        "fastlane": fastlane.to_dict(),
+        "toolchain": await _collect_toolchain(toolchain_probe),
+    }
 
-    # Execute build
-    result = await execute_fastlane(lane, "android", validated_path, env_vars)
 
-    if result.exit_code != 0:
-        diagnosis = diagnose_error(result.stderr or result.stdout)
-        raise ToolError(_format_build_error(diagnosis, result.stdout, result.stderr))
+@mcp.tool
+async def get_build_queue() -> dict:
+    """Show running and queued builds on this host.
 
-    return {"success": True, "output": result.stdout}
+    Returns:
+        Per-platform and per-project slot limits, queue depth and wait
+        times, plus warm fastlane workers per directory when enabled
+    """
+    stats = scheduler.stats()
+    if worker_pool.enabled:
+        stats["workers"] = worker_pool.stats()
+    return stats
@@ -0,0 +1,65 @@
+"""Failure history tool."""
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.server import mcp
+from fastlane_mcp.errors.history import failure_history
+
+PLATFORMS = ("ios", "android")
+
+
+@mcp.tool
+async def get_recurring_failures(
+    project_path: str | None = None,
+    platform: str | None = None,
+    lane: str | None = None,
+    min_count: int = 2,
+    since_hours: float | None = None,
+    limit: int = 20,
+) -> dict:
+    """List the build failures that keep coming back.
+
+    Every build run through this server is recorded. Failures are
+    fingerprinted with paths, timestamps, UUIDs, hashes and line numbers
+    stripped, so the same failure in different builds is counted together.
+    A failure whose lane has succeeded since it first appeared is marked
+    flaky, which usually points at infrastructure rather than code.
+
+    Args:
+        project_path: Only failures of this project
+        platform: Only failures on this platform (ios or android)
+        lane: Only failures of this lane
+        min_count: Minimum number of builds the failure occurred in
+        since_hours: Only failures seen within this many hours
+        limit: Maximum number of failures to return
+
+    Returns:
+        Failures, most frequent first, with counts, first/last seen times
+        (Unix timestamps), a sample line and the lane's build totals
+    """
+    if platform is not None and platform not in PLATFORMS:
+        raise ToolError(f"Unknown platform: {platform}. Must be one of: {', '.join(PLATFORMS)}")
+    if min_count < 1:
+        raise ToolError("min_count must be at least 1")
+    if limit < 1:
+        raise ToolError("limit must be at least 1")
+
+    try:
+        failures = await asyncio.to_thread(
+            failure_history.recurring,
+            project=str(Path(project_path).resolve()) if project_path else None,
+            platform=platform,
+            lane=lane,
+            min_count=min_count,
+            since=time.time() - since_hours * 3600 if since_hours is not None else None,
+            limit=limit,
+        )
+    except (sqlite3.Error, OSError) as e:
+        raise ToolError(f"Failure history is unavailable: {e}")
+
+    return {"failures": failures, "count": len(failures)}
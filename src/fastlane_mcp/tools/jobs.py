@@ -0,0 +1,150 @@
+"""Background build tools."""
+
+import asyncio
+
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.server import mcp
+# Imported as a module: tools.build imports the server, which imports this module
+from fastlane_mcp.tools import build
+from fastlane_mcp.utils.executor import VALID_PLATFORMS
+from fastlane_mcp.utils.jobs import jobs, BuildJob, JobStatus
+from fastlane_mcp.utils.logs import DEFAULT_READ_LENGTH
+from fastlane_mcp.utils.segments import failed_segments
+from fastlane_mcp.errors.diagnosis import diagnose_error
+from fastlane_mcp.errors.streaming import abort_patterns
+
+
+def _job_summary(job: BuildJob) -> dict:
+    """Describe a job's state without its output."""
+    summary = {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "platform": job.platform,
+        "lane": job.lane,
+        "project_path": str(job.project_path),
+        "elapsed_seconds": round(job.elapsed, 1),
+        "step": job.steps.index,
+        "step_name": job.steps.current,
+        "lines": job.lines,
+        "last_line": job.last_line,
+        "log_id": job.log_id,
+    }
+    if job.result is not None:
+        summary["exit_code"] = job.result.exit_code
+    # Recognized errors seen so far, available while the build is still running
+    detected = job.diagnoser.pattern_ids()
+    if detected:
+        summary["detected_errors"] = detected
+    if job.error:
+        summary["error"] = job.error
+    return summary
+
+
+@mcp.tool
+async def start_build(
+    project_path: str,
+    platform: str,
+    lane: str = "build",
+    environment: str | None = None,
+    force_preflight: bool = False,
+    early_abort: bool = False,
+) -> dict:
+    """Start a fastlane build in the background and return immediately.
+
+    Poll progress with get_build_status and stop it with cancel_build.
+
+    Args:
+        project_path: Path to the project root
+        platform: Platform to build (ios/android)
+        lane: Fastlane lane to run (default: build)
+        environment: Build environment (debug/release)
+        force_preflight: Re-run pre-flight checks instead of reusing a
+            recent passing result
+        early_abort: Stop the build as soon as its output shows a failure
+            it cannot recover from (e.g. a missing signing certificate)
+
+    Returns:
+        The job id and initial status
+    """
+    if platform not in VALID_PLATFORMS:
+        raise ToolError(f"Invalid platform: {platform}. Must be one of: {', '.join(VALID_PLATFORMS)}")
+
+    validated_path, env_vars, preflight, fastlane = await build.prepare_build(
+        project_path, platform, lane, environment, force_preflight
+    )
+
+    job = jobs.start(
+        lane, platform, validated_path, env_vars,
+        abort_on=abort_patterns() if early_abort else frozenset(),
+        fastlane=fastlane
+    )
+    return {
+        **_job_summary(job),
+        "preflight_seconds": preflight.timings,
+        "preflight_cached": preflight.cached,
+        "fastlane": fastlane.to_dict(),
+    }
+
+
+@mcp.tool
+async def get_build_status(
+    job_id: str,
+    offset: int = 0,
+    max_bytes: int = DEFAULT_READ_LENGTH,
+) -> dict:
+    """Get the status and new output of a background build.
+
+    Pass the returned next_offset back as offset to fetch only output
+    produced since the previous call.
+
+    Args:
+        job_id: The job id returned by start_build
+        offset: Byte offset into the build log to read from
+        max_bytes: Maximum bytes of output to return
+
+    Returns:
+        Job status, output since offset, and the offset to continue from
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        raise ToolError(f"Unknown build job: {job_id}")
+
+    status = _job_summary(job)
+    try:
+        chunk = job.read_output(offset, max_bytes)
+    except (ValueError, FileNotFoundError) as e:
+        raise ToolError(str(e))
+    status["output"] = chunk.data if chunk else ""
+    status["next_offset"] = chunk.next_offset if chunk else offset
+    status["log_size"] = chunk.size if chunk else 0
+
+    if job.status == JobStatus.FAILED:
+        diagnosis = job.diagnoser.diagnosis()
+        if diagnosis is None and job.result is not None:
+            diagnosis = diagnose_error(job.result.stderr or job.result.stdout)
+        if diagnosis is not None:
+            segments = await asyncio.to_thread(failed_segments, job.log_id)
+            status["diagnosis"] = build._format_build_error(diagnosis, "", "", job.log_id, segments=segments)
+
+    return status
+
+
+@mcp.tool
+async def cancel_build(job_id: str) -> dict:
+    """Cancel a background build, killing its fastlane process.
+
+    A job attached to a run shared with identical builds only detaches
+    from it; the fastlane process is killed once no build is left on it.
+
+    Args:
+        job_id: The job id returned by start_build
+
+    Returns:
+        The final job status
+    """
+    job = await jobs.cancel(job_id)
+    if job is None:
+        raise ToolError(f"Unknown build job: {job_id}")
+
+    return _job_summary(job)
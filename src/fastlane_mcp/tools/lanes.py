@@ -1,11 +1,12 @@
 """Lane listing tool."""
 
+import asyncio
 from fastmcp.exceptions import ToolError
 
 from fastlane_mcp.server import mcp
 from fastlane_mcp.utils.sanitize import validate_project_path, ValidationError
 from fastlane_mcp.utils.paths import find_fastlane_dir
-from fastlane_mcp.discovery.lanes import parse_lanes_from_fastfile
+from fastlane_mcp.discovery.index import load_lane_index
 
 
 @mcp.tool
@@ -29,8 +30,6 @@ async def list_lanes(
     except ValidationError as e:
         raise ToolError(str(e))
 
-    lanes_found: list[dict] = []
-
     if platform:
         # When platform is specified, check both platform-specific and root
         fastlane_dir = find_fastlane_dir(validated_path, platform)
@@ -41,48 +40,37 @@ async def list_lanes(
                 f"  - {validated_path / platform / 'fastlane' / 'Fastfile'}\n"
                 f"  - {validated_path / 'fastlane' / 'Fastfile'}"
             )
-
-        fastfile = fastlane_dir / "Fastfile"
-        content = fastfile.read_text()
-        lanes = parse_lanes_from_fastfile(content)
-
-        for lane in lanes:
-            if lane.is_private and not include_private:
-                continue
-            lanes_found.append({
-                "name": lane.name,
-                "platform": lane.platform or platform,
-                "description": lane.description,
-                "is_private": lane.is_private,
-            })
+        roots = [(platform, fastlane_dir / "Fastfile")]
     else:
         # No platform specified - check all locations
-        dirs_to_check = [
-            ("ios", validated_path / "ios" / "fastlane"),
-            ("android", validated_path / "android" / "fastlane"),
-            (None, validated_path / "fastlane"),
+        roots = [
+            (plat, fastlane_dir / "Fastfile")
+            for plat, fastlane_dir in [
+                ("ios", validated_path / "ios" / "fastlane"),
+                ("android", validated_path / "android" / "fastlane"),
+                (None, validated_path / "fastlane"),
+            ]
+            if (fastlane_dir / "Fastfile").exists()
         ]
 
-        for plat, fastlane_dir in dirs_to_check:
-            fastfile = fastlane_dir / "Fastfile"
-            if not fastfile.exists():
-                continue
-
-            content = fastfile.read_text()
-            lanes = parse_lanes_from_fastfile(content)
+    # Follows import/import_from_git so shared lanes are included
+    index = await asyncio.to_thread(load_lane_index, roots)
 
-            for lane in lanes:
-                if lane.is_private and not include_private:
-                    continue
-                lanes_found.append({
-                    "name": lane.name,
-                    "platform": lane.platform or plat,
-                    "description": lane.description,
-                    "is_private": lane.is_private,
-                })
+    lanes_found = [
+        {
+            "name": lane.name,
+            "platform": lane.platform,
+            "description": lane.description,
+            "is_private": lane.is_private,
+            "source": lane.source,
+        }
+        for lane in index.lanes
+        if include_private or not lane.is_private
+    ]
 
     return {
         "project_path": str(validated_path),
         "platform_filter": platform,
         "lanes": lanes_found,
+        "unresolved_imports": index.unresolved,
     }
@@ -0,0 +1,143 @@
+"""Build log retrieval tool."""
+
+import asyncio
+
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.server import mcp
+from fastlane_mcp.utils.logs import read_log, DEFAULT_READ_LENGTH
+from fastlane_mcp.utils.segments import LogIndex, SEGMENT_KINDS, log_indexes, most_specific
+
+# Segments returned by list_log_segments unless a limit is given
+DEFAULT_SEGMENT_LIMIT = 200
+
+
+async def _load_index(log_id: str) -> LogIndex:
+    # Indexing a large log takes seconds; keep it off the event loop
+    try:
+        return await asyncio.to_thread(log_indexes.get, log_id)
+    except (ValueError, FileNotFoundError) as e:
+        raise ToolError(str(e))
+
+
+@mcp.tool
+async def get_build_log(
+    log_id: str,
+    offset: int = 0,
+    length: int = DEFAULT_READ_LENGTH,
+) -> dict:
+    """Fetch a byte range of a spooled build log.
+
+    Build results only include the tail of the output; use this to page
+    through the complete log, or list_log_segments and get_log_segment to
+    fetch just the part that matters.
+
+    Args:
+        log_id: The log_id returned by a build tool
+        offset: Byte offset to start reading from (negative counts from the end)
+        length: Maximum number of bytes to return (capped at 1 MB)
+
+    Returns:
+        The requested log text and the offset to continue from
+    """
+    try:
+        chunk = read_log(log_id, offset, length)
+    except (ValueError, FileNotFoundError) as e:
+        raise ToolError(str(e))
+
+    return {
+        "log_id": chunk.log_id,
+        "offset": chunk.offset,
+        "next_offset": chunk.next_offset,
+        "size": chunk.size,
+        "eof": chunk.eof,
+        "data": chunk.data,
+    }
+
+
+@mcp.tool
+async def list_log_segments(
+    log_id: str,
+    kind: str | None = None,
+    failed_only: bool = False,
+    limit: int = DEFAULT_SEGMENT_LIMIT,
+) -> dict:
+    """List the fastlane steps, xcodebuild targets and phases, and gradle tasks in a build log.
+
+    Each segment has the byte range it occupies in the log; fetch one with
+    get_log_segment instead of paging through the whole log.
+
+    Args:
+        log_id: The log_id returned by a build tool
+        kind: Only list segments of this kind (step, target, phase or task)
+        failed_only: Only list segments that failed or logged errors
+        limit: Maximum number of segments to return
+
+    Returns:
+        Matching segments in log order and how many there are in total
+    """
+    if kind is not None and kind not in SEGMENT_KINDS:
+        raise ToolError(f"Invalid segment kind: {kind}. Must be one of: {', '.join(SEGMENT_KINDS)}")
+
+    index = await _load_index(log_id)
+    segments = index.select(kind=kind, failed_only=failed_only)
+    return {
+        "log_id": log_id,
+        "size": index.indexed,
+        "total": len(segments),
+        "segments": [segment.to_dict(index.indexed) for segment in segments[:max(limit, 0)]],
+    }
+
+
+@mcp.tool
+async def get_log_segment(
+    log_id: str,
+    index: int | None = None,
+    kind: str | None = None,
+    name: str | None = None,
+    failed_only: bool = False,
+    max_bytes: int = DEFAULT_READ_LENGTH,
+) -> dict:
+    """Fetch one segment of a build log, e.g. the failing CompileSwift phase.
+
+    Pick a segment by its index from list_log_segments, or describe it with
+    kind, name and failed_only; the most specific matching segment (a
+    phase or task before a target or step) is returned, earliest first.
+
+    Args:
+        log_id: The log_id returned by a build tool
+        index: Segment index from list_log_segments
+        kind: Segment kind (step, target, phase or task)
+        name: Case-insensitive text in the segment's name or line,
+            e.g. "CompileSwift", "gym" or ":app:compileReleaseKotlin"
+        failed_only: Only consider segments that failed or logged errors
+        max_bytes: Maximum bytes of the segment to return (capped at 1 MB)
+
+    Returns:
+        The segment, its text, and the offset to continue from with
+        get_build_log if it was cut short
+    """
+    if kind is not None and kind not in SEGMENT_KINDS:
+        raise ToolError(f"Invalid segment kind: {kind}. Must be one of: {', '.join(SEGMENT_KINDS)}")
+
+    log_index = await _load_index(log_id)
+    if index is not None:
+        if not 0 <= index < len(log_index.segments):
+            raise ToolError(f"No segment {index} in log {log_id} ({len(log_index.segments)} segments)")
+        segment = log_index.segments[index]
+    else:
+        candidates = most_specific(log_index.select(kind=kind, name=name, failed_only=failed_only))
+        if not candidates:
+            raise ToolError(f"No matching segment in log {log_id}")
+        segment = candidates[0]
+
+    info = segment.to_dict(log_index.indexed)
+    chunk = read_log(log_id, info["start"], min(info["size"], max_bytes))
+    return {
+        "log_id": log_id,
+        "segment": info,
+        "offset": chunk.offset,
+        "next_offset": chunk.next_offset,
+        "truncated": chunk.next_offset < info["end"],
+        "data": chunk.data,
+    }
@@ -1,20 +1,27 @@
 """Plugin discovery and management tools."""
 
+from fastmcp.exceptions import ToolError
+
 from fastlane_mcp.server import mcp
-from fastlane_mcp.plugins.registry import search_plugins, get_plugin_info
+from fastlane_mcp.plugins.registry import DEFAULT_SEARCH_LIMIT, search_plugins, get_plugin_info
 
 
 @mcp.tool
-async def search_fastlane_plugins(query: str) -> dict:
+async def search_fastlane_plugins(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> dict:
     """Search for fastlane plugins.
 
     Args:
-        query: Search query (matches name, description, signals)
+        query: Search query (matches words or word prefixes of name,
+            description, signals and capabilities)
+        limit: Maximum number of plugins to return
 
     Returns:
-        List of matching plugins with details
+        List of matching plugins with details, most relevant first
     """
-    results = search_plugins(query)
+    if limit < 1:
+        raise ToolError("limit must be at least 1")
+
+    results = search_plugins(query, limit)
 
     return {
         "query": query,
@@ -0,0 +1,34 @@
+"""Toolchain inventory tool."""
+
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.server import mcp
+from fastlane_mcp.validators.toolchain import PROBES, toolchain
+
+
+@mcp.tool
+async def get_toolchain(
+    tools: list[str] | None = None,
+    refresh: bool = False,
+) -> dict:
+    """Report installed versions of the build toolchain.
+
+    Versions are probed once per binary and cached on disk, so repeated
+    calls are instant until a tool is upgraded.
+
+    Args:
+        tools: Tools to report (xcodebuild, fastlane, ruby, bundler, gradle,
+            java); default all
+        refresh: Probe again instead of using cached versions
+
+    Returns:
+        Version, resolved path and any probe error for each tool
+    """
+    unknown = [name for name in tools or [] if name not in PROBES]
+    if unknown:
+        raise ToolError(
+            f"Unknown tool(s): {', '.join(unknown)}. Must be one of: {', '.join(PROBES)}"
+        )
+
+    versions = await toolchain.versions(tools, refresh=refresh)
+    return {"tools": {name: version.to_dict() for name, version in versions.items()}}
@@ -15,6 +15,11 @@ from fastlane_mcp.utils.paths import (
     find_fastlane_dir,
     find_execution_dir,
 )
+from fastlane_mcp.utils.logs import (
+    RingBuffer,
+    open_log,
+    read_log,
+)
 
 __all__ = [
     "execute_command",
@@ -26,4 +31,7 @@ __all__ = [
     "ValidationError",
     "find_fastlane_dir",
     "find_execution_dir",
+    "RingBuffer",
+    "open_log",
+    "read_log",
 ]
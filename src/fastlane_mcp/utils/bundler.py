@@ -0,0 +1,226 @@
+"""Running fastlane through a project's Gemfile."""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastlane_mcp.utils.resolver import tool_resolver
+
+# Seconds allowed for `bundle check`
+BUNDLE_CHECK_TIMEOUT = 120
+
+# A spec line in Gemfile.lock's GEM section, e.g. "    fastlane (2.225.0)"
+_SPEC_PATTERN = re.compile(r'^    (?P<name>[^\s(]+) \((?P<version>[^)]+)\)$', re.MULTILINE)
+_BUNDLED_WITH_PATTERN = re.compile(r'^BUNDLED WITH\n\s+(?P<version>\S+)', re.MULTILINE)
+
+
+@dataclass
+class Lockfile:
+    """The parts of a Gemfile.lock that decide how fastlane is run."""
+    gems: dict[str, str]
+    bundler_version: str | None = None
+
+    @property
+    def fastlane_version(self) -> str | None:
+        return self.gems.get("fastlane")
+
+
+@dataclass
+class FastlaneCommand:
+    """How to invoke fastlane for one execution directory."""
+    program: str
+    args: list[str] = field(default_factory=list)
+    env: dict[str, str] = field(default_factory=dict)
+    # "global", "bundle exec" or "binstub"
+    mode: str = "global"
+    gemfile: Path | None = None
+    fastlane_version: str | None = None
+
+    @property
+    def worker_launcher(self) -> tuple[str, ...]:
+        """Prefix that makes a warm worker load the same fastlane."""
+        if self.mode == "global":
+            return ()
+        return (tool_resolver.resolve("bundle") or "bundle", "exec")
+
+    def to_dict(self) -> dict:
+        """How fastlane runs, for build results."""
+        return {
+            "mode": self.mode,
+            "version": self.fastlane_version,
+            "gemfile": str(self.gemfile) if self.gemfile else None,
+        }
+
+
+GLOBAL_FASTLANE = FastlaneCommand(program="fastlane")
+
+
+def parse_lockfile(content: str) -> Lockfile:
+    """Extract locked gem versions from Gemfile.lock content.
+
+    Args:
+        content: The lockfile text
+
+    Returns:
+        Lockfile with the top-level gem versions
+    """
+    return Lockfile(
+        gems={m.group('name'): m.group('version') for m in _SPEC_PATTERN.finditer(content)},
+        bundler_version=(m.group('version') if (m := _BUNDLED_WITH_PATTERN.search(content)) else None),
+    )
+
+
+def find_gemfile(execution_dir: Path, project_root: Path | None = None) -> Path | None:
+    """Find the Gemfile bundler would use when run from execution_dir.
+
+    Like bundler, looks in execution_dir and then its parents, but never
+    above project_root (e.g. ios/ in a React Native app uses the app's
+    root Gemfile).
+
+    Args:
+        execution_dir: Directory fastlane runs in
+        project_root: Highest directory to search (default: execution_dir)
+
+    Returns:
+        Path to the Gemfile, or None
+    """
+    root = (project_root or execution_dir).resolve()
+    directory = execution_dir.resolve()
+    while True:
+        gemfile = directory / "Gemfile"
+        if gemfile.is_file():
+            return gemfile
+        if directory == root or directory.parent == directory:
+            return None
+        directory = directory.parent
+
+
+def _is_bundler_binstub(path: Path) -> bool:
+    """Whether path is an executable generated by `bundle binstubs`."""
+    if not os.access(path, os.X_OK):
+        return False
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096)
+    except OSError:
+        return False
+    return b"bundler/setup" in head or b"Bundler.setup" in head
+
+
+class BundlerResolver:
+    """Chooses between global fastlane, `bundle exec` and binstubs.
+
+    Lockfile parses and successful `bundle check` results are cached by the
+    lockfile's hash, so only the first build after the lockfile changes
+    pays for a Ruby boot. A failed check is not cached: it usually means
+    `bundle install` is needed, and the next build should notice once it
+    has been run.
+    """
+
+    def __init__(self):
+        self._lockfiles: dict[str, Lockfile] = {}
+        self._checked: set[tuple[str, str]] = set()
+
+    async def resolve(self, execution_dir: Path, project_root: Path | None = None) -> FastlaneCommand:
+        """Decide how to run fastlane in a directory.
+
+        Uses the global fastlane unless a Gemfile.lock that pins fastlane
+        is found and bundler is installed. Then a `bundle binstubs` binstub
+        (bin/fastlane next to the Gemfile) is preferred when the bundle is
+        satisfied, otherwise `bundle exec fastlane` is used, which reports
+        missing gems itself.
+
+        Args:
+            execution_dir: Directory fastlane runs in
+            project_root: Highest directory searched for a Gemfile
+
+        Returns:
+            The FastlaneCommand to run
+        """
+        locked = self._locked(execution_dir, project_root)
+        if locked is None:
+            return GLOBAL_FASTLANE
+        gemfile, lockfile, digest = locked
+
+        bundle = tool_resolver.resolve("bundle")
+        if bundle is None:
+            return GLOBAL_FASTLANE
+
+        env = {"BUNDLE_GEMFILE": str(gemfile)}
+        satisfied = await self._check(bundle, gemfile, digest, env)
+
+        binstub = gemfile.parent / "bin" / "fastlane"
+        if satisfied and _is_bundler_binstub(binstub):
+            return FastlaneCommand(
+                program=str(binstub),
+                env=env,
+                mode="binstub",
+                gemfile=gemfile,
+                fastlane_version=lockfile.fastlane_version,
+            )
+
+        return FastlaneCommand(
+            program=bundle,
+            args=["exec", "fastlane"],
+            env=env,
+            mode="bundle exec",
+            gemfile=gemfile,
+            fastlane_version=lockfile.fastlane_version,
+        )
+
+    def pins_fastlane(self, execution_dir: Path, project_root: Path | None = None) -> bool:
+        """Whether the Gemfile.lock bundler would use in a directory pins fastlane.
+
+        Such projects run fastlane through bundler, so they need `bundle`
+        rather than a global fastlane.
+        """
+        return self._locked(execution_dir, project_root) is not None
+
+    def _locked(self, execution_dir: Path, project_root: Path | None) -> tuple[Path, Lockfile, str] | None:
+        """The Gemfile, its parsed lockfile and the lockfile's hash, if it pins fastlane."""
+        gemfile = find_gemfile(execution_dir, project_root)
+        if gemfile is None:
+            return None
+
+        lockfile_path = gemfile.with_name(gemfile.name + ".lock")
+        try:
+            lock_bytes = lockfile_path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(lock_bytes).hexdigest()
+
+        lockfile = self._lockfiles.get(digest)
+        if lockfile is None:
+            lockfile = self._lockfiles[digest] = parse_lockfile(lock_bytes.decode(errors="replace"))
+        if lockfile.fastlane_version is None:
+            return None
+        return gemfile, lockfile, digest
+
+    def clear(self) -> None:
+        """Forget cached lockfiles and checks."""
+        self._lockfiles.clear()
+        self._checked.clear()
+
+    async def _check(self, bundle: str, gemfile: Path, digest: str, env: dict[str, str]) -> bool:
+        key = (str(gemfile), digest)
+        if key in self._checked:
+            return True
+
+        # Imported here: the executor resolves its fastlane command through us
+        from fastlane_mcp.utils.executor import execute_command
+
+        try:
+            result = await execute_command(
+                bundle, ["check"], cwd=gemfile.parent, env=env, timeout=BUNDLE_CHECK_TIMEOUT
+            )
+        except OSError:
+            return False
+        if result.exit_code != 0:
+            return False
+        self._checked.add(key)
+        return True
+
+
+bundler = BundlerResolver()
@@ -0,0 +1,23 @@
+"""Environment-based configuration helpers."""
+
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        The configured value, or default
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
@@ -1,25 +1,47 @@
 """Command execution utilities."""
 
 import asyncio
+import inspect
+import io
 import os
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from fastlane_mcp.utils.bundler import FastlaneCommand, bundler
+from fastlane_mcp.utils.logs import LogWriter, RingBuffer, open_log
+from fastlane_mcp.utils.resolver import tool_resolver
 from fastlane_mcp.utils.sanitize import sanitize_lane_name
+from fastlane_mcp.utils.scheduler import scheduler
+from fastlane_mcp.utils.singleflight import SingleFlight, source_fingerprint
 from fastlane_mcp.utils.paths import find_execution_dir
+from fastlane_mcp.utils.streams import (
+    DEFAULT_TIMEOUT,
+    ExecutionResult,
+    LineCallback,
+    decode_tail,
+    deliver_line,
+    iter_raw_lines,
+    kill_process_tree,
+)
+from fastlane_mcp.utils.workers import worker_pool
 
 VALID_PLATFORMS = ("ios", "android")
 
-
-@dataclass
-class ExecutionResult:
-    """Result of command execution."""
-    stdout: str
-    stderr: str
-    exit_code: int
+# Bytes of stdout/stderr kept in memory per stream for fastlane runs
+DEFAULT_TAIL_BYTES = 64 * 1024
 
 
-DEFAULT_TIMEOUT = 600  # 10 minutes
+async def _pump(
+    name: str,
+    reader: asyncio.StreamReader,
+    sink: RingBuffer | io.BytesIO,
+    log: LogWriter | None,
+    on_line: LineCallback | None
+) -> None:
+    """Drain a process pipe into a tail buffer and optional log spool."""
+    async for line in iter_raw_lines(reader):
+        await deliver_line(name, line, sink, log, on_line)
 
 
 async def execute_command(
@@ -27,66 +49,175 @@ async def execute_command(
     args: list[str],
     cwd: Path | str | None = None,
     env: dict[str, str] | None = None,
-    timeout: int = DEFAULT_TIMEOUT
+    timeout: int = DEFAULT_TIMEOUT,
+    on_line: LineCallback | None = None,
+    tail_bytes: int | None = None,
+    log: LogWriter | None = None
 ) -> ExecutionResult:
     """Execute a shell command asynchronously.
 
+    Output is read incrementally from both pipes. Callers can subscribe to
+    lines as they arrive with on_line, bound memory use with tail_bytes,
+    and keep the complete output on disk by passing a log writer.
+
     Args:
         command: The command to execute
         args: Command arguments
         cwd: Working directory
         env: Additional environment variables (merged with current env)
         timeout: Timeout in seconds
+        on_line: Optional callback invoked with (stream, line) for each line,
+            where stream is "stdout" or "stderr"
+        tail_bytes: Keep only the last N bytes of each stream (None keeps all)
+        log: Optional spool receiving the full interleaved output
 
     Returns:
         ExecutionResult with stdout, stderr, and exit code
     """
     merged_env = {**os.environ, **(env or {})}
 
+    # Exec the cached absolute path; unresolvable commands are left to
+    # exec so a missing tool still raises FileNotFoundError
+    program = tool_resolver.resolve(command, merged_env.get("PATH", os.defpath)) or command
+
     proc = await asyncio.create_subprocess_exec(
-        command, *args,
+        program, *args,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
         cwd=str(cwd) if cwd else None,
-        env=merged_env
+        env=merged_env,
+        start_new_session=True
     )
 
+    def new_sink() -> RingBuffer | io.BytesIO:
+        return RingBuffer(tail_bytes) if tail_bytes else io.BytesIO()
+
+    stdout = new_sink()
+    stderr = new_sink()
+    log_id = log.log_id if log is not None else None
+
+    pumps = asyncio.gather(
+        _pump("stdout", proc.stdout, stdout, log, on_line),
+        _pump("stderr", proc.stderr, stderr, log, on_line),
+        proc.wait(),
+    )
     try:
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout
-        )
+        await asyncio.wait_for(pumps, timeout=timeout)
         return ExecutionResult(
-            stdout=stdout.decode(),
-            stderr=stderr.decode(),
-            exit_code=proc.returncode or 0
+            stdout=decode_tail(stdout),
+            stderr=decode_tail(stderr),
+            exit_code=proc.returncode or 0,
+            log_id=log_id
         )
     except asyncio.TimeoutError:
-        proc.kill()
-        await proc.wait()
+        await kill_process_tree(proc)
+        message = f"Command timed out after {timeout}s"
+        if log is not None:
+            log.write(f"{message}\n".encode())
         return ExecutionResult(
-            stdout="",
-            stderr=f"Command timed out after {timeout}s",
-            exit_code=124
+            stdout=decode_tail(stdout),
+            stderr=message,
+            exit_code=124,
+            log_id=log_id
         )
+    except BaseException:
+        # Cancellation or a failing callback must not leave the process running
+        await kill_process_tree(proc)
+        raise
+    finally:
+        # When wait_for cancels the gather, the gather is left holding a
+        # CancelledError nobody retrieves, which asyncio logs as an error
+        if pumps.done() and not pumps.cancelled():
+            pumps.exception()
+
+
+# Called with the run's log once the process starts (after any queueing)
+StartCallback = Callable[[LogWriter], None]
+
+
+@dataclass
+class _Listener:
+    """One caller's line callback, and where its failure is reported."""
+    callback: LineCallback
+    failed: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+@dataclass
+class _SharedRun:
+    """Subscribers of one (possibly shared) fastlane run."""
+    line_listeners: list[_Listener] = field(default_factory=list)
+    start_listeners: list[StartCallback] = field(default_factory=list)
+    log: LogWriter | None = None
+
+    async def broadcast(self, stream: str, line: str) -> None:
+        """Deliver a line to every caller attached to the run.
+
+        A callback that raises is detached and its exception goes to its
+        own caller only; the run carries on for everyone else.
+        """
+        for listener in list(self.line_listeners):
+            try:
+                result = listener.callback(stream, line)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.line_listeners.remove(listener)
+                listener.failed.set_exception(e)
+
+    def started(self, log: LogWriter) -> None:
+        self.log = log
+        for listener in list(self.start_listeners):
+            listener(log)
+
+
+# Identical fastlane runs currently executing, and their subscribers
+_inflight: SingleFlight[ExecutionResult] = SingleFlight()
+_shared_runs: dict[tuple, _SharedRun] = {}
 
 
 async def execute_fastlane(
     lane: str,
     platform: str,
     project_path: Path,
-    env_vars: dict[str, str] | None = None
+    env_vars: dict[str, str] | None = None,
+    on_line: LineCallback | None = None,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+    on_start: StartCallback | None = None,
+    fastlane: FastlaneCommand | None = None
 ) -> ExecutionResult:
     """Execute a fastlane lane.
 
+    Output is streamed rather than buffered: the result keeps only a
+    bounded tail of each stream, while the complete log is spooled to
+    disk and identified by the result's log_id.
+
+    Identical concurrent requests (same project, platform, lane, env vars
+    and source fingerprint) share a single fastlane process: later callers
+    attach to the in-flight run, receive its remaining output lines and
+    the same ExecutionResult.
+
+    The run waits for a slot from the shared build scheduler, which caps
+    concurrent builds per platform and per project directory. When warm
+    workers are enabled (FASTLANE_MCP_WARM_WORKERS), the lane runs on a
+    pre-booted fastlane process if one is available. Projects whose
+    Gemfile.lock pins fastlane run it through bundler (see BundlerResolver).
+
     Args:
         lane: The lane name to execute
         platform: Platform (ios or android)
         project_path: Path to the project root
         env_vars: Additional environment variables
+        on_line: Optional callback invoked with (stream, line) for each line;
+            an exception it raises stops this call and is re-raised
+        tail_bytes: Bytes of each stream kept in the returned result
+        on_start: Optional callback invoked with the log writer once the
+            process has left the queue and started
+        fastlane: How to invoke fastlane, if already resolved for this
+            project; otherwise resolved with the shared BundlerResolver
 
     Returns:
-        ExecutionResult with stdout, stderr, and exit code
+        ExecutionResult with the output tail, exit code, log id and the
+        time spent queued
 
     Raises:
         ValueError: If platform is invalid
@@ -99,9 +230,82 @@ async def execute_fastlane(
     # Find correct working directory (handles both RN and native projects)
     execution_dir = find_execution_dir(project_path, platform)
 
-    return await execute_command(
-        "fastlane",
-        [safe_lane],
-        cwd=execution_dir,
-        env=env_vars
+    key = (
+        str(Path(project_path).resolve()),
+        platform,
+        safe_lane,
+        frozenset((env_vars or {}).items()),
+        source_fingerprint(execution_dir),
     )
+    shared = _shared_runs.setdefault(key, _SharedRun())
+    listener = _Listener(on_line) if on_line is not None else None
+    if listener is not None:
+        shared.line_listeners.append(listener)
+    if on_start is not None:
+        if shared.log is not None:
+            on_start(shared.log)
+        else:
+            shared.start_listeners.append(on_start)
+
+    def release_shared() -> None:
+        if _shared_runs.get(key) is shared:
+            del _shared_runs[key]
+
+    async def run() -> ExecutionResult:
+        try:
+            # Honour the project's Gemfile (bundle exec or binstub) if it pins fastlane
+            command = fastlane or await bundler.resolve(execution_dir, Path(project_path))
+
+            async with scheduler.slot(platform, str(execution_dir)) as waited:
+                log = open_log()
+                shared.started(log)
+                try:
+                    # A warm worker skips fastlane's boot; None means run cold
+                    result = await worker_pool.run(
+                        execution_dir,
+                        safe_lane,
+                        env_vars,
+                        on_line=shared.broadcast,
+                        tail_bytes=tail_bytes,
+                        log=log,
+                        launcher=command.worker_launcher,
+                        launcher_env=command.env
+                    )
+                    if result is None:
+                        result = await execute_command(
+                            command.program,
+                            [*command.args, safe_lane],
+                            cwd=execution_dir,
+                            env={**command.env, **(env_vars or {})},
+                            on_line=shared.broadcast,
+                            tail_bytes=tail_bytes,
+                            log=log
+                        )
+                finally:
+                    log.close()
+        finally:
+            # Later identical requests start a fresh run with a fresh log
+            release_shared()
+
+        result.queue_wait = waited
+        return result
+
+    flight = asyncio.ensure_future(_inflight.do(key, run))
+    try:
+        if listener is None:
+            return await flight
+        await asyncio.wait([flight, listener.failed], return_when=asyncio.FIRST_COMPLETED)
+        if listener.failed.done():
+            raise listener.failed.exception()
+        return flight.result()
+    finally:
+        if not flight.done():
+            # Stops the run too if no other caller is attached
+            flight.cancel()
+            await asyncio.wait([flight])
+        if listener in shared.line_listeners:
+            shared.line_listeners.remove(listener)
+        if on_start in shared.start_listeners:
+            shared.start_listeners.remove(on_start)
+        if not _inflight.in_flight(key):
+            release_shared()
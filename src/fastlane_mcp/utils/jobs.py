@@ -0,0 +1,200 @@
+"""Background build jobs."""
+
+import asyncio
+import secrets
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from fastlane_mcp.errors.history import FailureSignature, failure_history, failure_signature
+from fastlane_mcp.errors.streaming import EarlyAbort, StreamingDiagnoser
+from fastlane_mcp.utils.bundler import FastlaneCommand
+from fastlane_mcp.utils.executor import ExecutionResult, execute_fastlane
+from fastlane_mcp.utils.logs import LogWriter, LogChunk, read_log, DEFAULT_READ_LENGTH
+from fastlane_mcp.utils.progress import StepTracker
+
+# Finished jobs kept for status queries; the oldest are forgotten first
+MAX_FINISHED_JOBS = 100
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a background build."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class BuildJob:
+    """A fastlane lane running in the background."""
+    job_id: str
+    platform: str
+    lane: str
+    project_path: Path
+    env_vars: dict[str, str] = field(default_factory=dict)
+    fastlane: FastlaneCommand | None = None
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    lines: int = 0
+    last_line: str | None = None
+    result: ExecutionResult | None = None
+    error: str | None = None
+    steps: StepTracker = field(default_factory=StepTracker, repr=False)
+    diagnoser: StreamingDiagnoser = field(default_factory=StreamingDiagnoser, repr=False)
+    log: LogWriter | None = field(default=None, repr=False)
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    @property
+    def log_id(self) -> str | None:
+        return self.log.log_id if self.log is not None else None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started running (0 while queued)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def read_output(self, offset: int = 0, length: int = DEFAULT_READ_LENGTH) -> LogChunk | None:
+        """Read output written since offset, or None before the job starts."""
+        if self.log is None:
+            return None
+        self.log.flush()
+        return read_log(self.log.log_id, offset, length)
+
+    def _on_start(self, log: LogWriter) -> None:
+        self.log = log
+        self.status = JobStatus.RUNNING
+        self.started_at = time.time()
+
+    def _on_line(self, stream: str, line: str) -> None:
+        self.lines += 1
+        self.last_line = line
+        self.steps.feed(line)
+        self.diagnoser.feed_line(stream, line)
+
+
+class JobManager:
+    """Starts, tracks and cancels background builds."""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self._jobs: dict[str, BuildJob] = {}
+
+    def start(
+        self,
+        lane: str,
+        platform: str,
+        project_path: Path,
+        env_vars: dict[str, str] | None = None,
+        abort_on: frozenset[str] = frozenset(),
+        fastlane: FastlaneCommand | None = None
+    ) -> BuildJob:
+        """Start a lane in the background and return immediately.
+
+        Must be called from a running event loop.
+
+        Args:
+            lane: The lane name to execute
+            platform: Platform (ios or android)
+            project_path: Path to the project root
+            env_vars: Additional environment variables
+            abort_on: Error pattern ids that stop the build as soon as
+                they appear in its output
+            fastlane: How to invoke fastlane, if already resolved
+
+        Returns:
+            The queued BuildJob
+        """
+        self._evict()
+        job = BuildJob(
+            job_id=secrets.token_hex(6),
+            platform=platform,
+            lane=lane,
+            project_path=project_path,
+            env_vars=dict(env_vars or {}),
+            fastlane=fastlane,
+            diagnoser=StreamingDiagnoser(abort_on=abort_on),
+        )
+        job.task = asyncio.create_task(self._run(job))
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> BuildJob | None:
+        """Look up a job by id."""
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[BuildJob]:
+        """All tracked jobs, oldest first."""
+        return list(self._jobs.values())
+
+    async def cancel(self, job_id: str) -> BuildJob | None:
+        """Cancel a job, killing its fastlane process.
+
+        Returns:
+            The job, or None if unknown
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+        return job
+
+    async def _run(self, job: BuildJob) -> None:
+        try:
+            job.result = await execute_fastlane(
+                job.lane,
+                job.platform,
+                job.project_path,
+                job.env_vars,
+                on_line=job._on_line,
+                on_start=job._on_start,
+                fastlane=job.fastlane,
+            )
+            job.status = JobStatus.SUCCEEDED if job.result.exit_code == 0 else JobStatus.FAILED
+            job.diagnoser.close()
+            await self._record(job, self._signature(job) if job.status is JobStatus.FAILED else None)
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+            raise
+        except EarlyAbort as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            await self._record(job, failure_signature([e.match], ""))
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+
+    @staticmethod
+    def _signature(job: BuildJob) -> FailureSignature:
+        tail = job.result.stderr or job.result.stdout
+        return failure_signature(job.diagnoser.matches or job.diagnoser.matcher.find_all(tail), tail)
+
+    @staticmethod
+    async def _record(job: BuildJob, failure: FailureSignature | None) -> None:
+        await failure_history.record(str(job.project_path), job.platform, job.lane, failure, log_id=job.log_id)
+
+    def _evict(self) -> None:
+        finished = [job for job in self._jobs.values() if job.done]
+        for job in finished[:max(len(finished) - self.max_finished + 1, 0)]:
+            del self._jobs[job.job_id]
+
+
+jobs = JobManager()
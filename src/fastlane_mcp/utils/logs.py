@@ -0,0 +1,203 @@
+"""Bounded in-memory output tails and on-disk build log spooling."""
+
+import os
+import re
+import secrets
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastlane_mcp.utils.config import env_int
+
+# Keep at most this many spooled logs; the oldest are deleted first
+DEFAULT_MAX_LOGS = 50
+
+# Default and maximum number of bytes returned by a single read_log() call
+DEFAULT_READ_LENGTH = 64 * 1024
+MAX_READ_LENGTH = 1024 * 1024
+
+LOG_SUFFIX = ".log"
+
+# Log ids are generated by open_log(); anything else is rejected
+LOG_ID_PATTERN = re.compile(r'^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$')
+
+
+class RingBuffer:
+    """Fixed-size byte buffer that retains only the most recent data."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("RingBuffer capacity must be positive")
+        self.capacity = capacity
+        self.total_written = 0
+        self._buffer = bytearray(capacity)
+        self._pos = 0
+
+    def write(self, data: bytes) -> None:
+        """Append data, overwriting the oldest bytes once full."""
+        self.total_written += len(data)
+        if len(data) >= self.capacity:
+            self._buffer[:] = data[-self.capacity:]
+            self._pos = 0
+            return
+
+        end = self._pos + len(data)
+        if end <= self.capacity:
+            self._buffer[self._pos:end] = data
+        else:
+            split = self.capacity - self._pos
+            self._buffer[self._pos:] = data[:split]
+            self._buffer[:end - self.capacity] = data[split:]
+        self._pos = end % self.capacity
+
+    @property
+    def truncated(self) -> bool:
+        """Whether older data has been discarded."""
+        return self.total_written > self.capacity
+
+    def getvalue(self) -> bytes:
+        """Return the retained bytes in write order."""
+        if self.total_written < self.capacity:
+            return bytes(self._buffer[:self._pos])
+        return bytes(self._buffer[self._pos:] + self._buffer[:self._pos])
+
+
+def log_dir() -> Path:
+    """Directory where build logs are spooled.
+
+    Uses FASTLANE_MCP_LOG_DIR if set, otherwise a folder in the system
+    temp directory.
+    """
+    configured = os.environ.get("FASTLANE_MCP_LOG_DIR")
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "fastlane-mcp-logs"
+
+
+class LogWriter:
+    """Append-only writer for a single spooled log file."""
+
+    def __init__(self, log_id: str, path: Path):
+        self.log_id = log_id
+        self.path = path
+        self.size = 0
+        self._file = open(path, "wb")
+
+    def write(self, data: bytes) -> None:
+        """Append raw bytes to the log."""
+        self._file.write(data)
+        self.size += len(data)
+
+    def flush(self) -> None:
+        """Make written data visible to readers."""
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        if not self._file.closed:
+            self._file.close()
+
+
+def _rotate(directory: Path, keep: int) -> None:
+    """Delete the oldest logs so that at most keep remain."""
+    def age_key(path: Path) -> tuple[int, str]:
+        try:
+            return path.stat().st_mtime_ns, path.name
+        except OSError:
+            return 0, path.name
+
+    logs = sorted(directory.glob(f"*{LOG_SUFFIX}"), key=age_key)
+    for stale in logs[:max(len(logs) - keep, 0)]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def open_log() -> LogWriter:
+    """Create a new spooled log file, rotating out old ones.
+
+    The number of logs kept is FASTLANE_MCP_MAX_LOGS (default 50).
+
+    Returns:
+        A LogWriter for the new log
+    """
+    directory = log_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    # The new log counts towards the limit
+    _rotate(directory, env_int("FASTLANE_MCP_MAX_LOGS", DEFAULT_MAX_LOGS) - 1)
+
+    log_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(4)}"
+    return LogWriter(log_id, directory / f"{log_id}{LOG_SUFFIX}")
+
+
+def log_path(log_id: str) -> Path:
+    """Resolve a log id to its file path.
+
+    Raises:
+        ValueError: If the log id is malformed
+        FileNotFoundError: If the log no longer exists
+    """
+    if not LOG_ID_PATTERN.match(log_id or ""):
+        raise ValueError(f"Invalid log id: {log_id}")
+
+    path = log_dir() / f"{log_id}{LOG_SUFFIX}"
+    if not path.exists():
+        raise FileNotFoundError(f"Log not found (it may have been rotated out): {log_id}")
+    return path
+
+
+@dataclass
+class LogChunk:
+    """A byte range read from a spooled log."""
+    log_id: str
+    offset: int
+    next_offset: int
+    size: int
+    data: str
+
+    @property
+    def eof(self) -> bool:
+        """Whether the chunk reaches the current end of the log."""
+        return self.next_offset >= self.size
+
+
+def read_log(
+    log_id: str,
+    offset: int = 0,
+    length: int = DEFAULT_READ_LENGTH
+) -> LogChunk:
+    """Read a byte range from a spooled log.
+
+    Args:
+        log_id: Id returned with a build result
+        offset: Byte offset to start from; negative values count from the end
+        length: Maximum bytes to read (capped at MAX_READ_LENGTH)
+
+    Returns:
+        LogChunk with the decoded data and the offset to continue from
+
+    Raises:
+        ValueError: If the log id is malformed
+        FileNotFoundError: If the log does not exist
+    """
+    path = log_path(log_id)
+    length = max(0, min(length, MAX_READ_LENGTH))
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if offset < 0:
+            offset = max(size + offset, 0)
+        offset = min(offset, size)
+        f.seek(offset)
+        data = f.read(length)
+
+    return LogChunk(
+        log_id=log_id,
+        offset=offset,
+        next_offset=offset + len(data),
+        size=size,
+        data=data.decode(errors="replace"),
+    )
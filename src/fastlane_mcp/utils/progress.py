@@ -0,0 +1,66 @@
+"""Build progress tracking from fastlane step markers."""
+
+import re
+import time
+from dataclasses import dataclass
+
+# fastlane announces each action as "--- Step: gym ---"; some output
+# (e.g. the summary table and plugin runners) uses "[step: 3] gym" instead
+STEP_PATTERN = re.compile(
+    r'--- Step: (?P<banner>.+?) ---|\[step: (?P<index>\d+)\]\s*(?P<name>.*)',
+    re.I,
+)
+
+
+@dataclass
+class StepEvent:
+    """A fastlane step that has just started."""
+    index: int
+    name: str
+    elapsed: float
+
+    @property
+    def message(self) -> str:
+        """Human-readable progress message."""
+        return f"Step {self.index}: {self.name} ({self.elapsed:.0f}s elapsed)"
+
+
+class StepTracker:
+    """Detects fastlane step banners in streamed output lines."""
+
+    def __init__(self):
+        self.index = 0
+        self.current: str | None = None
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since tracking started."""
+        return time.monotonic() - self._started
+
+    def feed(self, line: str) -> StepEvent | None:
+        """Inspect one output line.
+
+        Args:
+            line: A line of fastlane output
+
+        Returns:
+            StepEvent if the line starts a new step, None otherwise
+        """
+        # Cheap substring test first; the regex only runs on candidate lines
+        if "tep: " not in line:
+            return None
+
+        match = STEP_PATTERN.search(line)
+        if match is None:
+            return None
+
+        if match.group("banner"):
+            self.index += 1
+            name = match.group("banner").strip()
+        else:
+            self.index = int(match.group("index"))
+            name = match.group("name").strip() or self.current or "unknown"
+
+        self.current = name
+        return StepEvent(index=self.index, name=name, elapsed=self.elapsed)
@@ -0,0 +1,126 @@
+"""In-process lookup of executables on PATH."""
+
+import os
+import time
+from dataclasses import dataclass
+
+from fastlane_mcp.utils.config import env_int
+
+# Seconds a resolved (or missing) tool is remembered before PATH is checked again
+DEFAULT_TTL = 30
+
+
+@dataclass
+class _Listing:
+    """Contents of one PATH directory as of its mtime."""
+    mtime_ns: int
+    names: frozenset[str]
+
+
+def _is_executable(path: str) -> bool:
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+class ToolResolver:
+    """Finds executables on PATH without spawning `which`.
+
+    Each PATH directory is listed once and re-listed only when its mtime
+    changes (which happens whenever an entry is added, removed or renamed),
+    so a lookup normally costs one stat() per directory. Results are also
+    cached per (tool, PATH) for ttl seconds, during which a lookup costs
+    nothing.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl if ttl is not None else env_int("FASTLANE_MCP_TOOL_CACHE_TTL", DEFAULT_TTL)
+        self._listings: dict[str, _Listing] = {}
+        self._results: dict[tuple[str, str], tuple[str | None, float]] = {}
+
+    def resolve(self, name: str, path: str | None = None) -> str | None:
+        """Resolve a tool name to an absolute executable path.
+
+        Args:
+            name: Tool name, e.g. "fastlane"; names containing a slash are
+                checked as paths rather than searched for
+            path: PATH string to search (default: the current PATH)
+
+        Returns:
+            Absolute path of the executable, or None if not found
+        """
+        return self.resolve_all([name], path)[name]
+
+    def resolve_all(self, names: list[str], path: str | None = None) -> dict[str, str | None]:
+        """Resolve several tools with a single pass over PATH.
+
+        Args:
+            names: Tool names to resolve
+            path: PATH string to search (default: the current PATH)
+
+        Returns:
+            Mapping of each name to its absolute path, or None if not found
+        """
+        search_path = os.environ.get("PATH", os.defpath) if path is None else path
+        now = time.monotonic()
+        resolved: dict[str, str | None] = {}
+        pending: list[str] = []
+
+        for name in dict.fromkeys(names):
+            if os.sep in name:
+                resolved[name] = os.path.abspath(name) if _is_executable(name) else None
+                continue
+            cached = self._results.get((name, search_path))
+            if cached is not None and cached[1] > now:
+                resolved[name] = cached[0]
+            else:
+                pending.append(name)
+
+        if pending:
+            found = self._search(pending, search_path)
+            expires = now + self.ttl
+            for name in pending:
+                resolved[name] = found.get(name)
+                self._results[(name, search_path)] = (resolved[name], expires)
+
+        return resolved
+
+    def clear(self) -> None:
+        """Forget all directory listings and cached results."""
+        self._listings.clear()
+        self._results.clear()
+
+    def _search(self, names: list[str], search_path: str) -> dict[str, str]:
+        remaining = set(names)
+        found: dict[str, str] = {}
+        for directory in search_path.split(os.pathsep):
+            if not remaining:
+                break
+            # An empty PATH entry means the current directory
+            directory = os.path.abspath(directory or os.curdir)
+            listing = self._listing(directory)
+            if listing is None:
+                continue
+            for name in remaining & listing.names:
+                candidate = os.path.join(directory, name)
+                if _is_executable(candidate):
+                    found[name] = candidate
+            remaining -= found.keys()
+        return found
+
+    def _listing(self, directory: str) -> _Listing | None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._listings.pop(directory, None)
+            return None
+
+        listing = self._listings.get(directory)
+        if listing is None or listing.mtime_ns != mtime_ns:
+            try:
+                names = frozenset(os.listdir(directory))
+            except OSError:
+                return None
+            listing = self._listings[directory] = _Listing(mtime_ns, names)
+        return listing
+
+
+tool_resolver = ToolResolver()
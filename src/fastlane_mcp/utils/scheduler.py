@@ -0,0 +1,166 @@
+"""Host-wide build concurrency limits."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from fastlane_mcp.utils.config import env_int
+
+# Concurrent builds allowed per platform on this host
+DEFAULT_PLATFORM_LIMITS = {"ios": 1, "android": 2}
+
+# Concurrent builds allowed within a single project directory
+DEFAULT_PROJECT_LIMIT = 1
+
+
+@dataclass
+class SlotStats:
+    """Queue statistics for one concurrency slot."""
+    limit: int
+    running: int = 0
+    queued: int = 0
+    completed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "queued": self.queued,
+            "completed": self.completed,
+            "average_wait_seconds": round(self.total_wait / self.completed, 3) if self.completed else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+class _Slot:
+    """A semaphore that keeps queue statistics."""
+
+    def __init__(self, limit: int):
+        self.stats = SlotStats(limit=limit)
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @property
+    def idle(self) -> bool:
+        return self.stats.running == 0 and self.stats.queued == 0
+
+    async def acquire(self) -> float:
+        """Wait for a free slot and return the time spent waiting."""
+        start = time.monotonic()
+        self.stats.queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.stats.queued -= 1
+        self.stats.running += 1
+        return time.monotonic() - start
+
+    def release(self, waited: float) -> None:
+        self.stats.running -= 1
+        self.stats.completed += 1
+        self.stats.total_wait += waited
+        self.stats.max_wait = max(self.stats.max_wait, waited)
+        self._semaphore.release()
+
+
+class BuildScheduler:
+    """Queues builds so at most N run per platform and per project.
+
+    Builds first wait for a slot in their project directory, then for a
+    platform slot, so a queued duplicate of a running project build never
+    holds a platform slot another project could use.
+    """
+
+    def __init__(
+        self,
+        platform_limits: dict[str, int] | None = None,
+        project_limit: int = DEFAULT_PROJECT_LIMIT
+    ):
+        self.platform_limits = dict(DEFAULT_PLATFORM_LIMITS)
+        self.project_limit = project_limit
+        self.configure(platform_limits)
+
+    @classmethod
+    def from_env(cls) -> "BuildScheduler":
+        """Create a scheduler using FASTLANE_MCP_MAX_*_BUILDS settings."""
+        return cls(
+            platform_limits={
+                "ios": env_int("FASTLANE_MCP_MAX_IOS_BUILDS", DEFAULT_PLATFORM_LIMITS["ios"]),
+                "android": env_int("FASTLANE_MCP_MAX_ANDROID_BUILDS", DEFAULT_PLATFORM_LIMITS["android"]),
+            },
+            project_limit=env_int("FASTLANE_MCP_MAX_BUILDS_PER_PROJECT", DEFAULT_PROJECT_LIMIT),
+        )
+
+    def configure(
+        self,
+        platform_limits: dict[str, int] | None = None,
+        project_limit: int | None = None
+    ) -> None:
+        """Set concurrency limits.
+
+        Intended to be called at startup; builds already queued keep the
+        limits they were queued under. Limits not given are left unchanged.
+
+        Args:
+            platform_limits: Maximum concurrent builds per platform
+            project_limit: Maximum concurrent builds per project directory
+        """
+        self.platform_limits.update(platform_limits or {})
+        if project_limit is not None:
+            self.project_limit = project_limit
+        self._platforms = {
+            name: _Slot(limit) for name, limit in self.platform_limits.items()
+        }
+        self._projects: dict[str, _Slot] = {}
+
+    @asynccontextmanager
+    async def slot(self, platform: str, project_key: str) -> AsyncIterator[float]:
+        """Hold a build slot for the duration of the block.
+
+        Args:
+            platform: Platform being built (ios or android)
+            project_key: Identifies the project, e.g. its resolved path
+
+        Yields:
+            Seconds spent queued before the slot was granted
+        """
+        project = self._projects.get(project_key)
+        if project is None:
+            project = self._projects[project_key] = _Slot(self.project_limit)
+        platform_slot = self._platforms[platform]
+
+        try:
+            project_wait = await project.acquire()
+            try:
+                platform_wait = await platform_slot.acquire()
+            except BaseException:
+                project.release(project_wait)
+                raise
+
+            try:
+                yield project_wait + platform_wait
+            finally:
+                platform_slot.release(platform_wait)
+                project.release(project_wait)
+        finally:
+            if project.idle and self._projects.get(project_key) is project:
+                del self._projects[project_key]
+
+    def stats(self) -> dict:
+        """Report running and queued builds with wait times."""
+        return {
+            "platforms": {
+                name: slot.stats.to_dict() for name, slot in self._platforms.items()
+            },
+            "projects": {
+                key: slot.stats.to_dict() for key, slot in self._projects.items()
+            },
+        }
+
+
+# Limits come from the environment; the CLI may override them before serving
+scheduler = BuildScheduler.from_env()
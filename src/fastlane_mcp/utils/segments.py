@@ -0,0 +1,290 @@
+"""Segmenting spooled build logs into steps, phases and tasks."""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastlane_mcp.utils.logs import DEFAULT_MAX_LOGS, log_path
+
+# Bytes read from a log per chunk while indexing
+INDEX_CHUNK_SIZE = 1024 * 1024
+
+# Segment kinds, most specific first
+SEGMENT_KINDS = ("phase", "task", "target", "step")
+
+# fastlane prefixes command output with a timestamp and a "▸ " marker
+_PREFIX = re.compile(rb'^(?:\[[0-9:]+\]: )?(?:\xe2\x96\xb8 )?')
+
+_STEP = re.compile(rb'-{3} Step: (?P<name>.+?) -{3}')
+_GRADLE_TASK = re.compile(rb'^> Task (?P<name>:\S+)(?: (?P<status>[A-Z][A-Z-]*))?\s*$')
+_XCODE_TARGET = re.compile(rb'^=== BUILD TARGET (?P<name>.+?) OF PROJECT ')
+# e.g. "CompileSwift normal arm64 /path/View.swift (in target 'App' from project 'App')"
+_XCODE_PHASE = re.compile(rb"^(?P<name>[A-Z][A-Za-z]+) .*\(in target '(?P<target>[^']+)' from project '[^']+'\)$")
+
+# Lines after which no xcodebuild phase or gradle task is running
+_BUILD_END_MARKERS = (
+    b"** BUILD ",
+    b"** ARCHIVE ",
+    b"** TEST ",
+    b"The following build commands failed:",
+    b"BUILD SUCCESSFUL",
+    b"BUILD FAILED",
+    b"FAILURE: Build failed",
+)
+_FAILED_COMMANDS = b"The following build commands failed:"
+
+
+def _is_error_line(line: bytes) -> bool:
+    """Compiler, xcodebuild, kotlinc and xcpretty error lines."""
+    return (
+        b"error: " in line
+        or line.startswith(b"e: ")
+        or line.startswith(b"\xe2\x9d\x8c")  # ❌ (xcpretty)
+    )
+
+
+@dataclass
+class LogSegment:
+    """A byte range of a build log belonging to one unit of work."""
+    index: int
+    # "step" (fastlane action), "target" (xcodebuild target),
+    # "phase" (xcodebuild build phase) or "task" (gradle task)
+    kind: str
+    name: str
+    start: int
+    # Byte offset just past the segment; None while it is still open
+    end: int | None = None
+    # The full phase or task line, e.g. "CompileSwift normal arm64 /path/View.swift"
+    detail: str | None = None
+    target: str | None = None
+    # Index of the enclosing fastlane step
+    parent: int | None = None
+    errors: int = 0
+    failed: bool = False
+
+    def to_dict(self, log_size: int) -> dict:
+        """Convert to a JSON-serializable dict, closing open segments at log_size."""
+        end = self.end if self.end is not None else log_size
+        return {
+            "index": self.index,
+            "kind": self.kind,
+            "name": self.name,
+            "detail": self.detail,
+            "target": self.target,
+            "parent": self.parent,
+            "start": self.start,
+            "end": end,
+            "size": end - self.start,
+            "errors": self.errors,
+            "failed": self.failed,
+        }
+
+
+class LogIndex:
+    """Segments found in one spooled log.
+
+    The log is read incrementally: update() indexes only the complete lines
+    appended since the previous call, so a running build's log can be
+    re-indexed cheaply while it grows.
+    """
+
+    def __init__(self, log_id: str):
+        self.log_id = log_id
+        self.segments: list[LogSegment] = []
+        self.indexed = 0
+        self._open: dict[str, LogSegment] = {}
+        self._phases_by_detail: dict[str, LogSegment] = {}
+        self._in_failed_commands = False
+
+    def update(self) -> None:
+        """Index lines written since the last update.
+
+        Raises:
+            ValueError: If the log id is malformed
+            FileNotFoundError: If the log no longer exists
+        """
+        path = log_path(self.log_id)
+        with open(path, "rb") as f:
+            f.seek(self.indexed)
+            pending = b""
+            offset = self.indexed
+            while True:
+                chunk = f.read(INDEX_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    self._feed(line, offset)
+                    offset += len(line) + 1
+        self.indexed = offset
+
+    def select(
+        self,
+        kind: str | None = None,
+        name: str | None = None,
+        failed_only: bool = False
+    ) -> list[LogSegment]:
+        """Segments matching all given filters, in log order.
+
+        Args:
+            kind: Segment kind to keep
+            name: Case-insensitive substring of the name or detail
+            failed_only: Keep only segments that failed or logged errors
+        """
+        needle = name.lower() if name else None
+        return [
+            segment for segment in self.segments
+            if (kind is None or segment.kind == kind)
+            and (not failed_only or segment.failed)
+            and (needle is None or needle in segment.name.lower()
+                 or (segment.detail is not None and needle in segment.detail.lower()))
+        ]
+
+    def _feed(self, line: bytes, offset: int) -> None:
+        line = line.rstrip(b"\r")
+        body = line[_PREFIX.match(line).end():]
+
+        if self._in_failed_commands:
+            if body.startswith((b"\t", b"  ")):
+                phase = self._phases_by_detail.get(body.strip().decode(errors="replace"))
+                if phase is not None:
+                    phase.failed = True
+                return
+            self._in_failed_commands = False
+
+        if b"Step: " in body and (match := _STEP.search(body)):
+            for kind in SEGMENT_KINDS:
+                self._close(kind, offset)
+            self._start("step", match.group("name"), offset)
+            return
+
+        if body.startswith(b"> Task :") and (match := _GRADLE_TASK.match(body)):
+            self._close("task", offset)
+            task = self._start("task", match.group("name"), offset, detail=body)
+            if match.group("status") == b"FAILED":
+                task.failed = True
+            return
+
+        if body.startswith(b"=== BUILD TARGET ") and (match := _XCODE_TARGET.match(body)):
+            self._close("phase", offset)
+            self._close("target", offset)
+            self._start("target", match.group("name"), offset)
+            return
+
+        if body.endswith(b"')") and (match := _XCODE_PHASE.match(body)):
+            self._close("phase", offset)
+            phase = self._start(
+                "phase", match.group("name"), offset,
+                detail=body, target=match.group("target").decode(errors="replace")
+            )
+            self._phases_by_detail[phase.detail] = phase
+            return
+
+        if body.startswith(_BUILD_END_MARKERS):
+            self._close("phase", offset)
+            self._close("task", offset)
+            self._close("target", offset)
+            if body.startswith(_FAILED_COMMANDS):
+                self._in_failed_commands = True
+            return
+
+        if _is_error_line(body):
+            for segment in self._open.values():
+                segment.errors += 1
+                segment.failed = True
+
+    def _start(
+        self,
+        kind: str,
+        name: bytes,
+        offset: int,
+        detail: bytes | None = None,
+        target: str | None = None
+    ) -> LogSegment:
+        step = self._open.get("step")
+        segment = LogSegment(
+            index=len(self.segments),
+            kind=kind,
+            name=name.decode(errors="replace").strip(),
+            start=offset,
+            detail=detail.decode(errors="replace").strip() if detail is not None else None,
+            target=target,
+            parent=step.index if step is not None and kind != "step" else None,
+        )
+        self.segments.append(segment)
+        self._open[kind] = segment
+        return segment
+
+    def _close(self, kind: str, offset: int) -> None:
+        segment = self._open.pop(kind, None)
+        if segment is not None:
+            segment.end = offset
+
+
+class LogIndexCache:
+    """Keeps the indexes of recently inspected logs.
+
+    Indexing a large log takes seconds; call get (and failed_segments)
+    from a thread. Updates are serialized, so an index is never updated
+    by two threads at once.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_LOGS):
+        self.max_entries = max_entries
+        self._indexes: OrderedDict[str, LogIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, log_id: str) -> LogIndex:
+        """Return the log's index, brought up to date with the file.
+
+        Raises:
+            ValueError: If the log id is malformed
+            FileNotFoundError: If the log does not exist
+        """
+        with self._lock:
+            return self._get(log_id)
+
+    def _get(self, log_id: str) -> LogIndex:
+        index = self._indexes.get(log_id)
+        if index is None:
+            index = LogIndex(log_id)
+        try:
+            index.update()
+        except (ValueError, FileNotFoundError):
+            self._indexes.pop(log_id, None)
+            raise
+        self._indexes[log_id] = index
+        self._indexes.move_to_end(log_id)
+        while len(self._indexes) > self.max_entries:
+            self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        """Forget all indexes."""
+        with self._lock:
+            self._indexes.clear()
+
+
+def most_specific(segments: list[LogSegment]) -> list[LogSegment]:
+    """Order segments so phases and tasks come before targets and steps."""
+    return sorted(segments, key=lambda segment: (SEGMENT_KINDS.index(segment.kind), segment.start))
+
+
+def failed_segments(log_id: str | None, limit: int = 5) -> list[dict]:
+    """The most specific failed segments of a log, for error reports.
+
+    Returns:
+        Segment dicts, or an empty list if the log is unknown or has none
+    """
+    if log_id is None:
+        return []
+    try:
+        index = log_indexes.get(log_id)
+    except (ValueError, FileNotFoundError):
+        return []
+    return [segment.to_dict(index.indexed) for segment in most_specific(index.select(failed_only=True))[:limit]]
+
+
+log_indexes = LogIndexCache()
@@ -0,0 +1,127 @@
+"""Deduplication of identical concurrent operations."""
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Files whose metadata stands in for "the project changed" in a fingerprint
+FINGERPRINT_FILES = (
+    "Gemfile.lock",
+    "Podfile.lock",
+    "package.json",
+    "build.gradle",
+    "fastlane/Fastfile",
+    "fastlane/Appfile",
+    "fastlane/Pluginfile",
+    "fastlane/Matchfile",
+    "fastlane/.env",
+)
+
+
+class _Call(Generic[T]):
+    """An in-flight operation and the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task[T]):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one operation per key at a time.
+
+    Callers that arrive while an operation with the same key is running
+    attach to it and receive the same result (or exception) instead of
+    starting a duplicate. The operation runs in its own task and is only
+    cancelled once every attached caller has been cancelled; the last
+    caller's cancellation waits for the operation to finish cleaning up.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call[T]] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether an operation with this key is currently running."""
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or attach to the running call with the same key.
+
+        Args:
+            key: Identifies equivalent operations
+            fn: Starts the operation; only called if none is in flight
+
+        Returns:
+            The result of the (possibly shared) operation
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+                await asyncio.wait([call.task])
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: Hashable, call: _Call[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+def _stat_token(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return f"{path.name}:-"
+    return f"{path.name}:{st.st_mtime_ns}:{st.st_size}:{st.st_ino}"
+
+
+def source_fingerprint(project_dir: Path) -> str:
+    """Cheaply fingerprint the state of a project's source tree.
+
+    Combines the checked-out git commit, the git index, and the metadata of
+    the files that drive a fastlane build. It does not hash file contents,
+    so it is O(1) in the size of the tree; uncommitted edits to sources not
+    listed in FINGERPRINT_FILES are not detected.
+
+    Args:
+        project_dir: Directory fastlane runs in
+
+    Returns:
+        Hex digest identifying the current source state
+    """
+    digest = hashlib.sha256()
+
+    git_dir = next(
+        (d / ".git" for d in (project_dir, *project_dir.parents) if (d / ".git").is_dir()),
+        None,
+    )
+    if git_dir is not None:
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        digest.update(head.encode())
+        if head.startswith("ref: "):
+            try:
+                digest.update((git_dir / head[5:]).read_bytes())
+            except OSError:
+                # Ref only exists in packed form
+                digest.update(_stat_token(git_dir / "packed-refs").encode())
+        digest.update(_stat_token(git_dir / "index").encode())
+
+    for name in FINGERPRINT_FILES:
+        digest.update(_stat_token(project_dir / name).encode())
+
+    return digest.hexdigest()
@@ -0,0 +1,128 @@
+"""Subprocess output streams shared by the executor and warm workers.
+
+Lines are read in bounded chunks, recorded into a tail buffer and optional
+log spool, and passed to a line callback; kill_process_tree stops a
+process together with the tools it forked.
+"""
+
+import asyncio
+import inspect
+import io
+import os
+import signal
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+from fastlane_mcp.utils.logs import LogWriter, RingBuffer
+
+
+@dataclass
+class ExecutionResult:
+    """Result of command execution.
+
+    For spooled runs, stdout and stderr hold only the tail of each stream;
+    the complete interleaved output can be read back with read_log(log_id).
+    """
+    stdout: str
+    stderr: str
+    exit_code: int
+    log_id: str | None = None
+    queue_wait: float = 0.0
+
+
+# Called with (stream_name, line) for every line read; may be sync or async
+LineCallback = Callable[[str, str], Awaitable[None] | None]
+
+DEFAULT_TIMEOUT = 600  # 10 minutes
+
+# Bytes read from a pipe per chunk, and the longest line kept before it is split
+READ_CHUNK_SIZE = 64 * 1024
+MAX_LINE_LENGTH = 64 * 1024
+
+
+async def iter_raw_lines(
+    reader: asyncio.StreamReader,
+    max_line_length: int = MAX_LINE_LENGTH
+) -> AsyncIterator[bytes]:
+    """Yield undecoded lines (without newline) from a stream."""
+    pending = b""
+    while True:
+        chunk = await reader.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+        while len(pending) > max_line_length:
+            yield pending[:max_line_length]
+            pending = pending[max_line_length:]
+
+    if pending:
+        yield pending.rstrip(b"\r")
+
+
+async def iter_lines(
+    reader: asyncio.StreamReader,
+    max_line_length: int = MAX_LINE_LENGTH
+) -> AsyncIterator[str]:
+    """Yield decoded lines from a stream as they arrive.
+
+    Reads fixed-size chunks rather than using readline() so that a single
+    enormous line (e.g. a minified xcodebuild command) cannot grow the
+    buffer without bound; such lines are split every max_line_length bytes.
+
+    Args:
+        reader: The stream to read from
+        max_line_length: Maximum bytes buffered before a partial line is emitted
+
+    Yields:
+        Lines without their trailing newline
+    """
+    async for line in iter_raw_lines(reader, max_line_length):
+        yield line.decode(errors="replace")
+
+
+async def deliver_line(
+    name: str,
+    line: bytes,
+    sink: RingBuffer | io.BytesIO,
+    log: LogWriter | None,
+    on_line: LineCallback | None
+) -> None:
+    """Record one output line and pass it to the line callback."""
+    sink.write(line + b"\n")
+    if log is not None:
+        log.write(line + b"\n")
+    if on_line is not None:
+        result = on_line(name, line.decode(errors="replace"))
+        if inspect.isawaitable(result):
+            await result
+
+
+async def kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill a process and everything it spawned, then reap it.
+
+    fastlane forks xcodebuild/gradle, which inherit our pipes; killing only
+    the direct child would leave them running and the pipes open.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    await proc.wait()
+
+
+def decode_tail(sink: RingBuffer | io.BytesIO) -> str:
+    """Decode a tail buffer, dropping the partial first line if truncated."""
+    data = sink.getvalue()
+    if isinstance(sink, RingBuffer) and sink.truncated:
+        newline = data.find(b"\n")
+        if newline != -1:
+            data = data[newline + 1:]
+    return data.decode(errors="replace")
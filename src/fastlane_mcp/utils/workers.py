@@ -0,0 +1,510 @@
+"""Pre-booted fastlane processes that run lanes without paying Ruby boot time."""
+
+import asyncio
+import io
+import json
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+
+from fastlane_mcp.utils.config import env_int
+from fastlane_mcp.utils.logs import LogWriter, RingBuffer
+from fastlane_mcp.utils.streams import (
+    DEFAULT_TIMEOUT,
+    ExecutionResult,
+    LineCallback,
+    decode_tail,
+    deliver_line,
+    iter_raw_lines,
+    kill_process_tree,
+)
+
+# Prefix of protocol lines a worker writes; everything else is lane output
+SENTINEL = "__FASTLANE_MCP__"
+
+# Runs inside each worker. It loads fastlane once, then reads one JSON
+# request per line from stdin: {"op": "ping"} is answered with a pong,
+# {"op": "run", "lane": ..., "env": {...}} runs the lane as `fastlane <lane>`
+# would and ends with a "done <exit code>" line on both stdout and stderr so
+# the reader knows both streams are drained.
+WORKER_SCRIPT = r'''
+require "json"
+$stdout.sync = true
+$stderr.sync = true
+SENTINEL = "__FASTLANE_MCP__"
+
+begin
+  require "fastlane"
+rescue LoadError => e
+  $stderr.puts "fastlane could not be loaded: #{e.message}"
+  exit 1
+end
+Fastlane.load_actions if Fastlane.respond_to?(:load_actions)
+# Like the fastlane CLI, load the Pluginfile's plugins before running lanes
+if Fastlane.respond_to?(:plugin_manager)
+  begin
+    Fastlane.plugin_manager.load_plugins
+  rescue StandardError => e
+    $stderr.puts "fastlane plugins could not be loaded: #{e.message}"
+    exit 1
+  end
+end
+
+puts "#{SENTINEL} ready"
+
+$stdin.each_line do |line|
+  request = begin
+    JSON.parse(line)
+  rescue JSON::ParserError
+    next
+  end
+
+  case request["op"]
+  when "ping"
+    puts "#{SENTINEL} pong"
+  when "run"
+    saved_env = ENV.to_h
+    status = 0
+    begin
+      (request["env"] || {}).each { |key, value| ENV[key] = value }
+      Fastlane::Actions.clear_lane_context! if Fastlane::Actions.respond_to?(:clear_lane_context!)
+      # Otherwise each lane's summary table lists the actions of every earlier lane
+      Fastlane::Actions.executed_actions.clear if Fastlane::Actions.respond_to?(:executed_actions)
+      Fastlane::LaneManager.cruise_lane(nil, request["lane"])
+    rescue SystemExit => e
+      status = e.status
+    rescue Exception => e
+      $stderr.puts "#{e.class}: #{e.message}"
+      status = 1
+    ensure
+      ENV.replace(saved_env)
+    end
+    $stderr.puts "#{SENTINEL} done #{status}"
+    puts "#{SENTINEL} done #{status}"
+  end
+end
+'''
+
+DEFAULT_WORKER_COMMAND = ("ruby", "-e", WORKER_SCRIPT)
+
+# Lanes a worker runs before it is replaced, bounding leaked Ruby state
+DEFAULT_MAX_USES = 20
+
+# Seconds an unused worker is kept before it is shut down
+DEFAULT_IDLE_TIMEOUT = 600
+
+# Seconds allowed for a worker to load fastlane
+DEFAULT_BOOT_TIMEOUT = 120
+
+# Idle workers older than this are pinged before reuse
+HEALTH_CHECK_INTERVAL = 30
+
+PING_TIMEOUT = 5
+
+_SENTINEL_PREFIX = SENTINEL.encode() + b" "
+
+# A worker's command line and extra environment; workers are only reused
+# for requests that would have started them the same way
+_Launch = tuple[tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+class WorkerError(Exception):
+    """A worker failed to boot or broke the protocol."""
+
+
+class FastlaneWorker:
+    """One pre-booted fastlane process bound to an execution directory."""
+
+    def __init__(
+        self,
+        proc: asyncio.subprocess.Process,
+        execution_dir: Path,
+        launch: _Launch = ((), ())
+    ):
+        self.proc = proc
+        self.execution_dir = execution_dir
+        self.launch = launch
+        self.uses = 0
+        self.last_used = time.monotonic()
+        self._stdout: AsyncIterator[bytes] = iter_raw_lines(proc.stdout)
+        # Recent stderr seen outside a request, for boot error messages
+        self._stderr_backlog: deque[bytes] = deque(maxlen=20)
+        self._stderr_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._stderr_task = asyncio.ensure_future(self._read_stderr())
+
+    @classmethod
+    async def spawn(
+        cls,
+        command: Sequence[str],
+        execution_dir: Path,
+        boot_timeout: float = DEFAULT_BOOT_TIMEOUT,
+        env: dict[str, str] | None = None
+    ) -> "FastlaneWorker":
+        """Start a worker and wait until fastlane has loaded.
+
+        Args:
+            command: Worker command line
+            execution_dir: Directory the worker runs lanes in
+            boot_timeout: Seconds allowed for loading fastlane
+            env: Additional environment variables for the worker process
+
+        Raises:
+            WorkerError: If the worker exits or times out before it is ready
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(execution_dir),
+            env={**os.environ, **(env or {})},
+            start_new_session=True,
+        )
+        worker = cls(proc, execution_dir, (tuple(command), tuple(sorted((env or {}).items()))))
+        try:
+            await asyncio.wait_for(worker._expect(b"ready"), boot_timeout)
+        except (asyncio.TimeoutError, WorkerError) as e:
+            # Give the reader a moment to collect the worker's last words
+            await asyncio.wait([worker._stderr_task], timeout=1)
+            await worker.kill()
+            detail = b"\n".join(worker._stderr_backlog).decode(errors="replace")
+            raise WorkerError(f"fastlane worker failed to start: {detail or e or 'timed out'}") from None
+        except BaseException:
+            await worker.kill()
+            raise
+        return worker
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+    async def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """Check that the worker still answers requests."""
+        try:
+            self._send({"op": "ping"})
+            await asyncio.wait_for(self._expect(b"pong"), timeout)
+            return True
+        except (asyncio.TimeoutError, WorkerError, OSError):
+            return False
+
+    async def run(
+        self,
+        lane: str,
+        env: dict[str, str] | None,
+        stdout: RingBuffer | io.BytesIO,
+        stderr: RingBuffer | io.BytesIO,
+        log: LogWriter | None,
+        on_line: LineCallback | None
+    ) -> int:
+        """Run a lane and stream its output like execute_command does.
+
+        Returns:
+            The lane's exit code
+
+        Raises:
+            WorkerError: If the worker dies mid-lane
+        """
+        # Drop stderr written between requests (e.g. Ruby warnings at boot)
+        while not self._stderr_queue.empty():
+            if self._stderr_queue.get_nowait() is None:
+                raise WorkerError("fastlane worker is not running")
+        self._send({"op": "run", "lane": lane, "env": env or {}})
+
+        async def pump_stdout() -> int:
+            async for line in self._stdout:
+                if line.startswith(_SENTINEL_PREFIX):
+                    return _parse_done(line)
+                await deliver_line("stdout", line, stdout, log, on_line)
+            raise WorkerError("fastlane worker exited during the lane")
+
+        async def pump_stderr() -> None:
+            while True:
+                line = await self._stderr_queue.get()
+                if line is None:
+                    raise WorkerError("fastlane worker exited during the lane")
+                if line.startswith(_SENTINEL_PREFIX):
+                    return
+                await deliver_line("stderr", line, stderr, log, on_line)
+
+        exit_code, _ = await asyncio.gather(pump_stdout(), pump_stderr())
+        return exit_code
+
+    async def kill(self) -> None:
+        """Stop the worker and everything it spawned."""
+        self._stderr_task.cancel()
+        if self.proc.stdin is not None:
+            # Lets the transport close even if the process already exited
+            self.proc.stdin.close()
+        if self.proc.returncode is None:
+            await kill_process_tree(self.proc)
+        else:
+            await self.proc.wait()
+
+    def _send(self, request: dict) -> None:
+        if not self.alive or self.proc.stdin is None:
+            raise WorkerError("fastlane worker is not running")
+        self.proc.stdin.write(json.dumps(request).encode() + b"\n")
+
+    async def _expect(self, word: bytes) -> None:
+        """Read stdout until the given protocol line, discarding output."""
+        async for line in self._stdout:
+            if line == _SENTINEL_PREFIX + word:
+                return
+        raise WorkerError("fastlane worker exited")
+
+    async def _read_stderr(self) -> None:
+        async for line in iter_raw_lines(self.proc.stderr):
+            self._stderr_backlog.append(line)
+            self._stderr_queue.put_nowait(line)
+        self._stderr_queue.put_nowait(None)
+
+
+def _parse_done(line: bytes) -> int:
+    parts = line.split()
+    if len(parts) == 3 and parts[1] == b"done":
+        try:
+            return int(parts[2])
+        except ValueError:
+            pass
+    raise WorkerError(f"Unexpected worker message: {line.decode(errors='replace')}")
+
+
+class WorkerPool:
+    """Warm fastlane workers, kept per execution directory.
+
+    A worker is reused for up to max_uses lanes, pinged before reuse when
+    it has been idle for a while, and shut down after idle_timeout seconds
+    without work. Lanes that cannot get a worker (all busy, or booting
+    failed) are left to the caller to run cold.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        command: Sequence[str] = DEFAULT_WORKER_COMMAND,
+        max_uses: int = DEFAULT_MAX_USES,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        boot_timeout: float = DEFAULT_BOOT_TIMEOUT
+    ):
+        self.max_workers = max_workers
+        self.command = tuple(command)
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.boot_timeout = boot_timeout
+        self._idle: dict[str, list[FastlaneWorker]] = {}
+        self._busy: dict[str, int] = {}
+        self._booting: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+
+    @classmethod
+    def from_env(cls) -> "WorkerPool":
+        """Create a pool using FASTLANE_MCP_WARM_WORKERS and related settings.
+
+        The pool is disabled unless FASTLANE_MCP_WARM_WORKERS is set to the
+        number of workers to keep per project directory.
+        """
+        return cls(
+            max_workers=env_int("FASTLANE_MCP_WARM_WORKERS", 0),
+            max_uses=env_int("FASTLANE_MCP_WORKER_MAX_USES", DEFAULT_MAX_USES),
+            idle_timeout=env_int("FASTLANE_MCP_WORKER_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    async def run(
+        self,
+        execution_dir: Path,
+        lane: str,
+        env: dict[str, str] | None = None,
+        on_line: LineCallback | None = None,
+        tail_bytes: int | None = None,
+        log: LogWriter | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        launcher: Sequence[str] = (),
+        launcher_env: dict[str, str] | None = None
+    ) -> ExecutionResult | None:
+        """Run a lane on a warm worker.
+
+        Args:
+            execution_dir: Directory fastlane runs in
+            lane: Sanitized lane name
+            env: Environment variables set for the duration of the lane
+            on_line: Optional callback invoked with (stream, line) for each line
+            tail_bytes: Keep only the last N bytes of each stream
+            log: Optional spool receiving the full interleaved output
+            timeout: Timeout in seconds
+            launcher: Prefix for the worker command, e.g. ("bundle", "exec")
+            launcher_env: Environment for the worker process, e.g. BUNDLE_GEMFILE;
+                workers started with a different launcher are not reused
+
+        Returns:
+            ExecutionResult, or None if no worker was available and the lane
+            should be run as a normal process instead
+        """
+        if not self.enabled:
+            return None
+        launch = (
+            (*launcher, *self.command),
+            tuple(sorted((launcher_env or {}).items())),
+        )
+        worker = await self._acquire(execution_dir, launch)
+        if worker is None:
+            return None
+
+        def new_sink() -> RingBuffer | io.BytesIO:
+            return RingBuffer(tail_bytes) if tail_bytes else io.BytesIO()
+
+        stdout = new_sink()
+        stderr = new_sink()
+        log_id = log.log_id if log is not None else None
+        healthy = False
+        try:
+            exit_code = await asyncio.wait_for(
+                worker.run(lane, env, stdout, stderr, log, on_line), timeout
+            )
+            healthy = True
+            return ExecutionResult(
+                stdout=decode_tail(stdout),
+                stderr=decode_tail(stderr),
+                exit_code=exit_code,
+                log_id=log_id,
+            )
+        except asyncio.TimeoutError:
+            message = f"Command timed out after {timeout}s"
+            if log is not None:
+                log.write(f"{message}\n".encode())
+            return ExecutionResult(
+                stdout=decode_tail(stdout),
+                stderr=message,
+                exit_code=124,
+                log_id=log_id,
+            )
+        except WorkerError as e:
+            return ExecutionResult(
+                stdout=decode_tail(stdout),
+                stderr=decode_tail(stderr) + str(e),
+                exit_code=1,
+                log_id=log_id,
+            )
+        finally:
+            # A timed out, cancelled or crashed lane leaves the worker in an
+            # unknown state, so it is replaced rather than reused
+            await self._release(worker, healthy)
+
+    def _schedule_warm(self, execution_dir: Path, launch: _Launch) -> None:
+        if not self.enabled or self._count(str(execution_dir)) >= self.max_workers:
+            return
+        task = asyncio.ensure_future(self._warm(execution_dir, launch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> dict:
+        """Report idle and busy workers per directory."""
+        directories = set(self._idle) | set(self._busy) | set(self._booting)
+        return {
+            directory: {
+                "idle": len(self._idle.get(directory, [])),
+                "busy": self._busy.get(directory, 0),
+                "booting": self._booting.get(directory, 0),
+            }
+            for directory in sorted(directories)
+        }
+
+    async def evict_idle(self) -> None:
+        """Shut down workers that have been idle longer than idle_timeout."""
+        cutoff = time.monotonic() - self.idle_timeout
+        for key, workers in list(self._idle.items()):
+            stale = [w for w in workers if w.last_used < cutoff or not w.alive]
+            for worker in stale:
+                workers.remove(worker)
+                await worker.kill()
+            if not workers:
+                del self._idle[key]
+
+    async def close(self) -> None:
+        """Shut down every worker and background task."""
+        tasks = [task for task in [*self._tasks, self._reaper] if task is not None]
+        for task in tasks:
+            task.cancel()
+        # A cancelled warm-up kills the worker it was booting; let it finish
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reaper = None
+        for workers in self._idle.values():
+            for worker in workers:
+                await worker.kill()
+        self._idle.clear()
+
+    def _count(self, key: str) -> int:
+        return len(self._idle.get(key, [])) + self._busy.get(key, 0) + self._booting.get(key, 0)
+
+    async def _acquire(self, execution_dir: Path, launch: _Launch) -> FastlaneWorker | None:
+        self._start_reaper()
+        key = str(execution_dir)
+        idle = self._idle.get(key, [])
+        while idle:
+            worker = idle.pop()
+            stale = time.monotonic() - worker.last_used > HEALTH_CHECK_INTERVAL
+            if worker.launch == launch and worker.alive and (not stale or await worker.ping()):
+                self._busy[key] = self._busy.get(key, 0) + 1
+                return worker
+            await worker.kill()
+
+        if self._count(key) >= self.max_workers:
+            return None
+
+        worker = await self._boot(execution_dir, launch)
+        if worker is not None:
+            self._busy[key] = self._busy.get(key, 0) + 1
+        return worker
+
+    async def _boot(self, execution_dir: Path, launch: _Launch) -> FastlaneWorker | None:
+        key = str(execution_dir)
+        command, env = launch
+        self._booting[key] = self._booting.get(key, 0) + 1
+        try:
+            return await FastlaneWorker.spawn(command, execution_dir, self.boot_timeout, dict(env))
+        except (WorkerError, OSError):
+            return None
+        finally:
+            self._booting[key] -= 1
+            if not self._booting[key]:
+                del self._booting[key]
+
+    async def _warm(self, execution_dir: Path, launch: _Launch) -> None:
+        worker = await self._boot(execution_dir, launch)
+        if worker is not None:
+            self._idle.setdefault(str(execution_dir), []).append(worker)
+
+    async def _release(self, worker: FastlaneWorker, healthy: bool) -> None:
+        key = str(worker.execution_dir)
+        self._busy[key] -= 1
+        if not self._busy[key]:
+            del self._busy[key]
+
+        worker.uses += 1
+        worker.last_used = time.monotonic()
+        if healthy and worker.alive and worker.uses < self.max_uses:
+            self._idle.setdefault(key, []).append(worker)
+            return
+
+        await worker.kill()
+        # Boot the replacement now so the next lane finds a warm worker
+        self._schedule_warm(worker.execution_dir, worker.launch)
+
+    def _start_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.ensure_future(self._reap())
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.idle_timeout, 60))
+            await self.evict_idle()
+
+
+# Sized from the environment (or --warm-workers); the server lifespan closes it
+worker_pool = WorkerPool.from_env()
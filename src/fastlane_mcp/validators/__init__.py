@@ -1,5 +1,9 @@
 """Validation modules."""
 
+import asyncio
+import time
+from collections.abc import Awaitable
+
 from fastlane_mcp.validators.types import (
     IssueLevel,
     ValidationIssue,
@@ -9,39 +13,87 @@ from fastlane_mcp.validators.types import (
 from fastlane_mcp.validators.environment import validate_environment
 from fastlane_mcp.validators.tools import validate_tools
 from fastlane_mcp.validators.project import validate_project
+from fastlane_mcp.validators.cache import VALIDATOR_TIMEOUT, PreflightCache, preflight_cache, preflight_key
+
+
+async def _timed(
+    name: str,
+    check: Awaitable[list[ValidationIssue]],
+    timeout: float,
+    timings: dict[str, float]
+) -> list[ValidationIssue]:
+    """Run one validator within its time budget, recording its wall time."""
+    start = time.monotonic()
+    try:
+        return await asyncio.wait_for(check, timeout)
+    except asyncio.TimeoutError:
+        return [ValidationIssue(
+            level=IssueLevel.WARNING,
+            code=VALIDATOR_TIMEOUT,
+            message=f"Pre-flight {name} check did not finish within {timeout:g}s and was skipped",
+        )]
+    finally:
+        timings[name] = round(time.monotonic() - start, 4)
+
 
+async def _validate_environment(required_env_vars: list[str]) -> list[ValidationIssue]:
+    return await asyncio.to_thread(validate_environment, required_env_vars)
 
-async def run_preflight(ctx: PreflightContext) -> ValidationResult:
+
+async def run_preflight(ctx: PreflightContext, use_cache: bool = False) -> ValidationResult:
     """Run all pre-flight validators.
 
+    The validators are independent, so they run concurrently, with their
+    filesystem and PATH lookups in worker threads. Each is given
+    ctx.validator_timeout seconds; one that overruns is reported as a
+    VALIDATOR_TIMEOUT warning instead of holding up the build.
+
     Args:
         ctx: Context specifying what to validate
+        use_cache: Reuse a recent passing result for the same project state
+            (see preflight_key) and cache this one if it passes with every
+            validator finished
 
     Returns:
-        ValidationResult with combined issues
+        ValidationResult with combined issues and per-validator timings
     """
-    issues: list[ValidationIssue] = []
+    if use_cache:
+        key = preflight_key(ctx)
+        cached = preflight_cache.get(key)
+        if cached is not None:
+            return cached
+
+    checks: list[tuple[str, Awaitable[list[ValidationIssue]]]] = []
 
     # Check environment variables
     if ctx.required_env_vars:
-        issues.extend(validate_environment(ctx.required_env_vars))
+        checks.append(("environment", _validate_environment(ctx.required_env_vars)))
 
     # Check required tools
     if ctx.required_tools:
-        issues.extend(await validate_tools(ctx.required_tools))
+        checks.append(("tools", validate_tools(ctx.required_tools)))
 
     # Check project structure
     if ctx.project_path:
-        issues.extend(await validate_project(
+        checks.append(("project", validate_project(
             ctx.project_path,
             ctx.platform,
             ctx.lane
-        ))
+        )))
+
+    timings: dict[str, float] = {}
+    results = await asyncio.gather(*(
+        _timed(name, check, ctx.validator_timeout, timings) for name, check in checks
+    ))
+    issues = [issue for result in results for issue in result]
 
     # Valid if no errors (warnings are ok)
     has_errors = any(i.level == IssueLevel.ERROR for i in issues)
 
-    return ValidationResult(valid=not has_errors, issues=issues)
+    result = ValidationResult(valid=not has_errors, issues=issues, timings=timings)
+    if use_cache:
+        preflight_cache.put(key, result)
+    return result
 
 
 __all__ = [
@@ -53,4 +105,7 @@ __all__ = [
     "validate_tools",
     "validate_project",
     "run_preflight",
+    "PreflightCache",
+    "preflight_cache",
+    "preflight_key",
 ]
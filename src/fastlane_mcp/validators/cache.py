@@ -0,0 +1,99 @@
+"""Reuse of recent successful pre-flight results."""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+
+from fastlane_mcp.discovery.cache import file_signature
+from fastlane_mcp.utils.config import env_int
+from fastlane_mcp.utils.paths import find_fastlane_dir
+from fastlane_mcp.validators.types import PreflightContext, ValidationResult
+
+# Seconds a passing pre-flight result is reused
+DEFAULT_PREFLIGHT_TTL = 300
+
+# Number of cached results kept before the least recently used is dropped
+DEFAULT_MAX_ENTRIES = 256
+
+# Issue code of a validator that ran out of time; its check never completed
+VALIDATOR_TIMEOUT = "VALIDATOR_TIMEOUT"
+
+
+def preflight_key(ctx: PreflightContext) -> tuple:
+    """Fingerprint everything a pre-flight result depends on.
+
+    Covers the project path, platform and lane, the Fastfile's stat()
+    signature, a hash of PATH (so installing or removing tools elsewhere on
+    PATH is noticed), the required tools and which required environment
+    variables are currently set.
+
+    Args:
+        ctx: Context the result was computed for
+
+    Returns:
+        Hashable cache key
+    """
+    fastfile_signature = None
+    if ctx.project_path:
+        fastlane_dir = find_fastlane_dir(Path(ctx.project_path), ctx.platform)
+        if fastlane_dir is not None:
+            fastfile_signature = (str(fastlane_dir), file_signature(fastlane_dir / "Fastfile"))
+
+    path_hash = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()
+
+    return (
+        ctx.project_path,
+        ctx.platform,
+        ctx.lane,
+        fastfile_signature,
+        path_hash,
+        tuple(ctx.required_tools),
+        tuple((name, bool(os.environ.get(name))) for name in ctx.required_env_vars),
+    )
+
+
+class PreflightCache:
+    """Time-limited cache of passing ValidationResults.
+
+    Only valid results whose validators all finished are stored, so a
+    failing or skipped check is always re-run and a fix is picked up on
+    the next build.
+    """
+
+    def __init__(self, ttl: float | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl if ttl is not None else env_int("FASTLANE_MCP_PREFLIGHT_TTL", DEFAULT_PREFLIGHT_TTL)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[ValidationResult, float]] = OrderedDict()
+
+    def get(self, key: tuple) -> ValidationResult | None:
+        """Return the cached result for key, marked as cached, if still fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return replace(result, cached=True)
+
+    def put(self, key: tuple, result: ValidationResult) -> None:
+        """Remember a result if it passed and no validator timed out."""
+        if not result.valid or self.ttl <= 0:
+            return
+        if any(issue.code == VALIDATOR_TIMEOUT for issue in result.issues):
+            return
+        self._entries[key] = (result, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+preflight_cache = PreflightCache()
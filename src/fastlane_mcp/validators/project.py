@@ -1,8 +1,11 @@
 """Project structure validation."""
 
+import asyncio
+
 from pathlib import Path
 from fastlane_mcp.validators.types import IssueLevel, ValidationIssue
 from fastlane_mcp.utils.paths import find_fastlane_dir
+from fastlane_mcp.discovery.index import load_lane_index
 
 
 async def validate_project(
@@ -24,7 +27,7 @@ async def validate_project(
     project = Path(project_path)
 
     # Find fastlane directory (checks both platform-specific and root)
-    fastlane_dir = find_fastlane_dir(project, platform)
+    fastlane_dir = await asyncio.to_thread(find_fastlane_dir, project, platform)
 
     if fastlane_dir is None:
         # Build helpful error message showing what was checked
@@ -49,11 +52,11 @@ async def validate_project(
 
     fastfile = fastlane_dir / "Fastfile"
 
-    # Validate lane exists if specified
+    # Validate lane exists if specified, including lanes pulled in by imports
     if lane:
-        content = fastfile.read_text()
-        # Simple check for lane definition
-        if f"lane :{lane}" not in content and f"private_lane :{lane}" not in content:
+        # Parsing reads files; keep it off the event loop
+        index = await asyncio.to_thread(load_lane_index, [(platform, fastfile)])
+        if not any(info.name == lane for info in index.lanes):
             issues.append(ValidationIssue(
                 level=IssueLevel.WARNING,
                 code="LANE_NOT_FOUND",
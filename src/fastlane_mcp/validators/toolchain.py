@@ -0,0 +1,231 @@
+"""Toolchain version inventory."""
+
+import asyncio
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastlane_mcp.utils.executor import execute_command
+from fastlane_mcp.utils.resolver import tool_resolver
+from fastlane_mcp.utils.singleflight import SingleFlight
+
+# Seconds a single version probe may take; fastlane boots slowly
+PROBE_TIMEOUT = 60
+
+# Bumped whenever the on-disk cache format changes
+CACHE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class VersionProbe:
+    """How to ask a tool for its version."""
+    name: str
+    command: str
+    args: tuple[str, ...]
+    pattern: re.Pattern
+    # Environment variables that change which installation the binary runs
+    selectors: tuple[str, ...] = ()
+
+
+PROBES = {
+    probe.name: probe for probe in (
+        VersionProbe("xcodebuild", "xcodebuild", ("-version",), re.compile(r'Xcode (\S+)'),
+                     selectors=("DEVELOPER_DIR",)),
+        VersionProbe("fastlane", "fastlane", ("--version",), re.compile(r'fastlane (\d+\.\d+\.\d+\S*)')),
+        VersionProbe("ruby", "ruby", ("--version",), re.compile(r'ruby (\S+)')),
+        VersionProbe("bundler", "bundle", ("--version",), re.compile(r'Bundler version (\S+)')),
+        VersionProbe("gradle", "gradle", ("--version",), re.compile(r'Gradle (\S+)'),
+                     selectors=("JAVA_HOME", "GRADLE_HOME")),
+        VersionProbe("java", "java", ("-version",), re.compile(r'version "([^"]+)"'),
+                     selectors=("JAVA_HOME",)),
+    )
+}
+
+# Tools whose versions are reported with each platform's builds
+PLATFORM_TOOLCHAIN = {
+    "ios": ["xcodebuild", "fastlane", "ruby", "bundler"],
+    "android": ["fastlane", "ruby", "bundler", "gradle", "java"],
+}
+
+# macOS records the active Xcode (xcode-select -s) behind this link
+_XCODE_SELECT_LINK = "/var/db/xcode_select_link"
+
+
+@dataclass
+class ToolVersion:
+    """The version of one installed tool."""
+    name: str
+    path: str | None
+    version: str | None = None
+    raw: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "version": self.version,
+            "raw": self.raw,
+            "error": self.error,
+        }
+
+
+def toolchain_cache_path() -> Path:
+    """File holding probed versions across server restarts.
+
+    Uses FASTLANE_MCP_TOOLCHAIN_CACHE if set, otherwise a file in the
+    system temp directory.
+    """
+    configured = os.environ.get("FASTLANE_MCP_TOOLCHAIN_CACHE")
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "fastlane-mcp-toolchain.json"
+
+
+def _binary_key(probe: VersionProbe, path: str) -> str | None:
+    """Identify the installation a resolved binary runs, or None if gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    parts = [probe.name, os.path.realpath(path), str(st.st_mtime_ns), str(st.st_size)]
+    parts.extend(f"{name}={os.environ.get(name, '')}" for name in probe.selectors)
+    if probe.name == "xcodebuild":
+        try:
+            parts.append(os.readlink(_XCODE_SELECT_LINK))
+        except OSError:
+            pass
+    return "|".join(parts)
+
+
+def _parse_version(probe: VersionProbe, output: str) -> tuple[str | None, str | None]:
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    match = probe.pattern.search(output)
+    return (match.group(1) if match else None), (lines[0] if lines else None)
+
+
+class ToolchainInventory:
+    """Probes tool versions once and remembers them by binary identity.
+
+    A version is re-probed only when the resolved binary's path, mtime or
+    size changes (or an environment variable that selects the installation,
+    such as DEVELOPER_DIR or JAVA_HOME). Successful probes are persisted to
+    disk so a restarted server does not pay for `fastlane --version` again.
+    Failed probes are not cached.
+    """
+
+    def __init__(self, cache_path: Path | None = None):
+        self._cache_path = cache_path
+        self._entries: dict[str, dict] | None = None
+        self._entries_path: Path | None = None
+        self._inflight: SingleFlight[ToolVersion] = SingleFlight()
+
+    @property
+    def cache_path(self) -> Path:
+        return self._cache_path or toolchain_cache_path()
+
+    async def versions(
+        self,
+        tools: list[str] | None = None,
+        refresh: bool = False
+    ) -> dict[str, ToolVersion]:
+        """Look up tool versions, probing concurrently where not cached.
+
+        Args:
+            tools: Tool names from PROBES (default: all)
+            refresh: Ignore cached versions and probe again
+
+        Returns:
+            Mapping of tool name to ToolVersion
+        """
+        names = [name for name in (tools or list(PROBES)) if name in PROBES]
+        entries = self._load()
+        resolved = tool_resolver.resolve_all([PROBES[name].command for name in names])
+
+        results: dict[str, ToolVersion] = {}
+        pending: list[tuple[str, str, str]] = []
+        for name in names:
+            probe = PROBES[name]
+            path = resolved[probe.command]
+            key = _binary_key(probe, path) if path else None
+            if key is None:
+                results[name] = ToolVersion(name=name, path=None, error=f"{probe.command} not found on PATH")
+                continue
+            cached = entries.get(key)
+            if cached is not None and not refresh:
+                results[name] = ToolVersion(name=name, path=path, version=cached["version"], raw=cached["raw"])
+                continue
+            pending.append((name, path, key))
+
+        probed = await asyncio.gather(*(
+            self._inflight.do(key, lambda name=name, path=path: self._probe(PROBES[name], path))
+            for name, path, key in pending
+        ))
+
+        changed = False
+        for (name, path, key), version in zip(pending, probed):
+            results[name] = version
+            if version.error is None:
+                entries[key] = {"version": version.version, "raw": version.raw}
+                changed = True
+        if changed:
+            self._save(entries)
+
+        return {name: results[name] for name in names}
+
+    def clear(self) -> None:
+        """Forget cached versions, including on disk."""
+        self._entries = {}
+        try:
+            self.cache_path.unlink()
+        except OSError:
+            pass
+
+    async def _probe(self, probe: VersionProbe, path: str) -> ToolVersion:
+        try:
+            result = await execute_command(path, list(probe.args), timeout=PROBE_TIMEOUT)
+        except OSError as e:
+            return ToolVersion(name=probe.name, path=path, error=str(e))
+
+        output = f"{result.stdout}\n{result.stderr}"
+        version, raw = _parse_version(probe, output)
+        if result.exit_code != 0 or version is None:
+            return ToolVersion(
+                name=probe.name,
+                path=path,
+                raw=raw,
+                error=raw or f"{probe.command} exited with code {result.exit_code}",
+            )
+        return ToolVersion(name=probe.name, path=path, version=version, raw=raw)
+
+    def _load(self) -> dict[str, dict]:
+        path = self.cache_path
+        if self._entries is None or self._entries_path != path:
+            self._entries_path = path
+            try:
+                data = json.loads(path.read_text())
+                entries = data["entries"] if data.get("format") == CACHE_FORMAT else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def _save(self, entries: dict[str, dict]) -> None:
+        path = self.cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent servers never read a partial file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"format": CACHE_FORMAT, "entries": entries}, f)
+            os.replace(tmp, path)
+        except OSError:
+            # The in-memory cache still works; persistence is best effort
+            pass
+
+
+toolchain = ToolchainInventory()
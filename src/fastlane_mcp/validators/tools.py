@@ -1,7 +1,9 @@
 """Tool availability validation."""
 
+import asyncio
+
 from fastlane_mcp.validators.types import IssueLevel, ValidationIssue
-from fastlane_mcp.utils.executor import execute_command
+from fastlane_mcp.utils.resolver import tool_resolver
 
 
 # Installation suggestions for common tools
@@ -9,6 +11,7 @@ TOOL_INSTALL_HINTS = {
     "fastlane": "Install with: gem install fastlane OR brew install fastlane",
     "xcodebuild": "Install Xcode from the App Store",
     "gradle": "Install with: brew install gradle",
+    "bundle": "Install with: gem install bundler",
     "bundler": "Install with: gem install bundler",
     "pod": "Install with: gem install cocoapods",
     "ruby": "Install with: brew install ruby",
@@ -18,6 +21,9 @@ TOOL_INSTALL_HINTS = {
 async def validate_tools(required_tools: list[str]) -> list[ValidationIssue]:
     """Validate that required tools are available.
 
+    Tools are looked up in-process in one pass over PATH, in a worker
+    thread; see ToolResolver.
+
     Args:
         required_tools: List of required tool names
 
@@ -26,10 +32,10 @@ async def validate_tools(required_tools: list[str]) -> list[ValidationIssue]:
     """
     issues: list[ValidationIssue] = []
 
-    for tool_name in required_tools:
-        result = await execute_command("which", [tool_name])
+    resolved = await asyncio.to_thread(tool_resolver.resolve_all, required_tools)
 
-        if result.exit_code != 0:
+    for tool_name in required_tools:
+        if resolved[tool_name] is None:
             suggestion = TOOL_INSTALL_HINTS.get(
                 tool_name,
                 f"Install {tool_name} and ensure it's in your PATH"
@@ -3,6 +3,9 @@
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Seconds each pre-flight validator may take before it is abandoned
+DEFAULT_VALIDATOR_TIMEOUT = 10.0
+
 
 class IssueLevel(Enum):
     """Severity level for validation issues."""
@@ -24,6 +27,10 @@ class ValidationResult:
     """Result of validation checks."""
     valid: bool
     issues: list[ValidationIssue] = field(default_factory=list)
+    # Wall time in seconds taken by each validator, keyed by validator name
+    timings: dict[str, float] = field(default_factory=dict)
+    # Whether this result was reused from an earlier run
+    cached: bool = False
 
     def format_issues(self) -> str:
         """Format issues for display."""
@@ -47,3 +54,4 @@ class PreflightContext:
     lane: str | None = None
     required_env_vars: list[str] = field(default_factory=list)
     required_tools: list[str] = field(default_factory=list)
+    validator_timeout: float = DEFAULT_VALIDATOR_TIMEOUT
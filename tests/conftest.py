@@ -4,6 +4,50 @@ import pytest
 from pathlib import Path
 
 
+@pytest.fixture(autouse=True)
+def isolated_log_dir(tmp_path_factory, monkeypatch):
+    """Spool build logs to a per-test directory instead of the system temp dir."""
+    log_dir = tmp_path_factory.mktemp("logs")
+    monkeypatch.setenv("FASTLANE_MCP_LOG_DIR", str(log_dir))
+    return log_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_toolchain_cache(tmp_path_factory, monkeypatch):
+    """Persist probed tool versions per test instead of in the system temp dir."""
+    cache = tmp_path_factory.mktemp("toolchain") / "toolchain.json"
+    monkeypatch.setenv("FASTLANE_MCP_TOOLCHAIN_CACHE", str(cache))
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_failure_history(tmp_path_factory, monkeypatch):
+    """Record build failures per test instead of in the system temp dir."""
+    db = tmp_path_factory.mktemp("history") / "history.sqlite3"
+    monkeypatch.setenv("FASTLANE_MCP_HISTORY_DB", str(db))
+    return db
+
+
+@pytest.fixture(autouse=True)
+def no_pattern_packs(monkeypatch):
+    """Diagnose with the built-in error patterns only, unless a test configures packs."""
+    from fastlane_mcp.errors.packs import pattern_registry
+    monkeypatch.delenv("FASTLANE_MCP_PATTERN_DIR", raising=False)
+    yield
+    # Drop packs a test loaded into the shared registry
+    monkeypatch.delenv("FASTLANE_MCP_PATTERN_DIR", raising=False)
+    pattern_registry.reload()
+
+
+@pytest.fixture(autouse=True)
+def fresh_preflight_cache():
+    """Keep cached pre-flight results from leaking between tests."""
+    from fastlane_mcp.validators import preflight_cache
+    preflight_cache.clear()
+    yield
+    preflight_cache.clear()
+
+
 @pytest.fixture
 def sample_fastfile():
     """Return a sample Fastfile content."""
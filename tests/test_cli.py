@@ -0,0 +1,29 @@
+"""Tests for the command line entry point."""
+
+import pytest
+from unittest.mock import patch
+
+from fastlane_mcp.cli import main
+
+
+class TestLimitOptions:
+    @pytest.mark.parametrize("argv", [
+        ["--max-ios-builds", "0"],
+        ["--max-android-builds", "-1"],
+        ["--max-builds-per-project", "two"],
+        ["--warm-workers", "-1"],
+    ])
+    def test_rejects_invalid_limits(self, argv, capsys):
+        with patch("sys.argv", ["fastlane-mcp", *argv]), pytest.raises(SystemExit) as excinfo:
+            main()
+
+        assert excinfo.value.code == 2
+        assert argv[0] in capsys.readouterr().err
+
+    def test_configures_scheduler(self):
+        with patch("sys.argv", ["fastlane-mcp", "--max-ios-builds", "3", "--max-builds-per-project", "1"]), \
+             patch("fastlane_mcp.utils.scheduler.scheduler.configure") as configure, \
+             patch("fastlane_mcp.server.mcp.run"):
+            main()
+
+        configure.assert_called_once_with({"ios": 3}, 1)
@@ -0,0 +1,81 @@
+"""Tests for the Fastfile parse cache."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+from fastlane_mcp.discovery.cache import FastfileCache
+
+
+class TestFastfileCache:
+    def test_second_lookup_is_a_hit(self, tmp_path):
+        fastfile = tmp_path / "Fastfile"
+        fastfile.write_text("lane :build do\nend")
+        cache = FastfileCache()
+
+        first = cache.get_lanes(fastfile)
+        with patch("fastlane_mcp.discovery.cache.parse_fastfile") as mock_parse:
+            second = cache.get_lanes(fastfile)
+            mock_parse.assert_not_called()
+
+        assert [l.name for l in first] == [l.name for l in second] == ["build"]
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+
+    def test_reparses_when_file_changes(self, tmp_path):
+        fastfile = tmp_path / "Fastfile"
+        fastfile.write_text("lane :build do\nend")
+        cache = FastfileCache()
+        cache.get_lanes(fastfile)
+
+        fastfile.write_text("lane :build do\nend\nlane :test do\nend")
+        lanes = cache.get_lanes(fastfile)
+
+        assert [l.name for l in lanes] == ["build", "test"]
+        assert cache.stats().misses == 2
+
+    def test_reparses_when_only_mtime_changes(self, tmp_path):
+        fastfile = tmp_path / "Fastfile"
+        fastfile.write_text("lane :aaaaa do\nend")
+        cache = FastfileCache()
+        cache.get_lanes(fastfile)
+
+        st = fastfile.stat()
+        fastfile.write_text("lane :bbbbb do\nend")
+        os.utime(fastfile, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.get_lanes(fastfile)[0].name == "bbbbb"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = FastfileCache(max_entries=2)
+        files = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / name
+            path.write_text(f"lane :{name} do\nend")
+            files.append(path)
+
+        cache.get_lanes(files[0])
+        cache.get_lanes(files[1])
+        cache.get_lanes(files[0])  # a is now most recent
+        cache.get_lanes(files[2])  # evicts b
+
+        stats = cache.stats()
+        assert stats.size == 2
+        assert stats.evictions == 1
+        cache.get_lanes(files[0])
+        assert cache.stats().hits == 2
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            FastfileCache().get_lanes(tmp_path / "Fastfile")
+
+    def test_clear_resets(self, tmp_path):
+        fastfile = tmp_path / "Fastfile"
+        fastfile.write_text("lane :build do\nend")
+        cache = FastfileCache()
+        cache.get_lanes(fastfile)
+        cache.clear()
+        assert cache.stats().size == 0
+        assert cache.stats().misses == 0
@@ -0,0 +1,141 @@
+"""Tests for the merged lane index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from fastlane_mcp.discovery.cache import FastfileCache
+from fastlane_mcp.discovery.index import (
+    LaneIndexCache,
+    build_lane_index,
+    git_checkout_candidates,
+)
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+class TestBuildLaneIndex:
+    def test_follows_relative_import(self, tmp_path):
+        _write(tmp_path / "shared" / "Fastfile", "lane :lint do\nend\n")
+        root = _write(tmp_path / "ios" / "fastlane" / "Fastfile",
+                      'import "../../shared/Fastfile"\nlane :build do\nend\n')
+
+        index = build_lane_index([("ios", root)], cache=FastfileCache())
+
+        assert [(l.name, l.platform) for l in index.lanes] == [("build", "ios"), ("lint", "ios")]
+        assert index.lanes[1].source == str(tmp_path / "shared" / "Fastfile")
+        assert index.unresolved == []
+
+    def test_own_lanes_win_over_imported(self, tmp_path):
+        _write(tmp_path / "shared" / "Fastfile", 'desc "shared"\nlane :build do\nend\n')
+        root = _write(tmp_path / "fastlane" / "Fastfile",
+                      'import "../shared/Fastfile"\ndesc "own"\nlane :build do\nend\n')
+
+        index = build_lane_index([(None, root)], cache=FastfileCache())
+
+        assert [l.description for l in index.lanes] == ["own"]
+
+    def test_shared_file_parsed_once_and_platformless(self, tmp_path):
+        _write(tmp_path / "shared" / "Fastfile", "lane :lint do\nend\n")
+        ios = _write(tmp_path / "ios" / "fastlane" / "Fastfile", 'import "../../shared/Fastfile"\n')
+        android = _write(tmp_path / "android" / "fastlane" / "Fastfile", 'import "../../shared/Fastfile"\n')
+        cache = FastfileCache()
+
+        index = build_lane_index([("ios", ios), ("android", android)], cache=cache)
+
+        assert [(l.name, l.platform) for l in index.lanes] == [("lint", None)]
+        assert cache.stats().misses == 3
+        assert cache.stats().hits == 0
+
+    def test_import_cycle_terminates(self, tmp_path):
+        a = _write(tmp_path / "a" / "Fastfile", 'import "../b/Fastfile"\nlane :a do\nend\n')
+        _write(tmp_path / "b" / "Fastfile", 'import "../a/Fastfile"\nlane :b do\nend\n')
+
+        index = build_lane_index([(None, a)], cache=FastfileCache())
+
+        assert [l.name for l in index.lanes] == ["a", "b"]
+
+    def test_missing_import_is_reported(self, tmp_path):
+        root = _write(tmp_path / "fastlane" / "Fastfile", 'import "../missing/Fastfile"\n')
+
+        index = build_lane_index([(None, root)], cache=FastfileCache())
+
+        assert index.unresolved == ["../missing/Fastfile"]
+
+    def test_git_import_resolved_from_cache_dir(self, tmp_path):
+        cache_dir = tmp_path / "git-cache"
+        _write(cache_dir / "github.com" / "acme" / "lanes" / "fastlane" / "Fastfile", "lane :release do\nend\n")
+        root = _write(tmp_path / "app" / "fastlane" / "Fastfile",
+                      'import_from_git(url: "git@github.com:acme/lanes.git", branch: "main")\n')
+
+        index = build_lane_index([("ios", root)], git_cache_dir=cache_dir, cache=FastfileCache())
+
+        assert [l.name for l in index.lanes] == ["release"]
+
+    def test_git_import_without_cache_dir_is_unresolved(self, tmp_path):
+        root = _write(tmp_path / "fastlane" / "Fastfile",
+                      'import_from_git(url: "https://github.com/acme/lanes", path: "Fastfile")\n')
+
+        index = build_lane_index([(None, root)], cache=FastfileCache())
+
+        assert index.lanes == []
+        assert index.unresolved == ["https://github.com/acme/lanes (Fastfile)"]
+
+
+class TestGitCheckoutCandidates:
+    def test_scp_url(self, tmp_path):
+        assert git_checkout_candidates("git@github.com:acme/lanes.git", tmp_path) == [
+            tmp_path / "github.com" / "acme" / "lanes",
+            tmp_path / "lanes",
+        ]
+
+    def test_https_url(self, tmp_path):
+        assert git_checkout_candidates("https://gitlab.com/acme/mobile/lanes.git", tmp_path)[0] == (
+            tmp_path / "gitlab.com" / "acme" / "mobile" / "lanes"
+        )
+
+    def test_ignores_parent_references(self, tmp_path):
+        candidates = git_checkout_candidates("https://example.com/../../etc", tmp_path)
+        assert all(tmp_path in c.parents for c in candidates)
+
+
+class TestLaneIndexCache:
+    def test_reuses_index_while_files_unchanged(self, tmp_path):
+        _write(tmp_path / "shared" / "Fastfile", "lane :lint do\nend\n")
+        root = _write(tmp_path / "fastlane" / "Fastfile", 'import "../shared/Fastfile"\n')
+        cache = LaneIndexCache(fastfiles=FastfileCache())
+
+        first = cache.get([(None, root)])
+        with patch("fastlane_mcp.discovery.index.build_lane_index") as mock_build:
+            second = cache.get([(None, root)])
+            mock_build.assert_not_called()
+
+        assert second is first
+
+    def test_imported_file_change_invalidates(self, tmp_path):
+        shared = _write(tmp_path / "shared" / "Fastfile", "lane :lint do\nend\n")
+        root = _write(tmp_path / "fastlane" / "Fastfile", 'import "../shared/Fastfile"\n')
+        fastfiles = FastfileCache()
+        cache = LaneIndexCache(fastfiles=fastfiles)
+        cache.get([(None, root)])
+
+        shared.write_text("lane :lint do\nend\nlane :format do\nend\n")
+        os.utime(shared, ns=(1, 1))
+        index = cache.get([(None, root)])
+
+        assert [l.name for l in index.lanes] == ["lint", "format"]
+        # The unchanged root Fastfile was served from the parse cache
+        assert fastfiles.stats().hits == 1
+
+    def test_missing_import_appearing_invalidates(self, tmp_path):
+        root = _write(tmp_path / "fastlane" / "Fastfile", 'import "../shared/Fastfile"\n')
+        cache = LaneIndexCache(fastfiles=FastfileCache())
+        assert cache.get([(None, root)]).lanes == []
+
+        _write(tmp_path / "shared" / "Fastfile", "lane :lint do\nend\n")
+
+        assert [l.name for l in cache.get([(None, root)]).lanes] == ["lint"]
@@ -1,7 +1,7 @@
 """Tests for lane parsing."""
 
 import pytest
-from fastlane_mcp.discovery.lanes import parse_lanes_from_fastfile, LaneInfo
+from fastlane_mcp.discovery.lanes import parse_fastfile, parse_lanes_from_fastfile, LaneInfo
 
 
 class TestParseLanesFromFastfile:
@@ -118,3 +118,138 @@ end
     def test_returns_empty_for_empty_content(self):
         lanes = parse_lanes_from_fastfile("")
         assert lanes == []
+
+    def test_nested_blocks_do_not_close_platform(self):
+        content = '''
+platform :ios do
+  before_all do
+    setup_ci if ENV["CI"]
+  end
+
+  lane :build do
+    if ENV["CLEAN"]
+      clear_derived_data
+    end
+    [1, 2].each do |i|
+      puts i
+    end
+    gym
+  end
+
+  lane :deploy do
+    pilot
+  end
+end
+
+lane :shared do
+  puts "shared"
+end
+'''
+        lanes = parse_lanes_from_fastfile(content)
+        by_name = {l.name: l.platform for l in lanes}
+        assert by_name == {"build": "ios", "deploy": "ios", "shared": None}
+
+    def test_assigned_conditionals_open_blocks(self):
+        content = '''
+platform :ios do
+  scheme = if ENV["CI"]
+    "App-CI"
+  else
+    "App"
+  end
+  config = case ENV["CONFIG"]
+    when "release" then "Release"
+    else "Debug"
+  end
+  token ||= begin
+    ENV.fetch("TOKEN")
+  end
+
+  lane :build do
+    gym(scheme: scheme)
+  end
+end
+'''
+        lanes = parse_lanes_from_fastfile(content)
+        assert [(l.name, l.platform) for l in lanes] == [("build", "ios")]
+
+    def test_inline_end_does_not_open_block(self):
+        content = '''
+platform :android do
+  if ENV["X"] then puts "x" end
+  lane :build do
+    gradle
+  end
+end
+
+lane :after do
+end
+'''
+        lanes = parse_lanes_from_fastfile(content)
+        assert [(l.name, l.platform) for l in lanes] == [("build", "android"), ("after", None)]
+
+    def test_block_with_trailing_comment(self):
+        content = '''
+platform :ios do
+  error do |lane, exception| # notify on failure
+    slack
+  end
+  lane :beta do
+    pilot
+  end
+end
+'''
+        lanes = parse_lanes_from_fastfile(content)
+        assert lanes[0].platform == "ios"
+
+    def test_identifiers_starting_with_keywords_are_ignored(self):
+        content = '''
+platform :ios do
+  ending = "x"
+  if_needed = true
+  next_step = todo
+  lane :build do
+    gym
+  end
+end
+lane :top do
+end
+'''
+        lanes = parse_lanes_from_fastfile(content)
+        assert [(l.name, l.platform) for l in lanes] == [("build", "ios"), ("top", None)]
+
+
+class TestParseFastfileImports:
+    def test_local_imports(self):
+        content = '''
+import "../shared/Fastfile"
+import('./Other')
+lane :build do
+end
+'''
+        parsed = parse_fastfile(content)
+        assert [i.path for i in parsed.imports] == ["../shared/Fastfile", "./Other"]
+        assert not any(i.is_git for i in parsed.imports)
+        assert [l.name for l in parsed.lanes] == ["build"]
+
+    def test_import_from_git_multiline(self):
+        content = '''
+import_from_git(
+  url: "git@github.com:acme/lanes.git",
+  branch: 'main',
+  path: "fastlane/Shared"
+)
+'''
+        [imp] = parse_fastfile(content).imports
+        assert imp.url == "git@github.com:acme/lanes.git"
+        assert imp.branch == "main"
+        assert imp.path == "fastlane/Shared"
+
+    def test_import_from_git_defaults_path(self):
+        [imp] = parse_fastfile('import_from_git url: "https://github.com/acme/lanes"\n').imports
+        assert imp.path == "fastlane/Fastfile"
+
+    def test_import_from_git_hash_rockets(self):
+        [imp] = parse_fastfile('import_from_git(:url => "https://x/y.git", :version => "~> 1.0")\n').imports
+        assert imp.url == "https://x/y.git"
+        assert imp.version == "~> 1.0"
@@ -0,0 +1,86 @@
+"""Tests for monorepo app discovery."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fastlane_mcp.discovery.monorepo import find_fastlane_apps, scan_monorepo
+
+
+def _app(directory: Path, *platforms: str, lane: str = "build") -> None:
+    for platform in platforms:
+        fastlane_dir = directory / platform / "fastlane" if platform else directory / "fastlane"
+        fastlane_dir.mkdir(parents=True, exist_ok=True)
+        (fastlane_dir / "Fastfile").write_text(f"lane :{lane} do\nend\n")
+
+
+class TestFindFastlaneApps:
+    def test_finds_nested_apps(self, tmp_path):
+        _app(tmp_path / "apps" / "shop", "ios", "android")
+        _app(tmp_path / "apps" / "admin", None)
+
+        apps, _, truncated = find_fastlane_apps(tmp_path)
+
+        assert [a.path.relative_to(tmp_path).as_posix() for a in apps] == ["apps/admin", "apps/shop"]
+        assert apps[1].platforms == ["ios", "android"]
+        assert not truncated
+
+    def test_does_not_report_platform_folders_as_apps(self, tmp_path):
+        _app(tmp_path, "ios", None)
+
+        apps, _, _ = find_fastlane_apps(tmp_path)
+
+        assert [a.path for a in apps] == [tmp_path]
+
+    def test_prunes_dependency_folders(self, tmp_path):
+        _app(tmp_path / "node_modules" / "some-lib", None)
+        _app(tmp_path / "ios" / "Pods" / "Thing", None)
+        _app(tmp_path / ".git" / "x", None)
+
+        apps, _, _ = find_fastlane_apps(tmp_path)
+
+        assert apps == []
+
+    def test_respects_max_depth(self, tmp_path):
+        _app(tmp_path / "a" / "b" / "c", None)
+
+        assert find_fastlane_apps(tmp_path, max_depth=2)[0] == []
+        assert len(find_fastlane_apps(tmp_path, max_depth=3)[0]) == 1
+
+    def test_stops_at_deadline(self, tmp_path):
+        _app(tmp_path / "app", None)
+
+        apps, scanned, truncated = find_fastlane_apps(tmp_path, deadline=time.monotonic() - 1)
+
+        assert truncated
+        assert apps == []
+        assert scanned == 0
+
+
+class TestScanMonorepo:
+    @pytest.mark.asyncio
+    async def test_indexes_every_app(self, tmp_path):
+        _app(tmp_path / "one", "ios", lane="one")
+        _app(tmp_path / "two", "android", lane="two")
+
+        scan = await scan_monorepo(tmp_path)
+
+        lanes = {e.app.path.name: [(l.name, l.platform) for l in e.index.lanes] for e in scan.apps}
+        assert lanes == {"one": [("one", "ios")], "two": [("two", "android")]}
+        assert not scan.truncated
+
+    @pytest.mark.asyncio
+    async def test_returns_partial_result_when_parsing_exceeds_budget(self, tmp_path):
+        _app(tmp_path / "one", None)
+
+        def slow_index(roots):
+            time.sleep(0.3)
+
+        with patch("fastlane_mcp.discovery.monorepo.load_lane_index", side_effect=slow_index):
+            scan = await scan_monorepo(tmp_path, time_budget=0.1)
+
+        assert scan.truncated
+        assert len(scan.apps) == 1
+        assert scan.apps[0].index is None
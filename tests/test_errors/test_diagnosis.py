@@ -48,3 +48,75 @@ Please check your signing configuration.
         assert "message" in result
         assert "diagnosis" in result
         assert "suggestions" in result
+
+
+class TestRankedDiagnosis:
+    def test_specific_cause_outranks_generic_timeout(self):
+        error = "\n".join([
+            "Operation timed out while fetching dependencies",
+            "Retrying...",
+            "error: No provisioning profile matching 'com.example.app'",
+        ])
+
+        result = diagnose_error(error)
+
+        assert result["message"] == "Provisioning profile not found"
+        assert [m["id"] for m in result["matches"]] == ["no_provisioning_profile", "timeout_error"]
+
+    def test_earlier_match_wins_between_equally_specific(self):
+        error = "[!] CocoaPods is not installed\nNo signing certificate found\n"
+
+        result = diagnose_error(error)
+
+        assert [m["id"] for m in result["matches"]][:2] == ["cocoapods_not_installed", "no_signing_certificate"]
+
+    def test_reports_location_and_occurrences(self):
+        error = "héllo wörld\nok\nrequest timed out\nagain timed out\n"
+
+        match = diagnose_error(error)["matches"][0]
+
+        assert match["line"] == 3
+        assert match["occurrences"] == 2
+        data = error.encode()
+        assert data[match["byte_start"]:match["byte_end"]].decode() == match["matched_text"] == "timed out"
+
+    def test_byte_offsets_of_non_ascii_output(self, monkeypatch):
+        monkeypatch.setattr("fastlane_mcp.errors.diagnosis.ENCODE_CHUNK_SIZE", 7)
+        output = "▸ Compiling ❌ View.swift\n" * 3 + "❌ No signing certificate found\n"
+
+        match = diagnose_error(output)["matches"][0]
+
+        start = output.index("No signing")
+        assert match["byte_start"] == len(output[:start].encode())
+        assert match["byte_end"] == len(output[:start + len("No signing certificate")].encode())
+        assert match["line"] == 4
+
+    def test_context_lines_around_match(self):
+        lines = [f"line {n}" for n in range(10)]
+        lines[5] = "FAILURE: Build failed with an exception."
+
+        match = diagnose_error("\n".join(lines), context_lines=1)["matches"][0]
+
+        assert match["context"] == ["line 4", "FAILURE: Build failed with an exception.", "line 6"]
+
+    def test_context_at_start_and_end_of_output(self):
+        match = diagnose_error("Operation timed out", context_lines=3)["matches"][0]
+
+        assert match["context"] == ["Operation timed out"]
+
+    def test_context_lines_are_truncated(self):
+        error = "x" * 5000 + " timed out"
+
+        context = diagnose_error(error)["matches"][0]["context"]
+
+        assert len(context[0]) < 1000
+
+    def test_max_matches(self):
+        error = "Operation timed out\nNo signing certificate\nFAILURE: Build failed\n"
+
+        result = diagnose_error(error, max_matches=1)
+
+        assert len(result["matches"]) == 1
+
+    def test_unmatched_has_empty_matches(self):
+        assert diagnose_error("all good")["matches"] == []
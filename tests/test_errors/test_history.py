@@ -0,0 +1,138 @@
+"""Tests for failure fingerprinting and history."""
+
+import sqlite3
+
+import pytest
+
+from fastlane_mcp.errors.history import FailureHistory, failure_signature, normalize_failure
+from fastlane_mcp.errors.matcher import error_matcher
+
+
+class TestNormalizeFailure:
+    def test_strips_volatile_parts(self):
+        a = normalize_failure(
+            "[12:01:02]: /Users/ci/build-41/App/View.swift:12:7: error: cannot find 'Foo' in scope"
+        )
+        b = normalize_failure(
+            "[18:44:10]: /Users/dev/App/View.swift:98:3: error: cannot find 'Foo' in scope"
+        )
+
+        assert a == b
+        assert a == "<path>:<n>:<n>: error: cannot find 'foo' in scope"
+
+    def test_strips_uuids_hashes_and_dates(self):
+        line = "2026-03-01T10:00:00Z Provisioning profile 1B2C3D4E-0000-1111-2222-333344445555 at deadbeef42 failed"
+
+        assert normalize_failure(line) == "<time> provisioning profile <uuid> at <hex> failed"
+
+    def test_strips_colors(self):
+        assert normalize_failure("\x1b[31mBUILD FAILED\x1b[0m") == "build failed"
+
+
+class TestFailureSignature:
+    def test_same_failure_in_different_builds(self):
+        first = "/tmp/a/Foo.swift:1:2: error: No signing certificate found"
+        second = "/tmp/b/Foo.swift:30:4: error: No signing certificate found"
+
+        a = failure_signature(error_matcher.find_all(first), first)
+        b = failure_signature(error_matcher.find_all(second), second)
+
+        assert a.fingerprint == b.fingerprint
+        assert a.pattern_id == "no_signing_certificate"
+        assert a.sample == first
+
+    def test_different_failures_differ(self):
+        a = failure_signature([], "error: linker command failed")
+        b = failure_signature([], "error: disk full")
+
+        assert a.fingerprint != b.fingerprint
+
+    def test_unrecognized_failure_uses_last_line(self):
+        signature = failure_signature([], "step 1\nsomething odd happened\n\n")
+
+        assert signature.pattern_id is None
+        assert signature.message == "Unrecognized failure"
+        assert signature.sample == "something odd happened"
+
+
+class TestFailureHistory:
+    @pytest.fixture
+    def history(self, tmp_path):
+        return FailureHistory(tmp_path / "history.sqlite3")
+
+    def _failure(self, line="error: No signing certificate found"):
+        return failure_signature(error_matcher.find_all(line), line)
+
+    def test_counts_recurring_failures(self, history):
+        for now in (100.0, 200.0, 300.0):
+            history.record_build("/app", "ios", "build", self._failure(), now=now)
+        history.record_build("/app", "ios", "build", self._failure("error: disk full"), now=400.0)
+
+        failures = history.recurring()
+
+        assert len(failures) == 1
+        assert failures[0]["count"] == 3
+        assert failures[0]["first_seen"] == 100.0
+        assert failures[0]["last_seen"] == 300.0
+        assert failures[0]["pattern_id"] == "no_signing_certificate"
+        assert failures[0]["lane_builds"] == 4
+        assert failures[0]["lane_failures"] == 4
+        assert failures[0]["flaky"] is False
+
+    def test_run_shared_by_several_callers_is_recorded_once(self, history):
+        for _ in range(3):
+            history.record_build("/app", "ios", "build", self._failure(), now=100.0, log_id="run-1")
+        history.record_build("/app", "ios", "build", self._failure(), now=200.0, log_id="run-2")
+
+        [failure] = history.recurring()
+
+        assert failure["count"] == 2
+        assert failure["lane_builds"] == 2
+
+    def test_success_after_failure_marks_flaky(self, history):
+        history.record_build("/app", "ios", "build", self._failure(), now=100.0)
+        history.record_build("/app", "ios", "build", now=150.0)
+        history.record_build("/app", "ios", "build", self._failure(), now=200.0)
+
+        [failure] = history.recurring()
+
+        assert failure["flaky"] is True
+        assert failure["lane_builds"] == 3
+        assert failure["lane_failures"] == 2
+
+    def test_filters(self, history):
+        for project, platform, lane in (("/a", "ios", "build"), ("/b", "android", "build"), ("/a", "ios", "beta")):
+            history.record_build(project, platform, lane, self._failure(), now=100.0)
+
+        assert len(history.recurring(min_count=1)) == 3
+        assert [f["project"] for f in history.recurring(project="/b", min_count=1)] == ["/b"]
+        assert [f["lane"] for f in history.recurring(platform="ios", lane="beta", min_count=1)] == ["beta"]
+        assert history.recurring(min_count=1, since=200.0) == []
+        assert len(history.recurring(min_count=1, limit=2)) == 2
+
+    def test_survives_reopening(self, history, tmp_path):
+        history.record_build("/app", "ios", "build", self._failure(), now=100.0)
+        history.record_build("/app", "ios", "build", self._failure(), now=200.0)
+
+        reopened = FailureHistory(tmp_path / "history.sqlite3")
+
+        assert reopened.recurring()[0]["count"] == 2
+
+    def test_uses_configured_path(self, monkeypatch, tmp_path):
+        db = tmp_path / "nested" / "configured.sqlite3"
+        monkeypatch.setenv("FASTLANE_MCP_HISTORY_DB", str(db))
+
+        FailureHistory().record_build("/app", "ios", "build")
+
+        assert db.exists()
+
+    @pytest.mark.asyncio
+    async def test_record_ignores_database_errors(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        history = FailureHistory(blocker / "history.sqlite3")
+
+        await history.record("/app", "ios", "build", self._failure())
+
+        with pytest.raises((sqlite3.Error, OSError)):
+            history.recurring()
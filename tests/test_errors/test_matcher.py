@@ -0,0 +1,152 @@
+"""Tests for the single-pass error pattern matcher."""
+
+import re
+
+import pytest
+
+from fastlane_mcp.errors.matcher import PatternMatcher, error_matcher, required_literals
+from fastlane_mcp.errors.patterns import ERROR_PATTERNS, ErrorPattern
+
+SAMPLE_ERRORS = [
+    "Error: No signing certificate \"iOS Distribution\" found",
+    "Code Sign error: No provisioning profile matching 'com.example.app'",
+    "xcode-select: error: tool 'xcodebuild' requires Xcode",
+    "xcodebuild: error: Unable to find a destination matching the provided destination specifier",
+    "[!] CocoaPods is not installed",
+    "[!] Unable to find a specification for `Firebase/Core`",
+    "FAILURE: Build failed with an exception.",
+    "SDK location not found. Define location with an ANDROID_SDK_ROOT environment variable",
+    "Keystore file '/app/release.keystore' not found for signing config 'release'",
+    "Your Ruby version is 2.6.10, but your Gemfile specified 3.3.5",
+    "zsh: bundle: command not found",
+    "Operation timed out after 600 seconds",
+]
+
+NOISE = "CompileSwift normal arm64 /Users/ci/app/Sources/View{n}.swift (in target 'App' from project 'App')"
+
+
+def _custom(pattern: str, flags=re.I) -> ErrorPattern:
+    return ErrorPattern(
+        id="custom", pattern=re.compile(pattern, flags), category="custom",
+        message="m", diagnosis="d", suggestions=[],
+    )
+
+
+class TestRequiredLiterals:
+    def test_one_fragment_per_alternative(self):
+        assert required_literals(re.compile(r"Gradle build failed|Could not resolve", re.I)) == [
+            "gradle build failed", "could not resolve",
+        ]
+
+    def test_longest_run_around_wildcards(self):
+        assert required_literals(re.compile(r"Keystore.*not found")) == ["not found"]
+
+    def test_optional_characters_are_not_required(self):
+        assert required_literals(re.compile(r"colou?r profiles?")) == ["r profile"]
+
+    def test_escaped_punctuation_is_literal(self):
+        assert required_literals(re.compile(r"Info\.plist missing")) == ["info.plist missing"]
+
+    def test_groups_and_classes_break_fragments(self):
+        assert required_literals(re.compile(r"(error|warning): [A-Z]+ failed")) == [" failed"]
+
+    def test_unfilterable_patterns(self):
+        assert required_literals(re.compile(r"\d+ (error|warning)")) is None
+        assert required_literals(re.compile(r"^error$")) is None
+        assert required_literals(re.compile(r"fatal|ok")) is None
+
+    @pytest.mark.parametrize("pattern, flags", [
+        (r"What went wrong:\nExecution failed for task", re.I),
+        ("What went wrong:\nExecution failed for task", re.I),
+        (r"error:\s+module map", re.I),
+        (r"Undefined symbols\W+ld: symbol", re.I),
+        (r"Pods[^:]+: No such module", re.I),
+        (r"Archive failed.*exit status 65", re.I | re.S),
+    ])
+    def test_patterns_that_may_span_lines_are_unfiltered(self, pattern, flags):
+        assert required_literals(re.compile(pattern, flags)) is None
+
+
+class TestPatternMatcher:
+    def test_agrees_with_searching_each_pattern(self):
+        lines = [NOISE.format(n=n) for n in range(50)]
+        for n, error in enumerate(SAMPLE_ERRORS):
+            lines.insert(n * 4, error)
+        text = "\n".join(lines)
+
+        expected = [pattern.id for pattern in ERROR_PATTERNS if pattern.pattern.search(text)]
+        assert [pattern.id for pattern in error_matcher.matched_patterns(text)] == expected
+
+    @pytest.mark.parametrize("error", SAMPLE_ERRORS)
+    def test_each_sample_matches_like_the_regexes(self, error):
+        expected = [pattern.id for pattern in ERROR_PATTERNS if pattern.pattern.search(error)]
+
+        assert expected
+        assert [pattern.id for pattern in error_matcher.matched_patterns(error)] == expected
+
+    def test_reports_every_occurrence_with_positions(self):
+        text = "ok\nrequest timed out\nok\nsecond timeout here\n"
+
+        matches = [m for m in error_matcher.find_all(text) if m.pattern.id == "timeout_error"]
+
+        assert [m.text for m in matches] == ["timed out", "timeout"]
+        for match in matches:
+            assert text[match.start:match.end] == match.text
+
+    def test_overlapping_patterns_on_one_line(self):
+        text = "Code Sign error: No provisioning profile found"
+
+        ids = {match.pattern.id for match in error_matcher.find_all(text)}
+
+        assert {"no_signing_certificate", "no_provisioning_profile"} <= ids
+
+    def test_matches_are_ordered_by_position(self):
+        text = "Operation timed out\nFAILURE: Build failed\n"
+
+        starts = [match.start for match in error_matcher.find_all(text)]
+
+        assert starts == sorted(starts)
+
+    def test_unfilterable_pattern_is_still_searched(self):
+        matcher = PatternMatcher([_custom(r"\d+ (error|warning)s?")])
+
+        matches = matcher.find_all("noise\n3 errors generated.\n")
+
+        assert [m.text for m in matches] == ["3 errors"]
+
+    @pytest.mark.parametrize("pattern, text", [
+        (r"What went wrong:\nExecution failed for task", "* What went wrong:\nExecution failed for task ':app'"),
+        (r"error:\s+module map", "clang: error:\n  module map file not found"),
+    ])
+    def test_matches_spanning_lines(self, pattern, text):
+        matcher = PatternMatcher([_custom(pattern)])
+
+        matches = matcher.find_all(text)
+
+        assert [m.start for m in matches] == [m.start() for m in re.finditer(pattern, text, re.I)]
+        assert matches
+
+    def test_text_that_changes_length_when_lowercased(self):
+        text = "İstanbul build\nOperation timed out"
+
+        matches = error_matcher.find_all(text)
+
+        assert [m.pattern.id for m in matches] == ["timeout_error"]
+        assert text[matches[0].start:matches[0].end] == "Operation timed out"
+
+    def test_matches_across_lowercasing_chunks(self, monkeypatch):
+        monkeypatch.setattr("fastlane_mcp.errors.matcher.LOWER_CHUNK_SIZE", 64)
+        lines = [f"▸ Compiling File{n}.swift" for n in range(40)]
+        lines[7] = "İstanbul: Operation timed out"
+        lines[25] = "❌ error: No signing certificate found"
+        text = "\n".join(lines)
+
+        matches = error_matcher.find_all(text)
+
+        assert [m.pattern.id for m in matches] == ["timeout_error", "no_signing_certificate"]
+        assert [m.line for m in matches] == [lines[7], lines[25]]
+        assert text[matches[1].start:matches[1].end] == "No signing certificate"
+
+    def test_no_matches(self):
+        assert error_matcher.find_all(NOISE.format(n=1)) == []
+        assert error_matcher.find_all("") == []
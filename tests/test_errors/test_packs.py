@@ -0,0 +1,199 @@
+"""Tests for error pattern packs."""
+
+import os
+
+import pytest
+
+from fastlane_mcp.errors.diagnosis import diagnose_error
+from fastlane_mcp.errors.packs import PatternPackError, PatternRegistry, parse_pack, pattern_registry
+from fastlane_mcp.errors.patterns import ERROR_PATTERNS
+
+
+DISK_FULL = b'''
+[[patterns]]
+id = "farm_disk_full"
+pattern = "No space left on device"
+category = "environment"
+message = "Build machine is out of disk space"
+diagnosis = "The build agent ran out of disk space"
+suggestions = ["Clear DerivedData"]
+specificity = 70
+'''
+
+AGENT_LOST = b'''
+patterns:
+  - id: farm_agent_lost
+    pattern: "agent \\\\d+ disconnected"
+    category: environment
+    message: Build agent disconnected
+    diagnosis: The build agent went away mid-build
+'''
+
+
+def _touch(path, data):
+    """Write data and make sure the mtime differs from the previous write."""
+    stat = path.stat() if path.exists() else None
+    path.write_bytes(data)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestParsePack:
+    def test_toml(self):
+        [pattern] = parse_pack(DISK_FULL, "toml")
+
+        assert pattern.id == "farm_disk_full"
+        assert pattern.specificity == 70
+        assert pattern.suggestions == ["Clear DerivedData"]
+        assert pattern.pattern.search("NO SPACE LEFT ON DEVICE")
+
+    def test_yaml(self):
+        pytest.importorskip("yaml")
+
+        [pattern] = parse_pack(AGENT_LOST, "yaml")
+
+        assert pattern.id == "farm_agent_lost"
+        assert pattern.specificity == 50
+        assert pattern.suggestions == []
+        assert pattern.pattern.search("Agent 12 disconnected")
+
+    def test_case_sensitive_pattern(self):
+        [pattern] = parse_pack(DISK_FULL + b"ignore_case = false\n", "toml")
+
+        assert not pattern.pattern.search("NO SPACE LEFT ON DEVICE")
+
+    @pytest.mark.parametrize("data, error", [
+        (b"patterns = 1", "top-level 'patterns' list"),
+        (b"[[patterns]\n", "cannot parse TOML"),
+        (DISK_FULL.replace(b'pattern = "No space left on device"', b'pattern = "(unclosed"'), "invalid regex"),
+        (DISK_FULL.replace(b'category = "environment"', b""), "'category' must be a non-empty string"),
+        (DISK_FULL + b"severity = 3\n", "unknown field"),
+        (DISK_FULL.replace(b"specificity = 70", b"specificity = 500"), "'specificity'"),
+        (DISK_FULL.replace(b'id = "farm_disk_full"', b'id = "Disk Full"'), "'id' may only contain"),
+        (DISK_FULL + DISK_FULL, "defined more than once"),
+    ])
+    def test_rejects_invalid_packs(self, data, error):
+        with pytest.raises(PatternPackError, match=error):
+            parse_pack(data, "toml")
+
+
+class TestPatternRegistry:
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return PatternRegistry(directory=tmp_path, check_interval=0)
+
+    def test_builtin_patterns_without_packs(self):
+        registry = PatternRegistry(directory=None)
+
+        assert registry.matcher().patterns == ERROR_PATTERNS
+        assert registry.errors == {}
+
+    def test_loads_packs(self, registry, tmp_path):
+        (tmp_path / "disk.toml").write_bytes(DISK_FULL)
+        (tmp_path / "notes.txt").write_text("not a pack")
+
+        matcher = registry.matcher()
+
+        assert [p.id for p in matcher.patterns[len(ERROR_PATTERNS):]] == ["farm_disk_full"]
+        assert [m.pattern.id for m in matcher.find_all("error: No space left on device")] == ["farm_disk_full"]
+
+    def test_unchanged_packs_keep_the_matcher(self, registry, tmp_path):
+        (tmp_path / "disk.toml").write_bytes(DISK_FULL)
+        matcher = registry.matcher()
+
+        assert registry.matcher() is matcher
+
+    def test_reloads_modified_added_and_removed_packs(self, registry, tmp_path):
+        pack = tmp_path / "disk.toml"
+        pack.write_bytes(DISK_FULL)
+        registry.matcher()
+
+        _touch(pack, DISK_FULL.replace(b"No space left on device", b"Disk quota exceeded"))
+        assert registry.matcher().find_all("Disk quota exceeded")
+
+        (tmp_path / "more.toml").write_bytes(DISK_FULL.replace(b"farm_disk_full", b"farm_other"))
+        assert "farm_other" in [p.id for p in registry.matcher().patterns]
+
+        pack.unlink()
+        assert "farm_disk_full" not in [p.id for p in registry.matcher().patterns]
+
+    def test_unchanged_contents_are_not_recompiled(self, registry, tmp_path):
+        pack = tmp_path / "disk.toml"
+        pack.write_bytes(DISK_FULL)
+        matcher = registry.matcher()
+
+        _touch(pack, DISK_FULL)
+
+        assert registry.matcher() is matcher
+
+    def test_invalid_edit_keeps_previous_version(self, registry, tmp_path):
+        pack = tmp_path / "disk.toml"
+        pack.write_bytes(DISK_FULL)
+        registry.matcher()
+
+        _touch(pack, b"[[patterns]\n")
+        matcher = registry.matcher()
+
+        assert "farm_disk_full" in [p.id for p in matcher.patterns]
+        assert "cannot parse TOML" in registry.errors[str(pack)]
+
+        _touch(pack, DISK_FULL)
+        registry.matcher()
+        assert registry.errors == {}
+
+    def test_invalid_pack_is_skipped(self, registry, tmp_path):
+        (tmp_path / "a.toml").write_bytes(b"patterns = 1")
+        (tmp_path / "b.toml").write_bytes(DISK_FULL)
+
+        matcher = registry.matcher()
+
+        assert [p.id for p in matcher.patterns[len(ERROR_PATTERNS):]] == ["farm_disk_full"]
+        assert list(registry.errors) == [str(tmp_path / "a.toml")]
+
+    def test_duplicate_ids_are_skipped(self, registry, tmp_path):
+        (tmp_path / "a.toml").write_bytes(DISK_FULL)
+        (tmp_path / "b.toml").write_bytes(DISK_FULL)
+        (tmp_path / "c.toml").write_bytes(DISK_FULL.replace(b"farm_disk_full", b"gradle_build_failed"))
+
+        matcher = registry.matcher()
+
+        assert [p.id for p in matcher.patterns[len(ERROR_PATTERNS):]] == ["farm_disk_full"]
+        assert "already defined by a.toml" in registry.errors[str(tmp_path / "b.toml")]
+        assert "built-in" in registry.errors[str(tmp_path / "c.toml")]
+
+    def test_checks_at_most_every_interval(self, tmp_path):
+        registry = PatternRegistry(directory=tmp_path, check_interval=3600)
+        matcher = registry.matcher()
+
+        (tmp_path / "disk.toml").write_bytes(DISK_FULL)
+
+        assert registry.matcher() is matcher
+        assert registry.reload() is True
+
+
+    def test_multiline_pattern_matches_across_lines(self, registry, tmp_path):
+        (tmp_path / "gradle.toml").write_bytes(b'''
+[[patterns]]
+id = "farm_gradle_task"
+pattern = "^\\\\* What went wrong:\\nExecution failed"
+category = "build"
+message = "Gradle task failed"
+diagnosis = "A Gradle task failed"
+multiline = true
+''')
+
+        matches = registry.matcher().find_all("BUILD\n* What went wrong:\nExecution failed for task ':app'\n")
+
+        assert [m.pattern.id for m in matches] == ["farm_gradle_task"]
+
+
+class TestConfiguredPacks:
+    def test_diagnose_error_uses_configured_packs(self, tmp_path, monkeypatch):
+        (tmp_path / "disk.toml").write_bytes(DISK_FULL)
+        monkeypatch.setenv("FASTLANE_MCP_PATTERN_DIR", str(tmp_path))
+        monkeypatch.setattr(pattern_registry, "check_interval", 0)
+
+        result = diagnose_error("cp: No space left on device")
+
+        assert result["matched"] is True
+        assert result["message"] == "Build machine is out of disk space"
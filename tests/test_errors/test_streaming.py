@@ -0,0 +1,192 @@
+"""Tests for streaming error diagnosis."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from fastlane_mcp.errors.streaming import EarlyAbort, StreamingDiagnoser, abort_patterns
+from fastlane_mcp.utils.executor import execute_command
+
+
+class TestStreamingDiagnoser:
+    def test_matches_complete_lines(self):
+        diagnoser = StreamingDiagnoser()
+
+        found = diagnoser.feed("compiling\nFAILURE: Build failed with an exception.\n")
+
+        assert [m.pattern.id for m in found] == ["gradle_build_failed"]
+        assert diagnoser.pattern_ids() == ["gradle_build_failed"]
+
+    def test_line_split_across_chunks(self):
+        diagnoser = StreamingDiagnoser()
+
+        assert diagnoser.feed("ok\nerror: No signing cert") == []
+        found = diagnoser.feed("ificate \"iOS Distribution\" found\n")
+
+        assert [m.text for m in found] == ["No signing certificate"]
+
+    def test_offsets_span_all_chunks(self):
+        diagnoser = StreamingDiagnoser()
+        chunks = ["first line\nsecond ", "line\nOperation timed", " out\n"]
+        text = "".join(chunks)
+
+        for chunk in chunks:
+            diagnoser.feed(chunk)
+
+        match = diagnoser.matches[0]
+        assert text[match.start:match.end] == match.text == "Operation timed out"
+
+    def test_each_match_reported_once(self):
+        diagnoser = StreamingDiagnoser()
+
+        diagnoser.feed("request timed out\npartial")
+        diagnoser.feed(" line\n")
+        diagnoser.feed("ok\n")
+
+        assert diagnoser.match_count == 1
+
+    def test_close_matches_unfinished_line(self):
+        diagnoser = StreamingDiagnoser()
+        diagnoser.feed("xcode-select: error: no developer tools were found")
+
+        assert diagnoser.matches == []
+        assert {m.pattern.id for m in diagnoser.close()} == {"xcode_not_selected"}
+
+    def test_overlong_line_is_matched_without_newline(self):
+        diagnoser = StreamingDiagnoser(window=100)
+
+        found = diagnoser.feed("x" * 200 + " Operation timed out " + "y" * 200)
+
+        assert [m.pattern.id for m in found] == ["timeout_error"]
+
+    def test_feed_line(self):
+        diagnoser = StreamingDiagnoser()
+
+        diagnoser.feed_line("stderr", "[!] Unable to find a specification for `Foo`")
+        diagnoser.close()
+
+        assert diagnoser.pattern_ids() == ["pod_install_failed"]
+
+    def test_feed_line_matches_in_batches(self, monkeypatch):
+        diagnoser = StreamingDiagnoser(batch_size=170)
+        calls = []
+        find_all = diagnoser.matcher.find_all
+        monkeypatch.setattr(diagnoser.matcher, "find_all", lambda text: calls.append(text) or find_all(text))
+
+        for n in range(9):
+            diagnoser.feed_line("stdout", f"compiling file {n}")
+        assert calls == []
+
+        diagnoser.feed_line("stderr", "Operation timed out")
+        assert len(calls) == 1
+        assert diagnoser.pattern_ids() == ["timeout_error"]
+
+    def test_feed_line_matches_buffered_lines_after_interval(self, monkeypatch):
+        diagnoser = StreamingDiagnoser()
+        diagnoser.feed_line("stderr", "Operation timed out")
+        assert diagnoser.matches == []
+
+        monkeypatch.setattr("fastlane_mcp.errors.streaming.FLUSH_INTERVAL", 0)
+        diagnoser.feed_line("stdout", "ok")
+
+        assert diagnoser.pattern_ids() == ["timeout_error"]
+
+    def test_abort_pattern_is_not_delayed_by_batching(self):
+        diagnoser = StreamingDiagnoser(abort_on={"no_signing_certificate"})
+        diagnoser.feed_line("stdout", "Operation timed out")
+
+        with pytest.raises(EarlyAbort):
+            diagnoser.feed_line("stderr", "error: No signing certificate \"iOS Distribution\" found")
+
+        assert diagnoser.pattern_ids() == ["timeout_error", "no_signing_certificate"]
+
+    def test_diagnosis(self):
+        diagnoser = StreamingDiagnoser()
+        assert diagnoser.diagnosis() is None
+
+        diagnoser.feed("Operation timed out\nCode Sign error: No certificate\n")
+
+        # The more specific pattern wins over the earlier timeout
+        assert "certificate" in diagnoser.diagnosis()["message"].lower()
+
+    def test_diagnosis_locates_matches_like_diagnose_error(self):
+        from fastlane_mcp.errors.diagnosis import diagnose_error
+
+        text = "Übersetze…\nOperation timed out\nok\nerror: No signing certificate found\nOperation timed out\n"
+        diagnoser = StreamingDiagnoser()
+        for line in text.splitlines():
+            diagnoser.feed_line("stdout", line)
+        diagnoser.close()
+
+        streamed = diagnoser.diagnosis()["matches"]
+        expected = diagnose_error(text)["matches"]
+
+        assert [(m["id"], m["line"], m["byte_start"], m["byte_end"], m["occurrences"]) for m in streamed] == [
+            (m["id"], m["line"], m["byte_start"], m["byte_end"], m["occurrences"]) for m in expected
+        ]
+        assert streamed[0]["context"] == ["error: No signing certificate found"]
+
+    def test_abort_pattern_raises(self):
+        diagnoser = StreamingDiagnoser(abort_on={"no_signing_certificate"})
+        diagnoser.feed("Operation timed out\n")
+
+        with pytest.raises(EarlyAbort) as excinfo:
+            diagnoser.feed("No signing certificate \"iOS Distribution\" found\n")
+
+        assert excinfo.value.match.pattern.id == "no_signing_certificate"
+        assert diagnoser.aborted is excinfo.value.match
+        assert "certificate" in diagnoser.diagnosis()["message"].lower()
+
+    def test_diagnosis_locates_matches_like_diagnose_error(self):
+        from fastlane_mcp.errors.diagnosis import diagnose_error
+
+        text = "Übersetze…\nOperation timed out\nok\nerror: No signing certificate found\nOperation timed out\n"
+        diagnoser = StreamingDiagnoser()
+        for line in text.splitlines():
+            diagnoser.feed_line("stdout", line)
+        diagnoser.close()
+
+        streamed = diagnoser.diagnosis()["matches"]
+        expected = diagnose_error(text)["matches"]
+
+        assert [(m["id"], m["line"], m["byte_start"], m["byte_end"], m["occurrences"]) for m in streamed] == [
+            (m["id"], m["line"], m["byte_start"], m["byte_end"], m["occurrences"]) for m in expected
+        ]
+        assert streamed[0]["context"] == ["error: No signing certificate found"]
+
+    def test_other_patterns_do_not_abort(self):
+        diagnoser = StreamingDiagnoser(abort_on={"no_signing_certificate"})
+
+        diagnoser.feed("Operation timed out\n")
+
+        assert diagnoser.aborted is None
+
+
+class TestAbortPatterns:
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("FASTLANE_MCP_ABORT_PATTERNS", raising=False)
+        assert "no_signing_certificate" in abort_patterns()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("FASTLANE_MCP_ABORT_PATTERNS", "timeout_error, keystore_not_found,")
+        assert abort_patterns() == {"timeout_error", "keystore_not_found"}
+
+
+class TestEarlyAbortStopsProcess:
+    @pytest.mark.asyncio
+    async def test_kills_command_on_abort_pattern(self):
+        script = (
+            "import sys, time\n"
+            "print('Compiling', flush=True)\n"
+            "print('error: No signing certificate found', file=sys.stderr, flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        diagnoser = StreamingDiagnoser(abort_on={"no_signing_certificate"})
+
+        start = time.monotonic()
+        with pytest.raises(EarlyAbort):
+            await execute_command(sys.executable, ["-c", script], on_line=diagnoser.feed_line)
+
+        assert time.monotonic() - start < 10
@@ -3,6 +3,7 @@
 import pytest
 from fastlane_mcp.plugins.registry import (
     PLUGIN_CATALOG,
+    PluginIndex,
     search_plugins,
     get_plugin_info,
 )
@@ -39,6 +40,71 @@ class TestSearchPlugins:
         results2 = search_plugins("firebase")
         assert results1 == results2
 
+    def test_matches_word_prefixes(self):
+        assert [p.name for p in search_plugins("ver")] == ["fastlane-plugin-versioning"]
+
+    def test_matches_capabilities(self):
+        results = search_plugins("add_badge")
+        assert results[0].name == "fastlane-plugin-badge"
+
+    def test_limit(self):
+        assert len(search_plugins("upload")) > 2
+        assert len(search_plugins("upload", limit=2)) == 2
+
+    def test_empty_query_lists_catalog(self):
+        assert [p.name for p in search_plugins("", limit=3)] == list(PLUGIN_CATALOG)[:3]
+
+
+class TestPluginIndex:
+    CATALOG = {
+        "fastlane-plugin-slack_upload": {
+            "description": "Upload files to Slack",
+            "signals": ["slack"],
+            "capabilities": ["slack_upload"],
+        },
+        "fastlane-plugin-teams": {
+            "description": "Post messages to Microsoft Teams, like slack",
+            "signals": ["teams"],
+            "capabilities": ["teams"],
+        },
+        "fastlane-plugin-s3": {
+            "description": "Upload builds to S3",
+            "signals": ["aws"],
+            "capabilities": ["s3_upload"],
+        },
+    }
+
+    def test_name_matches_rank_above_description_matches(self):
+        index = PluginIndex(self.CATALOG)
+
+        names = [name for name, _ in index.search("slack")]
+
+        assert names == ["fastlane-plugin-slack_upload", "fastlane-plugin-teams"]
+
+    def test_more_matching_terms_rank_higher(self):
+        index = PluginIndex(self.CATALOG)
+
+        [(best, _), *_] = index.search("upload s3")
+
+        assert best == "fastlane-plugin-s3"
+
+    def test_exact_terms_outscore_prefixes(self):
+        index = PluginIndex({
+            "fastlane-plugin-test": {"description": "", "signals": [], "capabilities": []},
+            "fastlane-plugin-testflight": {"description": "", "signals": [], "capabilities": []},
+        })
+
+        [(first, exact), (second, prefix)] = index.search("test")
+
+        assert first == "fastlane-plugin-test"
+        assert second == "fastlane-plugin-testflight"
+        assert exact > prefix
+
+    def test_plugin_name_prefix_is_not_indexed(self):
+        index = PluginIndex(self.CATALOG)
+
+        assert index.search("plugin") == []
+
 
 class TestGetPluginInfo:
     def test_returns_plugin_info(self):
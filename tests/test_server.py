@@ -0,0 +1,19 @@
+"""Tests for the server lifecycle."""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastmcp import Client
+
+from fastlane_mcp.server import mcp
+
+
+class TestServerLifespan:
+    @pytest.mark.asyncio
+    async def test_closes_worker_pool_on_shutdown(self):
+        with patch("fastlane_mcp.server.worker_pool") as pool:
+            pool.close = AsyncMock()
+
+            async with Client(mcp):
+                pool.close.assert_not_called()
+
+        pool.close.assert_awaited_once()
@@ -56,3 +56,29 @@ end
 
         assert result["platforms"] == []
         assert result["lanes"] == []
+
+    @pytest.mark.asyncio
+    async def test_recursive_returns_per_app_lanes(self, tmp_path):
+        for app, platform in [("shop", "ios"), ("admin", "android")]:
+            fastlane_dir = tmp_path / "apps" / app / platform / "fastlane"
+            fastlane_dir.mkdir(parents=True)
+            (fastlane_dir / "Fastfile").write_text(f"lane :{app} do\nend")
+
+        result = await _analyze_project(str(tmp_path), recursive=True)
+
+        assert result["has_fastlane"]
+        assert set(result["apps"]) == {"apps/shop", "apps/admin"}
+        assert result["apps"]["apps/shop"]["platforms"] == ["ios"]
+        assert [l["name"] for l in result["apps"]["apps/admin"]["lanes"]] == ["admin"]
+        assert result["scan"]["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_top_level_only_by_default(self, tmp_path):
+        fastlane_dir = tmp_path / "apps" / "shop" / "fastlane"
+        fastlane_dir.mkdir(parents=True)
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        result = await _analyze_project(str(tmp_path))
+
+        assert "apps" not in result
+        assert result["has_fastlane"] is False
@@ -4,8 +4,12 @@ import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from fastmcp.exceptions import ToolError
 
-from fastlane_mcp.tools.build import build_ios, build_android
+import asyncio
+
+from fastlane_mcp.tools.build import _execute_build, build_ios, build_android
+from fastlane_mcp.utils.bundler import BundlerResolver
 from fastlane_mcp.utils.executor import ExecutionResult
+from fastlane_mcp.utils.logs import open_log
 from fastlane_mcp.validators import ValidationResult
 
 
@@ -14,6 +18,14 @@ _build_ios = build_ios.fn
 _build_android = build_android.fn
 
 
+@pytest.fixture(autouse=True)
+def no_toolchain_probes():
+    """Keep builds from probing the real toolchain."""
+    with patch("fastlane_mcp.tools.build.toolchain.versions", new_callable=AsyncMock) as mock:
+        mock.return_value = {}
+        yield mock
+
+
 class TestBuildIos:
     @pytest.mark.asyncio
     async def test_successful_build(self, tmp_path):
@@ -36,6 +48,64 @@ class TestBuildIos:
             assert result["success"] is True
             assert "Build succeeded" in result["output"]
 
+    @pytest.mark.asyncio
+    async def test_reports_preflight_timings(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+
+            mock_preflight.return_value = ValidationResult(
+                valid=True, issues=[], timings={"tools": 0.01, "project": 0.02}
+            )
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            result = await _build_ios(project_path=str(tmp_path), lane="build")
+
+            assert result["preflight_seconds"] == {"tools": 0.01, "project": 0.02}
+
+    @pytest.mark.asyncio
+    async def test_force_preflight_bypasses_cache(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            await _build_ios(project_path=str(tmp_path), lane="build")
+            assert mock_preflight.call_args.kwargs["use_cache"] is True
+
+            await _build_ios(project_path=str(tmp_path), lane="build", force_preflight=True)
+            assert mock_preflight.call_args.kwargs["use_cache"] is False
+
+    @pytest.mark.asyncio
+    async def test_reports_toolchain_versions(self, tmp_path, no_toolchain_probes):
+        from fastlane_mcp.validators.toolchain import ToolVersion
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+        no_toolchain_probes.return_value = {
+            "xcodebuild": ToolVersion("xcodebuild", "/usr/bin/xcodebuild", version="16.2"),
+            "fastlane": ToolVersion("fastlane", None, error="fastlane not found on PATH"),
+        }
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            result = await _build_ios(project_path=str(tmp_path), lane="build")
+
+        assert result["toolchain"] == {"xcodebuild": "16.2", "fastlane": None}
+        no_toolchain_probes.assert_called_once_with(["xcodebuild", "fastlane", "ruby", "bundler"])
+
     @pytest.mark.asyncio
     async def test_raises_tool_error_on_invalid_path(self):
         with pytest.raises(ToolError, match="does not exist"):
@@ -101,3 +171,300 @@ class TestBuildAndroid:
             )
 
             assert result["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_returns_log_id(self, tmp_path):
+        android_dir = tmp_path / "android" / "fastlane"
+        android_dir.mkdir(parents=True)
+        (android_dir / "Fastfile").write_text("lane :build do\n  gradle\nend")
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult(
+                "BUILD SUCCESSFUL", "", 0, log_id="20260101-000000-deadbeef"
+            )
+
+            result = await _build_android(
+                project_path=str(tmp_path),
+                lane="build"
+            )
+
+            assert result["log_id"] == "20260101-000000-deadbeef"
+
+
+class TestBuildWithBundle:
+    @pytest.fixture
+    def bundled_project(self, tmp_path, monkeypatch):
+        """An Android project whose Gemfile.lock pins fastlane, with only `bundle` on PATH."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "bundle").write_text("#!/bin/sh\nexit 0\n")
+        (bin_dir / "bundle").chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}:/usr/bin:/bin")
+
+        project = tmp_path / "app"
+        (project / "fastlane").mkdir(parents=True)
+        (project / "fastlane" / "Fastfile").write_text("lane :build do\nend\n")
+        (project / "Gemfile").write_text('gem "fastlane"\n')
+        (project / "Gemfile.lock").write_text("GEM\n  specs:\n    fastlane (2.225.0)\n")
+        return project
+
+    @pytest.mark.asyncio
+    async def test_preflight_requires_bundle_instead_of_fastlane(self, bundled_project):
+        with patch("fastlane_mcp.tools.build.bundler", BundlerResolver()), \
+             patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            await _build_android(project_path=str(bundled_project), lane="build")
+
+        assert mock_preflight.call_args.args[0].required_tools == ["bundle"]
+
+    @pytest.mark.asyncio
+    async def test_reports_bundled_fastlane(self, bundled_project):
+        with patch("fastlane_mcp.tools.build.bundler", BundlerResolver()), \
+             patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            result = await _build_android(project_path=str(bundled_project), lane="build")
+
+        assert result["fastlane"]["mode"] == "bundle exec"
+        assert result["fastlane"]["version"] == "2.225.0"
+        # The resolved command is reused rather than resolved again
+        assert mock_exec.call_args.kwargs["fastlane"].mode == "bundle exec"
+
+    @pytest.mark.asyncio
+    async def test_global_fastlane_without_gemfile(self, tmp_path):
+        (tmp_path / "fastlane").mkdir()
+        (tmp_path / "fastlane" / "Fastfile").write_text("lane :build do\nend\n")
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("Build succeeded", "", 0)
+
+            result = await _build_android(project_path=str(tmp_path), lane="build")
+
+        assert mock_preflight.call_args.args[0].required_tools == ["fastlane"]
+        assert result["fastlane"] == {"mode": "global", "version": None, "gemfile": None}
+
+
+class TestBuildProgress:
+    @pytest.mark.asyncio
+    async def test_reports_fastlane_steps_as_progress(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, **kwargs):
+            await on_line("stdout", "[10:00:00]: --- Step: cocoapods ---")
+            await on_line("stdout", "Installing pods")
+            await on_line("stdout", "[10:00:05]: --- Step: gym ---")
+            return ExecutionResult("done", "", 0)
+
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            await _build_ios(project_path=str(tmp_path), lane="build", ctx=ctx)
+
+        assert ctx.report_progress.await_count == 2
+        progress, total, message = ctx.report_progress.await_args_list[1].args
+        assert progress == 2
+        assert "gym" in message
+
+    @pytest.mark.asyncio
+    async def test_progress_failure_does_not_fail_build(self, tmp_path):
+        android_dir = tmp_path / "android" / "fastlane"
+        android_dir.mkdir(parents=True)
+        (android_dir / "Fastfile").write_text("lane :build do\n  gradle\nend")
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, **kwargs):
+            await on_line("stdout", "--- Step: gradle ---")
+            await on_line("stdout", "--- Step: upload ---")
+            return ExecutionResult("done", "", 0)
+
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock(side_effect=RuntimeError("closed"))
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            result = await _build_android(project_path=str(tmp_path), lane="build", ctx=ctx)
+
+        assert result["success"] is True
+        assert ctx.report_progress.await_count == 1
+
+    def test_context_is_not_exposed_as_tool_parameter(self):
+        assert "ctx" not in build_ios.parameters.get("properties", {})
+
+
+class TestEarlyAbort:
+    @pytest.mark.asyncio
+    async def test_stops_build_on_abort_pattern(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+        later_lines = []
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, on_start, **kwargs):
+            await on_line("stdout", "--- Step: gym ---")
+            await on_line("stderr", "error: No signing certificate \"iOS Distribution\" found")
+            later_lines.append("never reached")
+            return ExecutionResult("", "", 0)
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            with pytest.raises(ToolError, match="stopped early"):
+                await _build_ios(project_path=str(tmp_path), lane="build", early_abort=True)
+
+        assert later_lines == []
+
+    @pytest.mark.asyncio
+    async def test_abort_is_opt_in(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, on_start, **kwargs):
+            await on_line("stderr", "warning: No certificate cached, downloading")
+            return ExecutionResult("done", "", 0)
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            result = await _build_ios(project_path=str(tmp_path), lane="build")
+
+        assert result["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_abort_only_stops_callers_that_asked_for_it(self, tmp_path):
+        (tmp_path / "fastlane").mkdir()
+        (tmp_path / "fastlane" / "Fastfile").write_text("lane :build do\n  match\nend")
+        after_abort = []
+
+        async def fake_command(command, args, **kwargs):
+            on_line = kwargs["on_line"]
+            await asyncio.sleep(0.05)  # let both callers attach
+            await on_line("stderr", "error: No signing certificate \"iOS Distribution\" found")
+            await on_line("stdout", "match: installed certificate, retrying")
+            after_abort.append(True)
+            return ExecutionResult("Build succeeded", "", 0)
+
+        with patch("fastlane_mcp.utils.executor.execute_command", side_effect=fake_command) as mock_exec:
+            aborted, recovered = await asyncio.gather(
+                _execute_build("build", "ios", tmp_path, {}, None, early_abort=True),
+                _execute_build("build", "ios", tmp_path, {}, None, early_abort=False),
+                return_exceptions=True,
+            )
+
+        assert mock_exec.call_count == 1
+        assert isinstance(aborted, ToolError)
+        assert "stopped early" in str(aborted)
+        assert recovered.exit_code == 0
+        assert after_abort == [True]
+
+    @pytest.mark.asyncio
+    async def test_shared_run_is_recorded_once(self, tmp_path):
+        from fastlane_mcp.errors.history import failure_history
+
+        (tmp_path / "fastlane").mkdir()
+        (tmp_path / "fastlane" / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        async def fake_command(command, args, **kwargs):
+            await asyncio.sleep(0.05)  # let every caller attach
+            await kwargs["on_line"]("stderr", "error: No signing certificate \"iOS Distribution\" found")
+            return ExecutionResult("", "** ARCHIVE FAILED **", 65, log_id=kwargs["log"].log_id)
+
+        with patch("fastlane_mcp.utils.executor.execute_command", side_effect=fake_command) as mock_exec:
+            results = await asyncio.gather(
+                *(_execute_build("build", "ios", tmp_path, {}, None, early_abort=False) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert mock_exec.call_count == 1
+        assert all(isinstance(result, ToolError) for result in results)
+        [failure] = failure_history.recurring(min_count=1)
+        assert failure["count"] == 1
+        assert failure["lane_builds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_diagnosed_from_streamed_output(self, tmp_path):
+        android_dir = tmp_path / "android" / "fastlane"
+        android_dir.mkdir(parents=True)
+        (android_dir / "Fastfile").write_text("lane :build do\n  gradle\nend")
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, on_start, **kwargs):
+            # Long gone from the returned tail by the time the build fails
+            await on_line("stderr", "SDK location not found. Define a valid SDK location")
+            return ExecutionResult("", "BUILD FAILED in 3s", 1)
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            with pytest.raises(ToolError, match="Android SDK not found"):
+                await _build_android(project_path=str(tmp_path), lane="build")
+
+
+class TestBuildErrorFormatting:
+    @pytest.mark.asyncio
+    async def test_error_lists_location_and_other_causes(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+
+        output = ["Compiling", "error: No provisioning profile for 'App'", "Operation timed out"]
+
+        async def fake_execute(lane, platform, path, env_vars, on_line, on_start, **kwargs):
+            for line in output:
+                await on_line("stderr", line)
+            # By the time the build fails, the tail no longer holds the errors
+            return ExecutionResult("", "** ARCHIVE FAILED **", 65)
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            with pytest.raises(ToolError) as excinfo:
+                await _build_ios(project_path=str(tmp_path), lane="build")
+
+        message = str(excinfo.value)
+        assert message.startswith("Provisioning profile not found")
+        assert "Found at line 2:\n    error: No provisioning profile for 'App'" in message
+        assert "Also found:" in message and "(line 3: 'Operation timed out')" in message
+
+    @pytest.mark.asyncio
+    async def test_error_lists_failed_log_segments(self, tmp_path):
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend")
+        log = open_log()
+        log.write(
+            b"--- Step: gym ---\n"
+            b"CompileSwift normal arm64 /src/View.swift (in target 'App' from project 'App')\n"
+            b"/src/View.swift:3:1: error: expected declaration\n"
+        )
+        log.close()
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec:
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+            mock_exec.return_value = ExecutionResult("", "** BUILD FAILED **", 65, log_id=log.log_id)
+
+            with pytest.raises(ToolError) as excinfo:
+                await _build_ios(project_path=str(tmp_path), lane="build")
+
+        assert "[1] phase CompileSwift normal arm64 /src/View.swift" in str(excinfo.value)
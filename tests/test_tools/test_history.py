@@ -0,0 +1,65 @@
+"""Tests for the failure history tool."""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.tools.history import get_recurring_failures
+from fastlane_mcp.tools.build import build_ios
+from fastlane_mcp.utils.executor import ExecutionResult
+from fastlane_mcp.validators import ValidationResult
+
+
+# Access the underlying functions from the FunctionTool objects
+_build_ios = build_ios.fn
+_get_recurring_failures = get_recurring_failures.fn
+
+
+async def _build(project, result):
+    with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+         patch("fastlane_mcp.tools.build.execute_fastlane") as mock_exec, \
+         patch("fastlane_mcp.tools.build.toolchain.versions", new_callable=AsyncMock) as mock_versions:
+        mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+        mock_exec.return_value = result
+        mock_versions.return_value = {}
+        try:
+            await _build_ios(project_path=str(project), lane="build")
+        except ToolError:
+            pass
+
+
+class TestGetRecurringFailures:
+    @pytest.mark.asyncio
+    async def test_reports_failures_recorded_by_builds(self, ios_project):
+        await _build(ios_project, ExecutionResult("", "[10:00:01]: /a/App.swift:3:1: No signing certificate found", 1))
+        await _build(ios_project, ExecutionResult("Build succeeded", "", 0))
+        await _build(ios_project, ExecutionResult("", "[11:30:45]: /b/App.swift:9:2: No signing certificate found", 1))
+
+        result = await _get_recurring_failures(project_path=str(ios_project))
+
+        assert result["count"] == 1
+        failure = result["failures"][0]
+        assert failure["pattern_id"] == "no_signing_certificate"
+        assert failure["count"] == 2
+        assert failure["platform"] == "ios"
+        assert failure["lane"] == "build"
+        assert failure["lane_builds"] == 3
+        assert failure["flaky"] is True
+
+    @pytest.mark.asyncio
+    async def test_min_count(self, ios_project):
+        await _build(ios_project, ExecutionResult("", "something odd happened", 1))
+
+        assert (await _get_recurring_failures())["count"] == 0
+        failure = (await _get_recurring_failures(min_count=1))["failures"][0]
+        assert failure["message"] == "Unrecognized failure"
+        assert failure["sample"] == "something odd happened"
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_arguments(self):
+        with pytest.raises(ToolError, match="Unknown platform"):
+            await _get_recurring_failures(platform="windows")
+        with pytest.raises(ToolError, match="min_count"):
+            await _get_recurring_failures(min_count=0)
+        with pytest.raises(ToolError, match="limit"):
+            await _get_recurring_failures(limit=0)
@@ -0,0 +1,120 @@
+"""Tests for background build tools."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.tools.jobs import start_build, get_build_status, cancel_build
+from fastlane_mcp.utils.executor import ExecutionResult
+from fastlane_mcp.utils.logs import log_path, open_log
+from fastlane_mcp.validators import ValidationResult
+
+
+# Access the underlying functions from the FunctionTool objects
+_start_build = start_build.fn
+_get_build_status = get_build_status.fn
+_cancel_build = cancel_build.fn
+
+
+async def _fake_execute(lane, platform, project_path, env_vars, on_line, on_start, **kwargs):
+    log = open_log()
+    on_start(log)
+    log.write(b"No signing certificate found\n")
+    on_line("stderr", "No signing certificate found")
+    log.close()
+    return ExecutionResult("", "No signing certificate found\n", 1, log_id=log.log_id)
+
+
+class TestBuildJobTools:
+    @pytest.mark.asyncio
+    async def test_start_and_poll_build(self, tmp_path):
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            started = await _start_build(str(tmp_path), "ios")
+            assert started["status"] == "queued"
+            await asyncio.sleep(0.01)
+
+            status = await _get_build_status(started["job_id"])
+
+        assert status["status"] == "failed"
+        assert "No signing certificate" in status["output"]
+        assert status["next_offset"] == status["log_size"]
+        assert "certificate" in status["diagnosis"].lower()
+
+        again = await _get_build_status(started["job_id"], offset=status["next_offset"])
+        assert again["output"] == ""
+
+    @pytest.mark.asyncio
+    async def test_poll_after_log_rotated_out(self, tmp_path):
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            started = await _start_build(str(tmp_path), "ios")
+            await asyncio.sleep(0.01)
+
+        status = await _get_build_status(started["job_id"])
+        log_path(status["log_id"]).unlink()
+
+        with pytest.raises(ToolError, match="not found"):
+            await _get_build_status(started["job_id"])
+
+    @pytest.mark.asyncio
+    async def test_start_rejects_invalid_platform(self, tmp_path):
+        with pytest.raises(ToolError, match="Invalid platform"):
+            await _start_build(str(tmp_path), "windows")
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self):
+        with pytest.raises(ToolError, match="Unknown build job"):
+            await _get_build_status("nope")
+        with pytest.raises(ToolError, match="Unknown build job"):
+            await _cancel_build("nope")
+
+
+class TestBuildJobEarlyAbort:
+    @pytest.mark.asyncio
+    async def test_early_abort_fails_job_with_diagnosis(self, tmp_path):
+        async def fake_execute(lane, platform, project_path, env_vars, on_line, on_start, **kwargs):
+            log = open_log()
+            on_start(log)
+            try:
+                on_line("stderr", "No signing certificate found")
+                await asyncio.sleep(30)
+            finally:
+                log.close()
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            started = await _start_build(str(tmp_path), "ios", early_abort=True)
+            await asyncio.sleep(0.01)
+            status = await _get_build_status(started["job_id"])
+
+        assert status["status"] == "failed"
+        assert "stopped early" in status["error"]
+        assert status["detected_errors"] == ["no_signing_certificate"]
+        assert "certificate" in status["diagnosis"].lower()
+
+
+class TestBuildJobHistory:
+    @pytest.mark.asyncio
+    async def test_failed_job_is_recorded(self, tmp_path):
+        from fastlane_mcp.errors.history import failure_history
+
+        with patch("fastlane_mcp.tools.build.run_preflight") as mock_preflight, \
+             patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute):
+            mock_preflight.return_value = ValidationResult(valid=True, issues=[])
+
+            started = await _start_build(str(tmp_path), "ios")
+            await asyncio.sleep(0.05)
+
+        [failure] = failure_history.recurring(min_count=1)
+        assert failure["pattern_id"] == "no_signing_certificate"
+        assert failure["project"] == str(tmp_path.resolve())
+        assert (await _get_build_status(started["job_id"]))["status"] == "failed"
@@ -1,5 +1,7 @@
 """Tests for lanes tool."""
 
+import threading
+
 import pytest
 from fastmcp.exceptions import ToolError
 from fastlane_mcp.tools.lanes import list_lanes
@@ -76,3 +78,41 @@ end
 
         with pytest.raises(ToolError, match="Fastfile not found"):
             await _list_lanes(str(tmp_path), "ios")
+
+    @pytest.mark.asyncio
+    async def test_includes_imported_lanes(self, tmp_path):
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        (shared_dir / "Fastfile").write_text("lane :lint do\nend")
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text('import "../../shared/Fastfile"\nlane :build do\nend')
+
+        result = await _list_lanes(str(tmp_path), "ios")
+
+        assert [(l["name"], l["platform"]) for l in result["lanes"]] == [("build", "ios"), ("lint", "ios")]
+        assert result["lanes"][1]["source"] == str(shared_dir / "Fastfile")
+        assert result["unresolved_imports"] == []
+
+
+class TestListLanesThreading:
+    @pytest.mark.asyncio
+    async def test_loads_lane_index_off_the_event_loop(self, tmp_path, monkeypatch):
+        from fastlane_mcp.tools import lanes
+
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text("lane :build do\n  gym\nend\n")
+        threads = []
+        load = lanes.load_lane_index
+
+        def recording_load(roots):
+            threads.append(threading.current_thread())
+            return load(roots)
+
+        monkeypatch.setattr(lanes, "load_lane_index", recording_load)
+
+        result = await _list_lanes(str(tmp_path), "ios")
+
+        assert [lane["name"] for lane in result["lanes"]] == ["build"]
+        assert threads and threading.main_thread() not in threads
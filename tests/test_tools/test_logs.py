@@ -0,0 +1,119 @@
+"""Tests for build log tool."""
+
+import threading
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.tools.logs import get_build_log, get_log_segment, list_log_segments
+from fastlane_mcp.utils.logs import open_log
+
+
+# Access the underlying function from the FunctionTool object
+_get_build_log = get_build_log.fn
+_list_log_segments = list_log_segments.fn
+_get_log_segment = get_log_segment.fn
+
+
+class TestGetBuildLog:
+    @pytest.mark.asyncio
+    async def test_returns_requested_range(self):
+        log = open_log()
+        log.write(b"line one\nline two\n")
+        log.close()
+
+        result = await _get_build_log(log.log_id, offset=9, length=8)
+
+        assert result["data"] == "line two"
+        assert result["next_offset"] == 17
+        assert result["size"] == 18
+
+    @pytest.mark.asyncio
+    async def test_raises_tool_error_for_unknown_log(self):
+        with pytest.raises(ToolError, match="not found"):
+            await _get_build_log("20260101-000000-deadbeef")
+
+    @pytest.mark.asyncio
+    async def test_raises_tool_error_for_invalid_id(self):
+        with pytest.raises(ToolError, match="Invalid log id"):
+            await _get_build_log("../secrets")
+
+
+BUILD_LOG = b"""--- Step: gym ---
+CompileSwift normal arm64 /src/View.swift (in target 'App' from project 'App')
+/src/View.swift:3:1: error: expected declaration
+CompileSwift normal arm64 /src/Model.swift (in target 'App' from project 'App')
+** BUILD FAILED **
+"""
+
+
+def _build_log() -> str:
+    log = open_log()
+    log.write(BUILD_LOG)
+    log.close()
+    return log.log_id
+
+
+class TestLogSegmentTools:
+    @pytest.mark.asyncio
+    async def test_lists_segments(self):
+        result = await _list_log_segments(_build_log())
+
+        assert result["total"] == 3
+        assert [s["kind"] for s in result["segments"]] == ["step", "phase", "phase"]
+
+    @pytest.mark.asyncio
+    async def test_lists_failed_phases(self):
+        result = await _list_log_segments(_build_log(), kind="phase", failed_only=True)
+
+        assert [s["index"] for s in result["segments"]] == [1]
+
+    @pytest.mark.asyncio
+    async def test_fetches_failing_phase(self):
+        result = await _get_log_segment(_build_log(), name="CompileSwift", failed_only=True)
+
+        assert result["segment"]["index"] == 1
+        assert result["data"] == (
+            "CompileSwift normal arm64 /src/View.swift (in target 'App' from project 'App')\n"
+            "/src/View.swift:3:1: error: expected declaration\n"
+        )
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_fetches_by_index_with_byte_limit(self):
+        result = await _get_log_segment(_build_log(), index=1, max_bytes=12)
+
+        assert result["data"] == "CompileSwift"
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_errors(self):
+        log_id = _build_log()
+        with pytest.raises(ToolError, match="No segment 9"):
+            await _get_log_segment(log_id, index=9)
+        with pytest.raises(ToolError, match="No matching segment"):
+            await _get_log_segment(log_id, kind="task")
+        with pytest.raises(ToolError, match="Invalid segment kind"):
+            await _list_log_segments(log_id, kind="bogus")
+        with pytest.raises(ToolError, match="not found"):
+            await _list_log_segments("20260101-000000-deadbeef")
+
+    @pytest.mark.asyncio
+    async def test_indexes_off_the_event_loop(self, monkeypatch):
+        from fastlane_mcp.utils.segments import log_indexes
+
+        threads = []
+        get = log_indexes.get
+
+        def recording_get(log_id):
+            threads.append(threading.current_thread())
+            return get(log_id)
+
+        monkeypatch.setattr(log_indexes, "get", recording_get)
+        log_id = _build_log()
+
+        await _list_log_segments(log_id)
+        await _get_log_segment(log_id, index=0)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
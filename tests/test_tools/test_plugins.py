@@ -1,6 +1,8 @@
 """Tests for plugin tools."""
 
 import pytest
+from fastmcp.exceptions import ToolError
+
 from fastlane_mcp.tools.plugins import search_fastlane_plugins, get_plugin_details
 
 
@@ -23,6 +25,17 @@ class TestSearchPlugins:
 
         assert result["plugins"] == []
 
+    @pytest.mark.asyncio
+    async def test_limits_results(self):
+        result = await _search_fastlane_plugins("upload", limit=2)
+
+        assert len(result["plugins"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_limit(self):
+        with pytest.raises(ToolError, match="limit"):
+            await _search_fastlane_plugins("firebase", limit=0)
+
 
 class TestGetPluginDetails:
     @pytest.mark.asyncio
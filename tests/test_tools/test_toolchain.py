@@ -0,0 +1,30 @@
+"""Tests for toolchain tool."""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastmcp.exceptions import ToolError
+
+from fastlane_mcp.tools.toolchain import get_toolchain
+from fastlane_mcp.validators.toolchain import ToolVersion
+
+
+# Access the underlying function from the FunctionTool object
+_get_toolchain = get_toolchain.fn
+
+
+class TestGetToolchain:
+    @pytest.mark.asyncio
+    async def test_returns_versions(self):
+        with patch("fastlane_mcp.tools.toolchain.toolchain.versions", new_callable=AsyncMock) as mock:
+            mock.return_value = {"ruby": ToolVersion("ruby", "/usr/bin/ruby", version="3.3.5", raw="ruby 3.3.5")}
+
+            result = await _get_toolchain(["ruby"], refresh=True)
+
+            mock.assert_called_once_with(["ruby"], refresh=True)
+            assert result["tools"]["ruby"]["version"] == "3.3.5"
+            assert result["tools"]["ruby"]["path"] == "/usr/bin/ruby"
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_tool(self):
+        with pytest.raises(ToolError, match="Unknown tool"):
+            await _get_toolchain(["cmake"])
@@ -0,0 +1,201 @@
+"""Tests for running fastlane through a project's bundle."""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from fastlane_mcp.utils.bundler import BundlerResolver, find_gemfile, parse_lockfile
+from fastlane_mcp.utils.executor import ExecutionResult, execute_fastlane
+
+LOCKFILE = '''GEM
+  remote: https://rubygems.org/
+  specs:
+    CFPropertyList (3.0.7)
+    fastlane (2.225.0)
+      CFPropertyList (>= 2.3, < 4.0.0)
+      addressable (>= 2.8, < 3.0.0)
+
+PLATFORMS
+  arm64-darwin-23
+
+DEPENDENCIES
+  fastlane
+
+BUNDLED WITH
+   2.5.16
+'''
+
+
+@pytest.fixture
+def fake_bundle(tmp_path, monkeypatch):
+    """A `bundle` on PATH that logs its calls and fails `check` while ./missing exists."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls"
+    bundle = bin_dir / "bundle"
+    bundle.write_text(
+        f'#!/bin/sh\necho "$1 $BUNDLE_GEMFILE" >> {calls}\n'
+        f'if [ "$1" = check ] && [ -e {tmp_path}/missing ]; then exit 1; fi\n'
+    )
+    bundle.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:/usr/bin:/bin")
+    return calls
+
+
+@pytest.fixture
+def bundled_project(tmp_path):
+    """A React Native style project with the Gemfile at its root."""
+    project = tmp_path / "app"
+    (project / "ios" / "fastlane").mkdir(parents=True)
+    (project / "ios" / "fastlane" / "Fastfile").write_text("lane :build do\nend\n")
+    (project / "Gemfile").write_text('source "https://rubygems.org"\ngem "fastlane"\n')
+    (project / "Gemfile.lock").write_text(LOCKFILE)
+    return project
+
+
+def _calls(calls_file):
+    return calls_file.read_text().splitlines() if calls_file.exists() else []
+
+
+class TestParseLockfile:
+    def test_reads_top_level_specs(self):
+        lockfile = parse_lockfile(LOCKFILE)
+
+        assert lockfile.fastlane_version == "2.225.0"
+        assert lockfile.gems["CFPropertyList"] == "3.0.7"
+        # Dependency constraints are not specs
+        assert "addressable" not in lockfile.gems
+        assert lockfile.bundler_version == "2.5.16"
+
+    def test_lockfile_without_fastlane(self):
+        assert parse_lockfile("GEM\n  specs:\n    rake (13.2.1)\n").fastlane_version is None
+
+
+class TestFindGemfile:
+    def test_walks_up_to_project_root(self, bundled_project):
+        assert find_gemfile(bundled_project / "ios", bundled_project) == (bundled_project / "Gemfile").resolve()
+
+    def test_stops_at_project_root(self, tmp_path):
+        (tmp_path / "Gemfile").write_text("")
+        project = tmp_path / "app"
+        (project / "ios").mkdir(parents=True)
+
+        assert find_gemfile(project / "ios", project) is None
+
+
+class TestBundlerResolver:
+    def test_pins_fastlane(self, bundled_project):
+        assert BundlerResolver().pins_fastlane(bundled_project / "ios", bundled_project)
+
+    def test_unpinned_lockfile_does_not_pin_fastlane(self, bundled_project):
+        (bundled_project / "Gemfile.lock").write_text("GEM\n  specs:\n    rake (13.2.1)\n")
+
+        assert not BundlerResolver().pins_fastlane(bundled_project / "ios", bundled_project)
+
+    @pytest.mark.asyncio
+    async def test_global_without_gemfile(self, tmp_path, fake_bundle):
+        command = await BundlerResolver().resolve(tmp_path)
+
+        assert command.mode == "global"
+        assert command.program == "fastlane"
+
+    @pytest.mark.asyncio
+    async def test_global_when_lock_does_not_pin_fastlane(self, bundled_project, fake_bundle):
+        (bundled_project / "Gemfile.lock").write_text("GEM\n  specs:\n    rake (13.2.1)\n")
+
+        command = await BundlerResolver().resolve(bundled_project / "ios", bundled_project)
+
+        assert command.mode == "global"
+        assert _calls(fake_bundle) == []
+
+    @pytest.mark.asyncio
+    async def test_global_without_bundler(self, bundled_project, monkeypatch, tmp_path):
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        monkeypatch.setenv("PATH", str(empty))
+
+        command = await BundlerResolver().resolve(bundled_project / "ios", bundled_project)
+
+        assert command.mode == "global"
+
+    @pytest.mark.asyncio
+    async def test_bundle_exec(self, bundled_project, fake_bundle):
+        command = await BundlerResolver().resolve(bundled_project / "ios", bundled_project)
+
+        gemfile = str((bundled_project / "Gemfile").resolve())
+        assert command.mode == "bundle exec"
+        assert command.program.endswith("/bundle")
+        assert command.args == ["exec", "fastlane"]
+        assert command.env == {"BUNDLE_GEMFILE": gemfile}
+        assert command.fastlane_version == "2.225.0"
+        assert command.worker_launcher == (command.program, "exec")
+
+    @pytest.mark.asyncio
+    async def test_prefers_binstub_when_bundle_is_satisfied(self, bundled_project, fake_bundle):
+        binstub = bundled_project / "bin" / "fastlane"
+        binstub.parent.mkdir()
+        binstub.write_text('#!/usr/bin/env ruby\nrequire "bundler/setup"\nload Gem.bin_path("fastlane", "fastlane")\n')
+        binstub.chmod(0o755)
+
+        command = await BundlerResolver().resolve(bundled_project / "ios", bundled_project)
+
+        assert command.mode == "binstub"
+        assert command.program == str(binstub.resolve())
+        assert command.args == []
+
+    @pytest.mark.asyncio
+    async def test_ignores_unrelated_bin_fastlane(self, bundled_project, fake_bundle):
+        script = bundled_project / "bin" / "fastlane"
+        script.parent.mkdir()
+        script.write_text("#!/bin/sh\necho hi\n")
+        script.chmod(0o755)
+
+        command = await BundlerResolver().resolve(bundled_project / "ios", bundled_project)
+
+        assert command.mode == "bundle exec"
+
+    @pytest.mark.asyncio
+    async def test_check_is_cached_until_lock_changes(self, bundled_project, fake_bundle):
+        resolver = BundlerResolver()
+
+        await resolver.resolve(bundled_project / "ios", bundled_project)
+        await resolver.resolve(bundled_project / "ios", bundled_project)
+        assert len(_calls(fake_bundle)) == 1
+
+        (bundled_project / "Gemfile.lock").write_text(LOCKFILE.replace("2.225.0", "2.226.0"))
+        command = await resolver.resolve(bundled_project / "ios", bundled_project)
+
+        assert len(_calls(fake_bundle)) == 2
+        assert command.fastlane_version == "2.226.0"
+
+    @pytest.mark.asyncio
+    async def test_failed_check_is_not_cached(self, bundled_project, fake_bundle, tmp_path):
+        resolver = BundlerResolver()
+        (tmp_path / "missing").touch()
+
+        command = await resolver.resolve(bundled_project / "ios", bundled_project)
+        assert command.mode == "bundle exec"
+
+        (tmp_path / "missing").unlink()
+        await resolver.resolve(bundled_project / "ios", bundled_project)
+        await resolver.resolve(bundled_project / "ios", bundled_project)
+
+        assert [call.split()[0] for call in _calls(fake_bundle)] == ["check", "check"]
+
+
+class TestExecuteFastlaneWithBundle:
+    @pytest.mark.asyncio
+    async def test_runs_through_bundle_exec(self, bundled_project, fake_bundle):
+        with patch("fastlane_mcp.utils.executor.execute_command", new_callable=AsyncMock) as mock_exec, \
+                patch("fastlane_mcp.utils.executor.bundler", BundlerResolver()):
+            mock_exec.return_value = ExecutionResult(stdout="", stderr="", exit_code=0)
+
+            await execute_fastlane("build", "ios", bundled_project, env_vars={"KEY": "value"})
+
+        args, kwargs = mock_exec.call_args
+        assert args[0].endswith("/bundle")
+        assert args[1] == ["exec", "fastlane", "build"]
+        assert kwargs["cwd"] == bundled_project / "ios"
+        assert kwargs["env"] == {
+            "BUNDLE_GEMFILE": str((bundled_project / "Gemfile").resolve()),
+            "KEY": "value",
+        }
@@ -1,8 +1,12 @@
 """Tests for command execution."""
 
+import asyncio
+import gc
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from fastlane_mcp.utils.executor import execute_command, ExecutionResult, execute_fastlane
+from fastlane_mcp.utils.logs import LogWriter
 
 
 class TestExecuteCommand:
@@ -27,6 +31,17 @@ class TestExecuteCommand:
         assert result.exit_code == 0
         assert "test_value" in result.stdout
 
+    @pytest.mark.asyncio
+    async def test_resolves_command_on_env_path(self, tmp_path):
+        tool = tmp_path / "mytool"
+        tool.write_text("#!/bin/sh\necho resolved\n")
+        tool.chmod(0o755)
+
+        result = await execute_command("mytool", [], env={"PATH": f"{tmp_path}:/usr/bin:/bin"})
+
+        assert result.exit_code == 0
+        assert "resolved" in result.stdout
+
     @pytest.mark.asyncio
     async def test_failed_command(self):
         result = await execute_command("false", [])
@@ -44,6 +59,94 @@ class TestExecuteCommand:
         assert "error" in result.stderr
 
 
+class TestStreamingOutput:
+    @pytest.mark.asyncio
+    async def test_on_line_receives_lines_as_they_arrive(self):
+        seen = []
+        await execute_command(
+            "sh", ["-c", "echo one; echo two >&2; echo three"],
+            on_line=lambda stream, line: seen.append((stream, line))
+        )
+        assert ("stdout", "one") in seen
+        assert ("stdout", "three") in seen
+        assert ("stderr", "two") in seen
+        stdout_lines = [line for stream, line in seen if stream == "stdout"]
+        assert stdout_lines == ["one", "three"]
+
+    @pytest.mark.asyncio
+    async def test_async_on_line_is_awaited(self):
+        seen = []
+
+        async def collect(stream, line):
+            seen.append(line)
+
+        await execute_command("sh", ["-c", "echo async"], on_line=collect)
+        assert seen == ["async"]
+
+    @pytest.mark.asyncio
+    async def test_tail_bytes_bounds_captured_output(self):
+        result = await execute_command(
+            "sh", ["-c", "for i in $(seq 1 1000); do echo line$i; done"],
+            tail_bytes=100
+        )
+        assert len(result.stdout) <= 100
+        lines = result.stdout.splitlines()
+        assert lines[-1] == "line1000"
+        # The partially overwritten first line is dropped
+        assert all(line.startswith("line") for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_spools_full_output_to_log(self, tmp_path):
+        log = LogWriter("20260101-000000-00000000", tmp_path / "out.log")
+        result = await execute_command(
+            "sh", ["-c", "for i in $(seq 1 1000); do echo line$i; done"],
+            tail_bytes=100,
+            log=log
+        )
+        log.close()
+        assert result.log_id == log.log_id
+        assert (tmp_path / "out.log").read_text().splitlines()[0] == "line1"
+        assert log.size == len((tmp_path / "out.log").read_bytes())
+
+    @pytest.mark.asyncio
+    async def test_splits_overlong_lines(self):
+        seen = []
+        await execute_command(
+            "sh", ["-c", "head -c 200000 /dev/zero | tr '\\0' 'a'"],
+            on_line=lambda stream, line: seen.append(line)
+        )
+        assert sum(len(line) for line in seen) == 200000
+        assert max(len(line) for line in seen) <= 64 * 1024
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_kills_process(self):
+        def explode(stream, line):
+            raise RuntimeError("stop")
+
+        with pytest.raises(RuntimeError):
+            await execute_command("sh", ["-c", "echo go; sleep 10"], on_line=explode, timeout=5)
+
+
+    @pytest.mark.asyncio
+    async def test_cancellation_leaves_no_unretrieved_errors(self):
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            task = asyncio.ensure_future(execute_command("sh", ["-c", "echo go; sleep 10"], timeout=5))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            del task
+            gc.collect()
+            await asyncio.sleep(0)
+        finally:
+            loop.set_exception_handler(None)
+
+        assert errors == []
+
+
 class TestExecuteFastlane:
     @pytest.mark.asyncio
     async def test_executes_in_platform_directory_react_native(self, tmp_path):
@@ -111,7 +214,113 @@ class TestExecuteFastlane:
             call_args = mock_exec.call_args
             assert call_args[1]["env"] == {"KEY": "value"}
 
+    @pytest.mark.asyncio
+    async def test_bounds_output_tail(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        with patch("fastlane_mcp.utils.executor.execute_command") as mock_exec:
+            mock_exec.return_value = ExecutionResult("output", "", 0)
+
+            await execute_fastlane("build", "ios", tmp_path, tail_bytes=50)
+
+            assert mock_exec.call_args[1]["tail_bytes"] == 50
+
+    @pytest.mark.asyncio
+    async def test_spools_log(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        with patch("fastlane_mcp.utils.executor.execute_command") as mock_exec:
+            mock_exec.return_value = ExecutionResult("output", "", 0)
+
+            await execute_fastlane("build", "ios", tmp_path)
+
+            log = mock_exec.call_args[1]["log"]
+            assert log is not None
+            assert log.path.exists()
+
     @pytest.mark.asyncio
     async def test_rejects_invalid_platform(self, tmp_path):
         with pytest.raises(ValueError, match="Invalid platform"):
             await execute_fastlane("build", "windows", tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_reports_queue_wait(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        with patch("fastlane_mcp.utils.executor.execute_command") as mock_exec:
+            mock_exec.return_value = ExecutionResult("output", "", 0)
+
+            result = await execute_fastlane("build", "ios", tmp_path)
+
+            assert result.queue_wait >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_concurrent_runs(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        async def slow_exec(command, args, **kwargs):
+            await kwargs["on_line"]("stdout", "building")
+            await asyncio.sleep(0.05)
+            return ExecutionResult("output", "", 0)
+
+        seen = []
+        with patch("fastlane_mcp.utils.executor.execute_command", side_effect=slow_exec) as mock_exec:
+            first, second = await asyncio.gather(
+                execute_fastlane("build", "ios", tmp_path, env_vars={"A": "1"}),
+                execute_fastlane(
+                    "build", "ios", tmp_path, env_vars={"A": "1"},
+                    on_line=lambda stream, line: seen.append(line)
+                ),
+            )
+
+            assert mock_exec.call_count == 1
+            assert first is second
+            assert seen == ["building"]
+
+    @pytest.mark.asyncio
+    async def test_does_not_deduplicate_different_env(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        async def slow_exec(command, args, **kwargs):
+            await asyncio.sleep(0.01)
+            return ExecutionResult("output", "", 0)
+
+        with patch("fastlane_mcp.utils.executor.execute_command", side_effect=slow_exec) as mock_exec:
+            await asyncio.gather(
+                execute_fastlane("build", "android", tmp_path, env_vars={"A": "1"}),
+                execute_fastlane("build", "android", tmp_path, env_vars={"A": "2"}),
+            )
+
+            assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_stops_unshared_run(self, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+        finished = []
+
+        async def slow_exec(command, args, **kwargs):
+            await kwargs["on_line"]("stdout", "building")
+            await asyncio.sleep(10)
+            finished.append(True)
+            return ExecutionResult("output", "", 0)
+
+        def fail(stream, line):
+            raise RuntimeError("listener failed")
+
+        with patch("fastlane_mcp.utils.executor.execute_command", side_effect=slow_exec):
+            with pytest.raises(RuntimeError, match="listener failed"):
+                await asyncio.wait_for(execute_fastlane("build", "ios", tmp_path, on_line=fail), timeout=5)
+
+        assert finished == []
@@ -0,0 +1,95 @@
+"""Tests for background build jobs."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from fastlane_mcp.utils.executor import ExecutionResult
+from fastlane_mcp.utils.jobs import JobManager, JobStatus
+from fastlane_mcp.utils.logs import open_log
+
+
+def _fake_execute(lines, exit_code=0, hold=0.0):
+    """Build a stand-in for execute_fastlane that writes lines to a log."""
+    async def fake(lane, platform, project_path, env_vars, on_line, on_start, **kwargs):
+        log = open_log()
+        on_start(log)
+        try:
+            for line in lines:
+                log.write(f"{line}\n".encode())
+                on_line("stdout", line)
+                await asyncio.sleep(0)
+            await asyncio.sleep(hold)
+        finally:
+            log.close()
+        return ExecutionResult("\n".join(lines), "", exit_code, log_id=log.log_id)
+    return fake
+
+
+class TestJobManager:
+    @pytest.mark.asyncio
+    async def test_start_returns_immediately(self, tmp_path):
+        manager = JobManager()
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute(["a"], hold=0.05)):
+            job = manager.start("build", "ios", tmp_path)
+            assert job.status == JobStatus.QUEUED
+            await job.task
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.lines == 1
+        assert job.last_line == "a"
+        assert manager.get(job.job_id) is job
+
+    @pytest.mark.asyncio
+    async def test_failed_exit_code(self, tmp_path):
+        manager = JobManager()
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute(["x"], exit_code=1)):
+            job = manager.start("build", "ios", tmp_path)
+            await job.task
+
+        assert job.status == JobStatus.FAILED
+        assert job.result.exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_read_output_is_incremental(self, tmp_path):
+        manager = JobManager()
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute(["one", "two"])):
+            job = manager.start("build", "ios", tmp_path)
+            await job.task
+
+        first = job.read_output(0, 4)
+        assert first.data == "one\n"
+        rest = job.read_output(first.next_offset)
+        assert rest.data == "two\n"
+        assert rest.eof
+
+    @pytest.mark.asyncio
+    async def test_read_output_before_start(self, tmp_path):
+        manager = JobManager()
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute([])):
+            job = manager.start("build", "ios", tmp_path)
+            assert job.read_output() is None
+            await job.task
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, tmp_path):
+        manager = JobManager()
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute(["a"], hold=10)):
+            job = manager.start("build", "ios", tmp_path)
+            await asyncio.sleep(0.01)
+            await manager.cancel(job.job_id)
+
+        assert job.status == JobStatus.CANCELLED
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_cancel_unknown_job(self):
+        assert await JobManager().cancel("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest_finished_jobs(self, tmp_path):
+        manager = JobManager(max_finished=2)
+        with patch("fastlane_mcp.utils.jobs.execute_fastlane", side_effect=_fake_execute([])):
+            for _ in range(4):
+                await manager.start("build", "ios", tmp_path).task
+        assert len(manager.list()) <= 3
@@ -0,0 +1,75 @@
+"""Tests for output tails and log spooling."""
+
+import pytest
+from fastlane_mcp.utils.logs import RingBuffer, open_log, read_log, log_path
+
+
+class TestRingBuffer:
+    def test_keeps_everything_under_capacity(self):
+        buf = RingBuffer(10)
+        buf.write(b"abc")
+        buf.write(b"def")
+        assert buf.getvalue() == b"abcdef"
+        assert buf.truncated is False
+
+    def test_keeps_most_recent_bytes_when_full(self):
+        buf = RingBuffer(5)
+        buf.write(b"abcd")
+        buf.write(b"efgh")
+        assert buf.getvalue() == b"defgh"
+        assert buf.truncated is True
+        assert buf.total_written == 8
+
+    def test_write_larger_than_capacity(self):
+        buf = RingBuffer(4)
+        buf.write(b"x")
+        buf.write(b"0123456789")
+        assert buf.getvalue() == b"6789"
+
+    def test_exact_capacity_wraps(self):
+        buf = RingBuffer(4)
+        buf.write(b"ab")
+        buf.write(b"cd")
+        assert buf.getvalue() == b"abcd"
+        buf.write(b"e")
+        assert buf.getvalue() == b"bcde"
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestLogSpool:
+    def test_write_and_read_range(self):
+        log = open_log()
+        log.write(b"hello\nworld\n")
+        log.close()
+
+        chunk = read_log(log.log_id, offset=6, length=5)
+        assert chunk.data == "world"
+        assert chunk.next_offset == 11
+        assert chunk.size == 12
+        assert chunk.eof is False
+
+    def test_negative_offset_reads_from_end(self):
+        log = open_log()
+        log.write(b"0123456789")
+        log.close()
+
+        chunk = read_log(log.log_id, offset=-3)
+        assert chunk.data == "789"
+        assert chunk.eof is True
+
+    def test_rejects_malformed_log_id(self):
+        with pytest.raises(ValueError):
+            read_log("../../etc/passwd")
+
+    def test_missing_log(self):
+        with pytest.raises(FileNotFoundError):
+            log_path("20260101-000000-deadbeef")
+
+    def test_rotates_old_logs(self, isolated_log_dir, monkeypatch):
+        monkeypatch.setenv("FASTLANE_MCP_MAX_LOGS", "3")
+        for _ in range(5):
+            open_log().close()
+        assert len(list(isolated_log_dir.glob("*.log"))) == 3
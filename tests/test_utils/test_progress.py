@@ -0,0 +1,30 @@
+"""Tests for fastlane step tracking."""
+
+from fastlane_mcp.utils.progress import StepTracker
+
+
+class TestStepTracker:
+    def test_detects_step_banners(self):
+        tracker = StepTracker()
+        assert tracker.feed("[14:02:19]: ------------------------------") is None
+        event = tracker.feed("[14:02:19]: --- Step: default_platform ---")
+        assert event.index == 1
+        assert event.name == "default_platform"
+
+        event = tracker.feed("[14:02:20]: --- Step: gym ---")
+        assert event.index == 2
+        assert event.name == "gym"
+        assert "Step 2: gym" in event.message
+
+    def test_detects_numbered_step_markers(self):
+        tracker = StepTracker()
+        event = tracker.feed("[step: 3] build_app")
+        assert event.index == 3
+        assert event.name == "build_app"
+        assert tracker.current == "build_app"
+
+    def test_ignores_ordinary_lines(self):
+        tracker = StepTracker()
+        assert tracker.feed("CompileSwift normal arm64 File.swift") is None
+        assert tracker.feed("Next step: archive") is None
+        assert tracker.index == 0
@@ -0,0 +1,75 @@
+"""Tests for the PATH tool resolver."""
+
+import os
+from unittest.mock import patch
+
+from fastlane_mcp.utils.resolver import ToolResolver
+
+
+def _install(directory, name, mode=0o755):
+    directory.mkdir(parents=True, exist_ok=True)
+    tool = directory / name
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(mode)
+    return tool
+
+
+class TestToolResolver:
+    def test_resolves_first_match_on_path(self, tmp_path):
+        first = _install(tmp_path / "a", "fastlane")
+        _install(tmp_path / "b", "fastlane")
+        path = os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])
+
+        assert ToolResolver().resolve("fastlane", path) == str(first)
+
+    def test_skips_non_executable_files(self, tmp_path):
+        _install(tmp_path / "a", "fastlane", mode=0o644)
+        second = _install(tmp_path / "b", "fastlane")
+        path = os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])
+
+        assert ToolResolver().resolve("fastlane", path) == str(second)
+
+    def test_missing_tool_and_directory(self, tmp_path):
+        path = os.pathsep.join([str(tmp_path / "missing"), str(tmp_path)])
+
+        assert ToolResolver().resolve("fastlane", path) is None
+
+    def test_resolve_all_lists_each_directory_once(self, tmp_path):
+        _install(tmp_path / "a", "ruby")
+        _install(tmp_path / "b", "pod")
+        path = os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])
+        resolver = ToolResolver()
+
+        with patch("fastlane_mcp.utils.resolver.os.listdir", wraps=os.listdir) as listdir:
+            resolved = resolver.resolve_all(["ruby", "pod", "gradle"], path)
+
+        assert resolved == {
+            "ruby": str(tmp_path / "a" / "ruby"),
+            "pod": str(tmp_path / "b" / "pod"),
+            "gradle": None,
+        }
+        assert listdir.call_count == 2
+
+    def test_results_cached_within_ttl(self, tmp_path):
+        _install(tmp_path, "fastlane")
+        resolver = ToolResolver(ttl=60)
+        resolver.resolve("fastlane", str(tmp_path))
+
+        with patch("fastlane_mcp.utils.resolver.os.stat") as stat:
+            assert resolver.resolve("fastlane", str(tmp_path)) == str(tmp_path / "fastlane")
+            stat.assert_not_called()
+
+    def test_listing_refreshed_when_directory_changes(self, tmp_path):
+        resolver = ToolResolver(ttl=0)
+        assert resolver.resolve("fastlane", str(tmp_path)) is None
+
+        _install(tmp_path, "fastlane")
+        os.utime(tmp_path, ns=(1, 1))
+
+        assert resolver.resolve("fastlane", str(tmp_path)) == str(tmp_path / "fastlane")
+
+    def test_paths_with_slash_are_not_searched(self, tmp_path):
+        tool = _install(tmp_path, "fastlane")
+
+        assert ToolResolver().resolve(str(tool), "") == str(tool)
+        assert ToolResolver().resolve(str(tmp_path / "nope"), "") is None
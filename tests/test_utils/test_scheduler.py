@@ -0,0 +1,106 @@
+"""Tests for the build scheduler."""
+
+import asyncio
+
+import pytest
+from fastlane_mcp.utils.scheduler import BuildScheduler
+
+
+async def _run_builds(scheduler, builds, hold=0.05):
+    """Run (platform, project) builds concurrently, returning peak concurrency."""
+    running = 0
+    peak = 0
+
+    async def build(platform, project):
+        nonlocal running, peak
+        async with scheduler.slot(platform, project):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(hold)
+            running -= 1
+
+    await asyncio.gather(*(build(p, proj) for p, proj in builds))
+    return peak
+
+
+class TestBuildScheduler:
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_builds_per_platform(self):
+        scheduler = BuildScheduler({"ios": 2}, project_limit=10)
+        peak = await _run_builds(scheduler, [("ios", f"/app{i}") for i in range(5)])
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_builds_per_project(self):
+        scheduler = BuildScheduler({"ios": 5, "android": 5}, project_limit=1)
+        peak = await _run_builds(scheduler, [("ios", "/app"), ("android", "/app")])
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_platforms_are_independent(self):
+        scheduler = BuildScheduler({"ios": 1, "android": 1}, project_limit=10)
+        peak = await _run_builds(scheduler, [("ios", "/a"), ("android", "/b")])
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_queue_depth_and_wait(self):
+        scheduler = BuildScheduler({"ios": 1}, project_limit=10)
+        first_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def first():
+            async with scheduler.slot("ios", "/a"):
+                first_started.set()
+                await release.wait()
+
+        async def second():
+            async with scheduler.slot("ios", "/b") as waited:
+                return waited
+
+        t1 = asyncio.create_task(first())
+        await first_started.wait()
+        t2 = asyncio.create_task(second())
+        await asyncio.sleep(0.05)
+
+        stats = scheduler.stats()["platforms"]["ios"]
+        assert stats["running"] == 1
+        assert stats["queued"] == 1
+
+        release.set()
+        await t1
+        waited = await t2
+        assert waited >= 0.04
+
+        stats = scheduler.stats()
+        assert stats["platforms"]["ios"]["completed"] == 2
+        assert stats["platforms"]["ios"]["max_wait_seconds"] >= 0.04
+        # Idle projects are dropped
+        assert stats["projects"] == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = BuildScheduler({"ios": 1}, project_limit=10)
+        release = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot("ios", "/a"):
+                await release.wait()
+
+        t1 = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(holder())
+        await asyncio.sleep(0.01)
+        t2.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t2
+
+        assert scheduler.stats()["platforms"]["ios"]["queued"] == 0
+        release.set()
+        await t1
+        assert scheduler.stats()["platforms"]["ios"]["running"] == 0
+
+    def test_configure_keeps_unspecified_limits(self):
+        scheduler = BuildScheduler({"ios": 3, "android": 4})
+        scheduler.configure({"ios": 1})
+        limits = {name: s["limit"] for name, s in scheduler.stats()["platforms"].items()}
+        assert limits == {"ios": 1, "android": 4}
@@ -0,0 +1,154 @@
+"""Tests for build log segmentation."""
+
+import pytest
+
+from fastlane_mcp.utils.logs import open_log, read_log
+from fastlane_mcp.utils.segments import LogIndex, LogIndexCache, failed_segments, most_specific
+
+XCODE_LOG = """[10:00:00]: --- Step: cocoapods ---
+[10:00:01]: Pod installation complete!
+[10:00:02]: --- Step: gym ---
+=== BUILD TARGET Pods OF PROJECT Pods WITH CONFIGURATION Release ===
+CompileC /tmp/Pods.o /src/Pods.m normal arm64 objective-c (in target 'Pods' from project 'Pods')
+    cd /src
+    clang -c /src/Pods.m
+=== BUILD TARGET App OF PROJECT App WITH CONFIGURATION Release ===
+CompileSwift normal arm64 /src/App/View.swift (in target 'App' from project 'App')
+    cd /src
+    swift-frontend -c /src/App/View.swift
+/src/App/View.swift:12:5: error: cannot find 'foo' in scope
+CompileSwift normal arm64 /src/App/Model.swift (in target 'App' from project 'App')
+    swift-frontend -c /src/App/Model.swift
+** BUILD FAILED **
+
+The following build commands failed:
+\tCompileSwift normal arm64 /src/App/Model.swift (in target 'App' from project 'App')
+(1 failure)
+[10:05:00]: Exit status: 65
+"""
+
+GRADLE_LOG = """[10:00:00]: --- Step: gradle ---
+[10:00:01]: ▸ > Task :app:preBuild UP-TO-DATE
+[10:00:02]: ▸ > Task :app:compileReleaseKotlin FAILED
+[10:00:02]: ▸ e: file:///src/app/Main.kt:3:5 Unresolved reference: foo
+[10:00:03]: ▸ FAILURE: Build failed with an exception.
+[10:00:03]: ▸ BUILD FAILED in 12s
+"""
+
+
+def _write_log(text: str) -> str:
+    log = open_log()
+    log.write(text.encode())
+    log.close()
+    return log.log_id
+
+
+def _segment_text(log_id: str, segment) -> str:
+    return read_log(log_id, segment.start, segment.end - segment.start).data
+
+
+class TestLogIndex:
+    def test_segments_xcodebuild_output(self):
+        log_id = _write_log(XCODE_LOG)
+        index = LogIndex(log_id)
+        index.update()
+
+        assert [(s.kind, s.name) for s in index.segments] == [
+            ("step", "cocoapods"),
+            ("step", "gym"),
+            ("target", "Pods"),
+            ("phase", "CompileC"),
+            ("target", "App"),
+            ("phase", "CompileSwift"),
+            ("phase", "CompileSwift"),
+        ]
+        view, model = index.segments[5], index.segments[6]
+        assert view.target == "App"
+        assert view.parent == 1
+        assert view.errors == 1 and view.failed
+        # Failed via xcodebuild's summary, without an error line of its own
+        assert model.failed and model.errors == 0
+        assert not index.segments[3].failed
+
+    def test_segment_offsets_cover_their_lines(self):
+        log_id = _write_log(XCODE_LOG)
+        index = LogIndex(log_id)
+        index.update()
+
+        view = index.segments[5]
+        text = _segment_text(log_id, view)
+
+        assert text.startswith("CompileSwift normal arm64 /src/App/View.swift")
+        assert text.endswith("error: cannot find 'foo' in scope\n")
+
+    def test_segments_gradle_output(self):
+        log_id = _write_log(GRADLE_LOG)
+        index = LogIndex(log_id)
+        index.update()
+
+        tasks = index.select(kind="task")
+        assert [t.name for t in tasks] == [":app:preBuild", ":app:compileReleaseKotlin"]
+        assert not tasks[0].failed
+        assert tasks[1].failed and tasks[1].errors == 1
+        assert "FAILURE" not in _segment_text(log_id, tasks[1])
+
+    def test_incremental_update(self):
+        log = open_log()
+        lines = XCODE_LOG.splitlines(keepends=True)
+        log.write("".join(lines[:6]).encode())
+        # An unfinished line is left for the next update
+        log.write(b"CompileSwift normal arm64 /src/App/View.swift (in target")
+        log.flush()
+        index = LogIndex(log.log_id)
+        index.update()
+        assert len(index.segments) == 4
+
+        log.write(b" 'App' from project 'App')\n")
+        log.close()
+        index.update()
+
+        assert index.segments[-1].detail.startswith("CompileSwift normal arm64 /src/App/View.swift")
+
+    def test_select_filters(self):
+        log_id = _write_log(XCODE_LOG)
+        index = LogIndex(log_id)
+        index.update()
+
+        assert [s.index for s in index.select(name="model.swift")] == [6]
+        assert [s.kind for s in most_specific(index.select(failed_only=True))] == [
+            "phase", "phase", "target", "step",
+        ]
+
+
+class TestLogIndexCache:
+    def test_reuses_and_extends_index(self):
+        log = open_log()
+        log.write(b"--- Step: gym ---\n")
+        log.flush()
+        cache = LogIndexCache()
+
+        first = cache.get(log.log_id)
+        log.write(b"--- Step: pilot ---\n")
+        log.close()
+        second = cache.get(log.log_id)
+
+        assert first is second
+        assert [s.name for s in second.segments] == ["gym", "pilot"]
+
+    def test_unknown_log(self):
+        with pytest.raises(FileNotFoundError):
+            LogIndexCache().get("20260101-000000-deadbeef")
+
+
+class TestFailedSegments:
+    def test_lists_most_specific_first(self):
+        log_id = _write_log(XCODE_LOG)
+
+        segments = failed_segments(log_id)
+
+        assert [s["kind"] for s in segments][:2] == ["phase", "phase"]
+        assert segments[0]["detail"].startswith("CompileSwift normal arm64 /src/App/View.swift")
+
+    def test_missing_log(self):
+        assert failed_segments(None) == []
+        assert failed_segments("20260101-000000-deadbeef") == []
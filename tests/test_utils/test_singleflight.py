@@ -0,0 +1,119 @@
+"""Tests for single-flight deduplication."""
+
+import asyncio
+
+import pytest
+from fastlane_mcp.utils.singleflight import SingleFlight, source_fingerprint
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return object()
+
+        a, b = await asyncio.gather(flight.do("k", work), flight.do("k", work))
+        assert calls == 1
+        assert a is b
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+
+        await flight.do("k", work)
+        await flight.do("k", work)
+        assert calls == 2
+        assert not flight.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_shared_run(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+
+    @pytest.mark.asyncio
+    async def test_cancelling_all_callers_cancels_run(self):
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
+class TestSourceFingerprint:
+    def test_stable_when_nothing_changes(self, tmp_path):
+        (tmp_path / "fastlane").mkdir()
+        (tmp_path / "fastlane" / "Fastfile").write_text("lane :build do\nend")
+        assert source_fingerprint(tmp_path) == source_fingerprint(tmp_path)
+
+    def test_changes_when_fastfile_changes(self, tmp_path):
+        (tmp_path / "fastlane").mkdir()
+        fastfile = tmp_path / "fastlane" / "Fastfile"
+        fastfile.write_text("lane :build do\nend")
+        before = source_fingerprint(tmp_path)
+        fastfile.write_text("lane :build do\n  gym\nend")
+        assert source_fingerprint(tmp_path) != before
+
+    def test_changes_when_git_head_moves(self, tmp_path):
+        git = tmp_path / ".git"
+        (git / "refs" / "heads").mkdir(parents=True)
+        (git / "HEAD").write_text("ref: refs/heads/main\n")
+        (git / "refs" / "heads" / "main").write_text("a" * 40)
+        before = source_fingerprint(tmp_path)
+        (git / "refs" / "heads" / "main").write_text("b" * 40)
+        assert source_fingerprint(tmp_path) != before
@@ -0,0 +1,161 @@
+"""Tests for the warm fastlane worker pool."""
+
+import asyncio
+import os
+import signal
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from fastlane_mcp.utils.executor import execute_fastlane
+from fastlane_mcp.utils.workers import WorkerPool
+
+# Speaks the worker protocol without needing Ruby or fastlane
+FAKE_WORKER = r'''
+import json, os, sys, time
+print("__FASTLANE_MCP__ ready", flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["op"] == "ping":
+        print("__FASTLANE_MCP__ pong", flush=True)
+    elif request["op"] == "run":
+        lane = request["lane"]
+        if lane == "crash":
+            sys.exit(3)
+        if lane == "hang":
+            time.sleep(60)
+        print(f"running {lane} pid={os.getpid()} env={request['env'].get('FASTLANE_ENV', '')}", flush=True)
+        print(f"warning from {lane}", file=sys.stderr, flush=True)
+        code = 1 if lane == "fail" else 0
+        print(f"__FASTLANE_MCP__ done {code}", file=sys.stderr, flush=True)
+        print(f"__FASTLANE_MCP__ done {code}", flush=True)
+'''
+
+
+def _pid(result):
+    return result.stdout.split("pid=")[1].split()[0]
+
+
+@pytest.fixture
+async def pool():
+    pool = WorkerPool(max_workers=1, command=(sys.executable, "-c", FAKE_WORKER))
+    yield pool
+    await pool.close()
+
+
+class TestWorkerPool:
+    @pytest.mark.asyncio
+    async def test_disabled_pool_declines(self, tmp_path):
+        assert await WorkerPool(max_workers=0).run(tmp_path, "build") is None
+
+    @pytest.mark.asyncio
+    async def test_runs_lane_and_streams_output(self, pool, tmp_path):
+        lines = []
+
+        result = await pool.run(
+            tmp_path, "build", {"FASTLANE_ENV": "release"},
+            on_line=lambda stream, line: lines.append((stream, line)),
+        )
+
+        assert result.exit_code == 0
+        assert "running build" in result.stdout
+        assert "env=release" in result.stdout
+        assert result.stderr == "warning from build\n"
+        assert ("stderr", "warning from build") in lines
+
+    @pytest.mark.asyncio
+    async def test_reuses_worker(self, pool, tmp_path):
+        first = await pool.run(tmp_path, "build")
+        second = await pool.run(tmp_path, "test")
+
+        assert _pid(first) == _pid(second)
+        assert pool.stats() == {str(tmp_path): {"idle": 1, "busy": 0, "booting": 0}}
+
+    @pytest.mark.asyncio
+    async def test_reports_lane_failure_and_keeps_worker(self, pool, tmp_path):
+        failed = await pool.run(tmp_path, "fail")
+        after = await pool.run(tmp_path, "build")
+
+        assert failed.exit_code == 1
+        assert _pid(failed) == _pid(after)
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_uses(self, tmp_path):
+        pool = WorkerPool(max_workers=1, command=(sys.executable, "-c", FAKE_WORKER), max_uses=2)
+        try:
+            pids = [_pid(await pool.run(tmp_path, "build")) for _ in range(3)]
+        finally:
+            await pool.close()
+
+        assert pids[0] == pids[1] != pids[2]
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_is_replaced(self, pool, tmp_path):
+        crashed = await pool.run(tmp_path, "crash")
+        # Let the background replacement finish booting
+        await asyncio.gather(*pool._tasks)
+        after = await pool.run(tmp_path, "build")
+
+        assert crashed.exit_code == 1
+        assert "exited during the lane" in crashed.stderr
+        assert after.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker(self, pool, tmp_path):
+        result = await pool.run(tmp_path, "hang", timeout=1)
+
+        assert result.exit_code == 124
+        assert "timed out" in result.stderr
+
+    @pytest.mark.asyncio
+    async def test_dead_idle_worker_is_not_reused(self, pool, tmp_path):
+        first = await pool.run(tmp_path, "build")
+        os.kill(int(_pid(first)), signal.SIGKILL)
+        await asyncio.sleep(0.1)
+
+        second = await pool.run(tmp_path, "build")
+
+        assert second.exit_code == 0
+        assert _pid(second) != _pid(first)
+
+    @pytest.mark.asyncio
+    async def test_stale_worker_is_health_checked(self, pool, tmp_path):
+        await pool.run(tmp_path, "build")
+        worker = pool._idle[str(tmp_path)][0]
+        worker.last_used -= 3600
+
+        with patch.object(worker, "ping", wraps=worker.ping) as ping:
+            await pool.run(tmp_path, "build")
+            ping.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_evicts_idle_workers(self, pool, tmp_path):
+        await pool.run(tmp_path, "build")
+        pool.idle_timeout = 0
+
+        await pool.evict_idle()
+
+        assert pool.stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_boot_failure_falls_back(self, tmp_path):
+        pool = WorkerPool(max_workers=1, command=(sys.executable, "-c", "import sys; sys.exit(1)"))
+        try:
+            assert await pool.run(tmp_path, "build") is None
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_execute_fastlane_uses_warm_worker(self, pool, tmp_path):
+        fastlane_dir = tmp_path / "fastlane"
+        fastlane_dir.mkdir()
+        (fastlane_dir / "Fastfile").write_text("lane :build do\nend")
+
+        with patch("fastlane_mcp.utils.executor.worker_pool", pool), \
+             patch("fastlane_mcp.utils.executor.execute_command") as mock_exec:
+            result = await execute_fastlane("build", "ios", tmp_path)
+
+        mock_exec.assert_not_called()
+        assert "running build" in result.stdout
+        assert result.log_id is not None
@@ -0,0 +1,106 @@
+"""Tests for the pre-flight result cache."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+from fastlane_mcp.validators import (
+    PreflightCache,
+    PreflightContext,
+    IssueLevel,
+    ValidationResult,
+    preflight_key,
+    run_preflight,
+)
+from fastlane_mcp.validators.types import ValidationIssue
+
+
+def _ctx(project, **kwargs):
+    return PreflightContext(project_path=str(project), platform="ios", lane="build", **kwargs)
+
+
+class TestPreflightKey:
+    def test_stable_for_unchanged_project(self, ios_project):
+        assert preflight_key(_ctx(ios_project)) == preflight_key(_ctx(ios_project))
+
+    def test_changes_with_fastfile(self, ios_project):
+        before = preflight_key(_ctx(ios_project))
+        os.utime(ios_project / "ios" / "fastlane" / "Fastfile", ns=(1, 1))
+        assert preflight_key(_ctx(ios_project)) != before
+
+    def test_changes_with_path(self, ios_project, monkeypatch):
+        before = preflight_key(_ctx(ios_project))
+        monkeypatch.setenv("PATH", "/somewhere/else")
+        assert preflight_key(_ctx(ios_project)) != before
+
+    def test_changes_when_required_env_var_set(self, ios_project, monkeypatch):
+        monkeypatch.delenv("MATCH_PASSWORD", raising=False)
+        before = preflight_key(_ctx(ios_project, required_env_vars=["MATCH_PASSWORD"]))
+        monkeypatch.setenv("MATCH_PASSWORD", "secret")
+        assert preflight_key(_ctx(ios_project, required_env_vars=["MATCH_PASSWORD"])) != before
+
+
+class TestPreflightCache:
+    def test_returns_fresh_valid_result_marked_cached(self):
+        cache = PreflightCache(ttl=60)
+        cache.put(("k",), ValidationResult(valid=True))
+
+        result = cache.get(("k",))
+
+        assert result.valid is True
+        assert result.cached is True
+
+    def test_does_not_store_invalid_results(self):
+        cache = PreflightCache(ttl=60)
+        cache.put(("k",), ValidationResult(valid=False, issues=[
+            ValidationIssue(IssueLevel.ERROR, "E1", "broken")
+        ]))
+
+        assert cache.get(("k",)) is None
+
+    def test_entries_expire(self):
+        cache = PreflightCache(ttl=60)
+        cache.put(("k",), ValidationResult(valid=True))
+
+        with patch("fastlane_mcp.validators.cache.time.monotonic", return_value=1e12):
+            assert cache.get(("k",)) is None
+
+
+class TestRunPreflightCaching:
+    @pytest.mark.asyncio
+    async def test_second_run_uses_cache(self, ios_project):
+        with patch("fastlane_mcp.validators.validate_project") as mock:
+            mock.return_value = []
+            first = await run_preflight(_ctx(ios_project), use_cache=True)
+            second = await run_preflight(_ctx(ios_project), use_cache=True)
+
+        assert mock.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+
+    @pytest.mark.asyncio
+    async def test_timed_out_run_is_not_cached(self, ios_project):
+        import asyncio
+
+        async def slow_failure(*args):
+            await asyncio.sleep(1)
+            return [ValidationIssue(IssueLevel.ERROR, "PROJECT_BROKEN", "broken")]
+
+        with patch("fastlane_mcp.validators.validate_project", side_effect=slow_failure) as mock:
+            first = await run_preflight(_ctx(ios_project, validator_timeout=0.05), use_cache=True)
+            second = await run_preflight(_ctx(ios_project, validator_timeout=0.05), use_cache=True)
+
+        assert first.valid is True
+        assert [i.code for i in first.issues] == ["VALIDATOR_TIMEOUT"]
+        assert second.cached is False
+        assert mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_by_default(self, ios_project):
+        with patch("fastlane_mcp.validators.validate_project") as mock:
+            mock.return_value = []
+            await run_preflight(_ctx(ios_project), use_cache=True)
+            await run_preflight(_ctx(ios_project))
+
+        assert mock.call_count == 2
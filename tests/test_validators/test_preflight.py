@@ -92,3 +92,78 @@ class TestRunPreflight:
 
             assert result.valid is True
             assert len(result.issues) == 1
+
+    @pytest.mark.asyncio
+    async def test_runs_validators_concurrently(self):
+        import asyncio
+
+        async def slow(*args):
+            await asyncio.sleep(0.2)
+            return []
+
+        with patch("fastlane_mcp.validators.validate_tools", side_effect=slow), \
+             patch("fastlane_mcp.validators.validate_project", side_effect=slow):
+            ctx = PreflightContext(project_path="/tmp/test", required_tools=["tool"])
+            start = asyncio.get_running_loop().time()
+            result = await run_preflight(ctx)
+            elapsed = asyncio.get_running_loop().time() - start
+
+        assert result.valid is True
+        assert elapsed < 0.35
+        assert set(result.timings) == {"tools", "project"}
+        assert result.timings["tools"] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_slow_validator_times_out_as_warning(self):
+        import asyncio
+
+        async def hang(*args):
+            await asyncio.sleep(10)
+
+        with patch("fastlane_mcp.validators.validate_project", side_effect=hang):
+            ctx = PreflightContext(project_path="/tmp/test", validator_timeout=0.05)
+            result = await run_preflight(ctx)
+
+        assert result.valid is True
+        assert [i.code for i in result.issues] == ["VALIDATOR_TIMEOUT"]
+        assert result.issues[0].level == IssueLevel.WARNING
+        assert result.timings["project"] < 1
+
+    @pytest.mark.asyncio
+    async def test_blocking_lookups_do_not_hold_the_event_loop(self):
+        import threading
+
+        release = threading.Event()
+
+        def blocked(*args):
+            release.wait(5)
+            return {}
+
+        try:
+            with patch("fastlane_mcp.validators.tools.tool_resolver.resolve_all", side_effect=blocked), \
+                 patch("fastlane_mcp.validators.project.find_fastlane_dir", side_effect=blocked):
+                ctx = PreflightContext(
+                    project_path="/tmp/test", required_tools=["tool"], validator_timeout=0.05
+                )
+                result = await run_preflight(ctx)
+        finally:
+            release.set()
+
+        assert [i.code for i in result.issues] == ["VALIDATOR_TIMEOUT", "VALIDATOR_TIMEOUT"]
+        assert result.timings["tools"] < 1
+        assert result.timings["project"] < 1
+
+    @pytest.mark.asyncio
+    async def test_preserves_issue_order(self):
+        from fastlane_mcp.validators.types import ValidationIssue
+        with patch("fastlane_mcp.validators.validate_environment") as mock_env, \
+             patch("fastlane_mcp.validators.validate_tools") as mock_tools:
+            mock_env.return_value = [ValidationIssue(IssueLevel.ERROR, "ENV", "env")]
+            mock_tools.return_value = [ValidationIssue(IssueLevel.ERROR, "TOOL", "tool")]
+
+            result = await run_preflight(PreflightContext(
+                required_env_vars=["VAR"],
+                required_tools=["tool"]
+            ))
+
+        assert [i.code for i in result.issues] == ["ENV", "TOOL"]
@@ -54,3 +54,15 @@ class TestValidateProject:
 
         issues = await validate_project(str(tmp_path), None, "shared")
         assert len(issues) == 0
+
+    @pytest.mark.asyncio
+    async def test_finds_lane_in_imported_fastfile(self, tmp_path):
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        (shared_dir / "Fastfile").write_text("lane :lint do\nend")
+        ios_dir = tmp_path / "ios" / "fastlane"
+        ios_dir.mkdir(parents=True)
+        (ios_dir / "Fastfile").write_text('import "../../shared/Fastfile"\n')
+
+        issues = await validate_project(str(tmp_path), "ios", "lint")
+        assert len(issues) == 0
@@ -0,0 +1,97 @@
+"""Tests for the toolchain version inventory."""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from fastlane_mcp.validators.toolchain import ToolchainInventory
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch):
+    """A PATH with fake ruby and java that count their invocations."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls"
+    (bin_dir / "ruby").write_text(f'#!/bin/sh\necho ruby >> {calls}\necho "ruby 3.3.5 (2024-09-03) [arm64-darwin23]"\n')
+    (bin_dir / "java").write_text(f'#!/bin/sh\necho java >> {calls}\necho \'openjdk version "17.0.12" 2024-07-16\' >&2\n')
+    (bin_dir / "xcodebuild").write_text('#!/bin/sh\necho "xcode-select: error: tool requires Xcode" >&2\nexit 1\n')
+    for tool in bin_dir.iterdir():
+        tool.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:/usr/bin:/bin")
+    return calls
+
+
+def _calls(calls_file):
+    return calls_file.read_text().split() if calls_file.exists() else []
+
+
+class TestToolchainInventory:
+    @pytest.mark.asyncio
+    async def test_probes_versions(self, fake_tools, tmp_path):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+
+        versions = await inventory.versions(["ruby", "java", "gradle"])
+
+        assert versions["ruby"].version == "3.3.5"
+        assert versions["java"].version == "17.0.12"
+        assert versions["gradle"].version is None
+        assert "not found" in versions["gradle"].error
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reports_error(self, fake_tools, tmp_path):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+
+        versions = await inventory.versions(["xcodebuild"])
+
+        assert versions["xcodebuild"].version is None
+        assert "requires Xcode" in versions["xcodebuild"].error
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_does_not_probe(self, fake_tools, tmp_path):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+        await inventory.versions(["ruby"])
+        await inventory.versions(["ruby"])
+
+        assert _calls(fake_tools) == ["ruby"]
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_restart(self, fake_tools, tmp_path):
+        await ToolchainInventory(tmp_path / "cache.json").versions(["ruby"])
+
+        versions = await ToolchainInventory(tmp_path / "cache.json").versions(["ruby"])
+
+        assert versions["ruby"].version == "3.3.5"
+        assert _calls(fake_tools) == ["ruby"]
+        assert json.loads((tmp_path / "cache.json").read_text())["format"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_binary_is_reprobed(self, fake_tools, tmp_path):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+        await inventory.versions(["ruby"])
+
+        ruby = tmp_path / "bin" / "ruby"
+        ruby.write_text(ruby.read_text().replace("3.3.5", "3.4.1"))
+        versions = await inventory.versions(["ruby"])
+
+        assert versions["ruby"].version == "3.4.1"
+        assert _calls(fake_tools) == ["ruby", "ruby"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_forces_probe(self, fake_tools, tmp_path):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+        await inventory.versions(["ruby"])
+        await inventory.versions(["ruby"], refresh=True)
+
+        assert _calls(fake_tools) == ["ruby", "ruby"]
+
+    @pytest.mark.asyncio
+    async def test_selector_env_change_is_reprobed(self, fake_tools, tmp_path, monkeypatch):
+        inventory = ToolchainInventory(tmp_path / "cache.json")
+        await inventory.versions(["java"])
+
+        monkeypatch.setenv("JAVA_HOME", "/opt/jdk-21")
+        await inventory.versions(["java"])
+
+        assert _calls(fake_tools) == ["java", "java"]